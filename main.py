@@ -1,30 +1,82 @@
 import os
 import time
+_IMPORT_STARTED = time.perf_counter()
+import argparse
 import yaml
 import wave
 import struct
+import io
+import tempfile
+import math
 import shutil
-import requests
-import pvporcupine
-import pyaudio
+import subprocess
+import importlib
+import importlib.util
 import threading
 import re
 import random
+import signal
 import sys
+import queue
+import hashlib
+import itertools
+import codecs
+import array
+import atexit
+import json
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Optional
 from datetime import datetime, UTC
-from flask import Flask, request, jsonify
-import pyttsx3
-try:
-    import comtypes, comtypes.client  # type: ignore
-except ImportError:
-    comtypes = None  # type: ignore
 import logging
-from logging.handlers import RotatingFileHandler
-try:
-    import pythoncom  # For COM initialization in each TTS thread on Windows
-except ImportError:
-    pythoncom = None
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+
+
+class _LazyModule:
+    """Stand-in for a module that is imported on first attribute access, so slow or
+    optional subsystems cost nothing at startup and can be loaded on whichever thread
+    first needs them (main() warms several in parallel). ``submodules`` are imported
+    together with it (e.g. comtypes.client)."""
+
+    def __init__(self, name, *submodules):
+        self._name = name
+        self._submodules = submodules
+        self._module = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    module = importlib.import_module(self._name)
+                    for sub in self._submodules:
+                        importlib.import_module(sub)
+                    self._module = module
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+
+def _optional_module(name, *submodules):
+    """_LazyModule for an optional dependency, or None when it is not installed."""
+    try:
+        found = importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        found = False
+    return _LazyModule(name, *submodules) if found else None
+
+
+# Heavy dependencies load lazily (see main(): mic, TTS and listener warm them in parallel)
+requests = _LazyModule('requests')
+pvporcupine = _LazyModule('pvporcupine')
+pyaudio = _LazyModule('pyaudio')
+pyttsx3 = _LazyModule('pyttsx3')
+comtypes = _optional_module('comtypes', 'comtypes.client')
+pythoncom = _optional_module('pythoncom')  # For COM initialization in each TTS thread on Windows
+keyboard = _optional_module('keyboard')  # For global hotkeys
 try:
     import msvcrt  # Windows console key capture
 except ImportError:
@@ -33,40 +85,62 @@ try:
     import winsound  # Windows-specific (user is on Windows)
 except ImportError:  # fallback noop
     winsound = None
-try:
-    import keyboard  # For global hotkeys
-except ImportError:
-    keyboard = None
 
-# Rich UI components
-try:
-    from rich.console import Console
-    from rich.layout import Layout
-    from rich.panel import Panel
-    from rich.live import Live
-    from rich import box
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
+# Rich UI components, imported by _load_rich() when the UI starts (never in headless mode)
+RICH_AVAILABLE = _optional_module('rich') is not None
+Console = Layout = Panel = Live = Segment = box = None
+console = None
+
+
+def _load_rich():
+    global Console, Layout, Panel, Live, Segment, box, console
+    if Live is None:
+        from rich.console import Console
+        from rich.layout import Layout
+        from rich.panel import Panel
+        from rich.live import Live
+        from rich.segment import Segment
+        from rich import box
+    if console is None:
+        console = Console()
 
-console = Console() if 'Console' in globals() else None
 log_lock = threading.Lock()
-log_buffer = []  # store log lines
 LOG_LIMIT = 800
+log_buffer = deque(maxlen=LOG_LIMIT)  # store log lines (oldest drop off)
+log_version = 0  # bumped on every appended line; the UI redraws logs only when it changes
 ui_stop_event = threading.Event()
-# File logger (optional) initialized later in main()
+# File logger (optional) initialized later in main(). log() only enqueues; a
+# QueueListener thread (log_writer) does the file I/O and rotation.
 file_logger = None
+log_writer = None
 # Removed log scrolling state (always tail newest logs)
 ui_started = False  # Becomes True once Rich UI loop begins; before that, echo logs to stdout
+log_to_stdout = True  # service.log_stdout: false keeps headless logs in the file only
 
 # Command input (non-blocking) state
 command_mode = None  # None | 'send_text' | 'speak_only'
 command_buffer = []
 command_lock = threading.Lock()
+command_version = 0  # bumped (under command_lock) whenever mode or buffer changes
 
 # Status tracking
+class _VersionedStatus(dict):
+    """Status dict whose ``version`` changes on every write, so the UI can skip
+    redrawing the status panel when nothing changed. ``quiet_set`` writes without
+    bumping it (the UI's own frame statistics)."""
+
+    version = 0
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+        self.version += 1
+
+    def quiet_set(self, key, value):
+        dict.__setitem__(self, key, value)
+
+
 status_lock = threading.Lock()
-status = {
+status = _VersionedStatus({
     'recording': False,
     'recording_reason': '',
     'last_wake': None,
@@ -84,10 +158,61 @@ status = {
     'msgs_received': 0,
     'msgs_spoken': 0,
     'msgs_ignored': 0,
+    'msgs_duplicate': 0,
+    'msgs_rate_limited': 0,
+    'streams_received': 0,
+    'sse_subscribers': 0,
+    'sse_dropped': 0,
     'listener_health': 'starting',  # starting | ok | fail
     'endpoint_path': None,
     'host_ip': None,
-}
+    'listener_server': None,   # flask | waitress
+    # Inbound queue (backpressure for /response)
+    'inbound_queue_depth': 0,
+    'inbound_queue_max': 0,
+    'inbound_rejected': 0,
+    # TTS worker
+    'tts_queue_depth': 0,
+    'tts_queue_max': 0,
+    'tts_last_wait_ms': None,
+    'tts_last_speak_ms': None,
+    'tts_engine_inits': 0,
+    'tts_errors': 0,
+    'tts_dropped': 0,
+    'tts_interrupts': 0,
+    'tts_last_interrupt_ms': None,
+    'tts_flushed': 0,
+    'tts_cache_hits': 0,
+    'tts_cache_misses': 0,
+    'tts_cache_mem_bytes': 0,
+    'tts_cache_disk_bytes': 0,
+    'tts_backend': None,
+    'tts_last_first_audio_ms': None,
+    'tts_last_max_gap_ms': None,
+    'tts_speaking': False,
+    'tts_last_to_audio_ms': None,
+    'output_stream_opens': 0,
+    'cues_played': 0,
+    'cues_dropped': 0,
+    'output_latency_ms': None,
+    'echo_suppressed_frames': 0,
+    'echo_false_wakes': 0,
+    'echo_loud_wakes': 0,
+    # TUI frame statistics (written with quiet_set so they never trigger a redraw)
+    'ui_frames': 0,
+    'ui_skipped': 0,
+    'ui_build_ms': None,
+    'ui_cpu_pct': None,
+    'log_dropped': 0,
+    'startup_listen_ms': None,
+    'startup_ready_ms': None,
+    'traces_finished': 0,
+    'trace_summary': None,   # "rec 3.1/8.0 upload 3.4/8.5 ..." p50/p95 seconds from wake
+    'config_version': 1,     # bumped by every applied config reload
+    'config_reload': None,   # "HH:MM:SS ok|rejected (source)" of the last reload
+    'frame_overruns': 0,     # audio frames over budget (listen loop + recorder)
+    'frame_summary': None,   # "listen 0.4/1.2/3 | rec ..." p50/p99/max ms per audio frame
+})
 
 # Runtime flags for device management
 mic_reset_request = False
@@ -96,6 +221,9 @@ cycle_input_device_request = False
 cycle_output_device_request = False
 selected_input_device_index = None
 selected_output_device_index = None
+listen_stop_event = threading.Event()  # ends listen_loop after the current frame (replay harness, embedding)
+_pending_porcupine = None  # (engine, keyword name) built by a config reload for listen_loop to swap in
+_pending_porcupine_lock = threading.Lock()
 
 # Scroll state for bouncing marquee
 scroll_state = {
@@ -103,6 +231,585 @@ scroll_state = {
     'output': {'pos': 0, 'dir': 1},
 }
 
+# ---------------- Metrics (Prometheus text exposition) ------------- #
+_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+_FRAME_BUCKETS = (0.001, 0.002, 0.004, 0.008, 0.016, 0.032, 0.04, 0.064, 0.1, 0.25, 0.5, 1.0)
+_METRIC_DEFS = {
+    # name: (type, help, buckets)
+    'butlerbox_wake_to_upload_seconds': ('histogram', 'Wake detection to successful audio upload.', (1, 2, 5, 10, 20, 30, 60, 120, 300)),
+    'butlerbox_upload_duration_seconds': ('histogram', 'Duration of a single webhook POST attempt.', _LATENCY_BUCKETS),
+    'butlerbox_webhook_attempts': ('histogram', 'Attempts used per webhook delivery (success or exhausted).', (1, 2, 3, 4, 5, 8, 10)),
+    'butlerbox_tts_queue_wait_seconds': ('histogram', 'Time an utterance waited in the TTS queue before speaking.', _LATENCY_BUCKETS),
+    'butlerbox_tts_speak_seconds': ('histogram', 'Time spent speaking one utterance.', _LATENCY_BUCKETS),
+    'butlerbox_tts_backend_seconds': ('histogram', 'TTS backend call latency by backend and op (synthesize / speak).', _LATENCY_BUCKETS),
+    'butlerbox_tts_first_audio_seconds': ('histogram', 'Pipelined replies: pickup to first sentence playing.', _LATENCY_BUCKETS),
+    'butlerbox_tts_sentence_gap_seconds': ('histogram', 'Pipelined replies: silence between consecutive sentences.', _LATENCY_BUCKETS),
+    'butlerbox_tts_time_to_audio_seconds': ('histogram', 'Utterance enqueued to audible on the output device.', _LATENCY_BUCKETS),
+    'butlerbox_audio_output_latency_seconds': ('histogram', 'play() call to sound at the speaker (first write + device latency), by output.', _LATENCY_BUCKETS),
+    'butlerbox_audio_output_open_seconds': ('histogram', 'Time to open an output stream, by output.', _LATENCY_BUCKETS),
+    'butlerbox_tts_interrupt_seconds': ('histogram', 'Interrupt request to speech actually stopping.', (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)),
+    'butlerbox_ui_frame_seconds': ('histogram', 'Console UI frames actually redrawn: panel rendering plus terminal write.', (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25)),
+    'butlerbox_webhook_requests_total': ('counter', 'Webhook POST attempts by result.', None),
+    'butlerbox_config_reloads_total': ('counter', 'Config reloads by result (ok / rejected).', None),
+    'butlerbox_audio_frame_seconds': ('histogram', 'Audio loop iteration time per frame, by loop (listen / record).', _FRAME_BUCKETS),
+    'butlerbox_audio_frame_section_seconds': ('histogram', 'Audio loop time per frame by loop and section (read, process, analysis, ...).', _FRAME_BUCKETS),
+    'butlerbox_audio_frame_overruns_total': ('counter', 'Audio frames over budget, by loop and slowest section.', None),
+}
+# Counters mirrored from the status dict at scrape time: status key -> (metric name, type, help)
+_STATUS_METRICS = {
+    'msgs_received': ('butlerbox_msgs_received_total', 'counter', 'Inbound texts received.'),
+    'msgs_spoken': ('butlerbox_msgs_spoken_total', 'counter', 'Inbound texts spoken.'),
+    'msgs_ignored': ('butlerbox_msgs_ignored_total', 'counter', 'Inbound texts ignored (blank after cleanup).'),
+    'msgs_duplicate': ('butlerbox_msgs_duplicate_total', 'counter', 'Inbound texts dropped as duplicates.'),
+    'msgs_rate_limited': ('butlerbox_msgs_rate_limited_total', 'counter', 'Inbound requests rejected by the rate limiter.'),
+    'inbound_rejected': ('butlerbox_inbound_rejected_total', 'counter', 'Inbound texts rejected because the queue was full.'),
+    'inbound_queue_depth': ('butlerbox_inbound_queue_depth', 'gauge', 'Inbound texts waiting to be spoken.'),
+    'streams_received': ('butlerbox_streams_received_total', 'counter', 'Streaming inbound requests received.'),
+    'manual_start_count': ('butlerbox_manual_starts_total', 'counter', 'Recordings started by shortcut.'),
+    'device_errors': ('butlerbox_device_errors_total', 'counter', 'Audio device errors.'),
+    'device_recoveries': ('butlerbox_device_recoveries_total', 'counter', 'Audio device recoveries.'),
+    'sse_subscribers': ('butlerbox_sse_subscribers', 'gauge', 'Connected event stream subscribers.'),
+    'sse_dropped': ('butlerbox_sse_dropped_total', 'counter', 'Event stream subscribers dropped for falling behind.'),
+    'tts_queue_depth': ('butlerbox_tts_queue_depth', 'gauge', 'Utterances waiting for the TTS worker.'),
+    'tts_engine_inits': ('butlerbox_tts_engine_inits_total', 'counter', 'TTS backend instances opened (warm-up, errors, resets).'),
+    'tts_errors': ('butlerbox_tts_errors_total', 'counter', 'Utterances that failed in the TTS engine.'),
+    'tts_dropped': ('butlerbox_tts_dropped_total', 'counter', 'Utterances dropped because the TTS queue was full.'),
+    'tts_interrupts': ('butlerbox_tts_interrupts_total', 'counter', 'Utterances cut short by barge-in, preemption or /interrupt.'),
+    'tts_flushed': ('butlerbox_tts_flushed_total', 'counter', 'Queued utterances discarded by an interrupt with flush.'),
+    'tts_cache_hits': ('butlerbox_tts_cache_hits_total', 'counter', 'Utterances played from the speech cache.'),
+    'tts_cache_misses': ('butlerbox_tts_cache_misses_total', 'counter', 'Cacheable utterances that had to be synthesized.'),
+    'tts_cache_mem_bytes': ('butlerbox_tts_cache_memory_bytes', 'gauge', 'Bytes held in the in-memory speech cache.'),
+    'tts_cache_disk_bytes': ('butlerbox_tts_cache_disk_bytes', 'gauge', 'Bytes held in the on-disk speech cache.'),
+    'output_stream_opens': ('butlerbox_output_stream_opens_total', 'counter', 'Output streams opened (first use, device or format change).'),
+    'cues_played': ('butlerbox_cues_played_total', 'counter', 'Sound cues played.'),
+    'cues_dropped': ('butlerbox_cues_dropped_total', 'counter', 'Sound cues dropped because the cue queue was full.'),
+    'echo_suppressed_frames': ('butlerbox_echo_suppressed_frames_total', 'counter', 'Mic frames not passed to wake detection while speaking.'),
+    'echo_false_wakes': ('butlerbox_echo_false_wakes_total', 'counter', 'Wake detections rejected as self-echo.'),
+    'echo_loud_wakes': ('butlerbox_echo_loud_wakes_total', 'counter', 'Wakes accepted while speaking because they beat the echo level.'),
+    'ui_frames': ('butlerbox_ui_frames_total', 'counter', 'Console UI frames redrawn.'),
+    'ui_skipped': ('butlerbox_ui_frames_skipped_total', 'counter', 'Console UI ticks skipped because nothing changed.'),
+    'log_dropped': ('butlerbox_log_dropped_total', 'counter', 'Log records dropped because the log writer queue was full.'),
+}
+metrics_lock = threading.Lock()
+_metric_values = {}  # (name, labels tuple) -> float (counter) or [bucket counts, sum, count] (histogram)
+
+
+def _metric_labels(labels):
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def metric_inc(name, value=1.0, **labels):
+    key = (name, _metric_labels(labels))
+    with metrics_lock:
+        _metric_values[key] = _metric_values.get(key, 0.0) + value
+
+
+def metric_observe(name, value, **labels):
+    buckets = _METRIC_DEFS[name][2]
+    key = (name, _metric_labels(labels))
+    with metrics_lock:
+        hist = _metric_values.get(key)
+        if hist is None:
+            hist = [[0] * len(buckets), 0.0, 0]
+            _metric_values[key] = hist
+        for i, bound in enumerate(buckets):
+            if value <= bound:
+                hist[0][i] += 1
+                break
+        hist[1] += value
+        hist[2] += 1
+
+
+def _fmt_labels(pairs):
+    if not pairs:
+        return ''
+    esc = [(k, v.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')) for k, v in pairs]
+    return '{' + ','.join(f'{k}="{v}"' for k, v in esc) + '}'
+
+
+def render_metrics():
+    """Render all metrics in the Prometheus text exposition format (version 0.0.4)."""
+    lines = []
+    with status_lock:
+        snapshot = {k: status.get(k, 0) or 0 for k in _STATUS_METRICS}
+    for key, (name, mtype, help_text) in _STATUS_METRICS.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {mtype}")
+        lines.append(f"{name} {snapshot[key]}")
+    with pending_failed_uploads_lock:
+        pending = len(pending_failed_uploads)
+    lines.append("# HELP butlerbox_failed_uploads_pending Recordings waiting for a manual retry.")
+    lines.append("# TYPE butlerbox_failed_uploads_pending gauge")
+    lines.append(f"butlerbox_failed_uploads_pending {pending}")
+    with metrics_lock:
+        items = sorted(_metric_values.items(), key=lambda kv: kv[0])
+        items = [(k, (list(v[0]), v[1], v[2]) if isinstance(v, list) else v) for k, v in items]
+    for name, (mtype, help_text, buckets) in _METRIC_DEFS.items():
+        series = [(labels, val) for (n, labels), val in items if n == name]
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {mtype}")
+        for labels, val in series:
+            if mtype != 'histogram':
+                lines.append(f"{name}{_fmt_labels(labels)} {val:g}")
+                continue
+            counts, total, count = val
+            cumulative = 0
+            for bound, c in zip(buckets, counts):
+                cumulative += c
+                lines.append(f"{name}_bucket{_fmt_labels(labels + (('le', f'{bound:g}'),))} {cumulative}")
+            lines.append(f"{name}_bucket{_fmt_labels(labels + (('le', '+Inf'),))} {count}")
+            lines.append(f"{name}_sum{_fmt_labels(labels)} {total:g}")
+            lines.append(f"{name}_count{_fmt_labels(labels)} {count}")
+    return '\n'.join(lines) + '\n'
+
+# ---------------- Event bus (pushed to SSE subscribers) ------------- #
+class _Subscriber:
+    __slots__ = ('queue', 'dropped')
+
+    def __init__(self, size):
+        self.queue = queue.Queue(maxsize=size)
+        self.dropped = False
+
+
+class _EventBus:
+    """Fan out structured events to bounded per-subscriber queues.
+
+    ``publish`` never blocks: a subscriber whose buffer is full is marked dropped and
+    removed, so a slow dashboard cannot stall the audio thread.
+    """
+
+    def __init__(self):
+        self.buffer_size = 64
+        self.max_subscribers = 16
+        self._subs = []
+        self._lock = threading.Lock()
+        self._seq = 0
+
+    def configure(self, buffer_size, max_subscribers):
+        self.buffer_size = max(1, int(buffer_size))
+        self.max_subscribers = max(1, int(max_subscribers))
+
+    def subscribe(self):
+        with self._lock:
+            if len(self._subs) >= self.max_subscribers:
+                return None
+            sub = _Subscriber(self.buffer_size)
+            self._subs.append(sub)
+            count = len(self._subs)
+        with status_lock:
+            status['sse_subscribers'] = count
+        return sub
+
+    def unsubscribe(self, sub):
+        with self._lock:
+            if sub in self._subs:
+                self._subs.remove(sub)
+            count = len(self._subs)
+        with status_lock:
+            status['sse_subscribers'] = count
+
+    def publish(self, event_type, /, **fields):
+        if not self._subs:
+            return
+        with self._lock:
+            self._seq += 1
+            event = {'seq': self._seq, 'type': event_type, 'ts': time.time(), **fields}
+            dropped = []
+            for sub in self._subs:
+                try:
+                    sub.queue.put_nowait(event)
+                except queue.Full:
+                    sub.dropped = True
+                    dropped.append(sub)
+            for sub in dropped:
+                self._subs.remove(sub)
+            count = len(self._subs)
+        if dropped:
+            with status_lock:
+                status['sse_dropped'] += len(dropped)
+                status['sse_subscribers'] = count
+
+
+event_bus = _EventBus()
+
+
+def publish_event(event_type, /, **fields):
+    """Publish a ButlerBox event (wake, recording, upload, tts, device) to SSE subscribers."""
+    event_bus.publish(event_type, **fields)
+
+
+# ---------------- Interaction tracing ------------- #
+TRACE_HEADER = 'X-ButlerBox-Trace-Id'
+# Stages summarized as p50/p95 (seconds from wake) in the status panel: stage -> label
+_TRACE_PANEL_STAGES = (('recording_stop', 'rec'), ('upload_done', 'upload'), ('reply_received', 'reply'),
+                       ('tts_start', 'speak'), ('tts_end', 'done'))
+
+
+class _Trace:
+    __slots__ = ('id', 'source', 'started', 'started_wall', 'stages', 'pending', 'awaiting_reply', 'replied')
+
+    def __init__(self, source):
+        self.id = uuid.uuid4().hex[:16]
+        self.source = source
+        self.started = time.monotonic()
+        self.started_wall = time.time()
+        self.stages = [('wake', 0.0, {})]  # (stage, seconds since wake, fields)
+        self.pending = 0                   # reply utterances (and open streams) not yet spoken
+        self.awaiting_reply = False        # uploaded; the next untagged /response belongs here
+        self.replied = False
+
+
+class _Tracer:
+    """One trace per interaction, from wake to the end of the spoken reply.
+
+    Stages are stamped with monotonic offsets from the wake. The upload sends the trace
+    id to webhooks as ``X-ButlerBox-Trace-Id``; a ``/response`` carrying it back (header
+    or ``trace_id`` field), or any untagged reply while a trace awaits one, joins that
+    trace. A trace is finished when its reply has been spoken, when the recording is
+    aborted or the upload fails, or after ``reply_window_seconds`` without a reply.
+    Finished traces feed per-stage p50/p95 and are queued for a writer thread, which
+    appends them to a JSON-lines file and expires stale traces, so the listen loop never
+    waits on the disk.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._open = OrderedDict()  # id -> _Trace, oldest first
+        self._samples = {}          # stage -> deque of seconds since wake
+        self._write_queue = None
+        self.configure({})
+
+    def configure(self, trace_cfg):
+        trace_cfg = trace_cfg or {}
+        self.enabled = bool(trace_cfg.get('enabled', True))
+        self.path = trace_cfg.get('jsonl_path', 'logs/traces.jsonl') or None
+        self.reply_window = float(trace_cfg.get('reply_window_seconds', 120))
+        self.correlate_untagged = bool(trace_cfg.get('correlate_untagged', True))
+        self.max_open = max(1, int(trace_cfg.get('max_open', 32)))
+        self.sample_size = max(1, int(trace_cfg.get('sample_size', 200)))
+
+    def start(self, source):
+        """New trace for a wake / manual start; returns its id (None when tracing is off)."""
+        if not self.enabled:
+            return None
+        trace = _Trace(source)
+        with self._lock:
+            if self._write_queue is None:  # first trace: start the writer (it also expires traces)
+                self._write_queue = queue.Queue(maxsize=256)
+                threading.Thread(target=self._writer, name='trace-writer', daemon=True).start()
+            self._open[trace.id] = trace
+            evicted = self._open.popitem(last=False)[1] if len(self._open) > self.max_open else None
+        if evicted is not None:
+            self._finish(evicted, 'evicted')
+        return trace.id
+
+    def mark(self, trace_id, stage, **fields):
+        if trace_id is None:
+            return
+        with self._lock:
+            trace = self._open.get(trace_id)
+            if trace is not None:
+                trace.stages.append((stage, time.monotonic() - trace.started, fields))
+                if stage == 'upload_done':
+                    trace.awaiting_reply = True
+
+    def reply(self, trace_id=None, **fields):
+        """Attach an inbound reply to ``trace_id`` (or the newest trace awaiting one) and
+        hold the trace open until that reply is spoken. Returns the trace id or None."""
+        self.expire()
+        with self._lock:
+            trace = self._open.get(trace_id) if trace_id else None
+            if trace is None and not trace_id and self.correlate_untagged:
+                trace = next((t for t in reversed(self._open.values()) if t.awaiting_reply), None)
+            if trace is None:
+                return None
+            if not trace.replied:
+                trace.stages.append(('reply_received', time.monotonic() - trace.started, fields))
+                trace.replied = True
+            trace.awaiting_reply = False
+            trace.pending += 1
+            return trace.id
+
+    def hold(self, trace_id):
+        """One more utterance (e.g. a streamed sentence) before the trace can finish."""
+        if trace_id is None:
+            return
+        with self._lock:
+            trace = self._open.get(trace_id)
+            if trace is not None:
+                trace.pending += 1
+
+    def release(self, trace_id):
+        """An utterance (or stream) of the reply is done; finishes the trace at the last one."""
+        if trace_id is None:
+            return
+        with self._lock:
+            trace = self._open.get(trace_id)
+            if trace is None:
+                return
+            trace.pending -= 1
+            if trace.pending > 0:
+                return
+            del self._open[trace_id]
+        self._finish(trace, 'spoken')
+
+    def finish(self, trace_id, outcome):
+        if trace_id is None:
+            return
+        with self._lock:
+            trace = self._open.pop(trace_id, None)
+        if trace is not None:
+            self._finish(trace, outcome)
+
+    def expire(self):
+        """Finish traces whose reply window has passed."""
+        now = time.monotonic()
+        with self._lock:
+            stale = [t for t in self._open.values() if t.pending <= 0 and now - t.started > self.reply_window]
+            for t in stale:
+                del self._open[t.id]
+        for t in stale:
+            self._finish(t, 'no_reply' if t.awaiting_reply else 'timeout')
+
+    def _finish(self, trace, outcome):
+        total = time.monotonic() - trace.started
+        firsts = {}
+        for stage, offset, _fields in trace.stages:
+            if stage == 'tts_end':
+                firsts[stage] = offset  # last sentence of the reply
+            else:
+                firsts.setdefault(stage, offset)
+        with self._lock:
+            for stage, offset in firsts.items():
+                self._samples.setdefault(stage, deque(maxlen=self.sample_size)).append(offset)
+            summary = self._summary_locked()
+        with status_lock:
+            status['traces_finished'] += 1
+            status['trace_summary'] = summary
+        record = {
+            'trace_id': trace.id,
+            'source': trace.source,
+            'start': round(trace.started_wall, 3),
+            'outcome': outcome,
+            'total_ms': round(total * 1000, 1),
+            'stages': [{'stage': stage, 'ms': round(offset * 1000, 1), **fields} for stage, offset, fields in trace.stages],
+        }
+        publish_event('trace', trace_id=trace.id, outcome=outcome, total_ms=record['total_ms'])
+        if self.path and self._write_queue is not None:
+            try:
+                self._write_queue.put_nowait(record)
+            except queue.Full:
+                pass
+
+    def _writer(self):
+        expired_at = time.monotonic()
+        while True:
+            try:
+                record = self._write_queue.get(timeout=1.0)
+            except queue.Empty:
+                record = None
+            if time.monotonic() - expired_at >= 1.0:
+                expired_at = time.monotonic()
+                self.expire()
+            path = self.path
+            if record is None or not path:
+                continue
+            try:
+                os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+                with open(path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(record, default=str) + '\n')
+            except OSError as e:
+                log(f"⚠️ Could not write trace: {e}")
+
+    def _summary_locked(self):
+        parts = []
+        for stage, label in _TRACE_PANEL_STAGES:
+            samples = self._samples.get(stage)
+            if samples:
+                ordered = sorted(samples)
+                p50 = ordered[(len(ordered) - 1) // 2]
+                p95 = ordered[int(round(0.95 * (len(ordered) - 1)))]
+                parts.append(f"{label} {p50:.1f}/{p95:.1f}")
+        return ' '.join(parts) or None
+
+
+tracer = _Tracer()
+
+
+# ---------------- Audio frame budget (listen loop and recorder) ------------- #
+_FRAME_LOOP_LABELS = (('listen', 'listen'), ('record', 'rec'))
+
+
+class _FrameClock:
+    """Times one audio loop, one frame per ``tick()``. ``lap(section)`` closes a named
+    section; time no lap covers is booked to ``other``. ``pause()`` ends the current
+    frame without starting another (e.g. while the recorder runs its own loop)."""
+    __slots__ = ('monitor', 'loop', 'budget', 'started', 'last', 'sections')
+
+    def __init__(self, monitor, loop, budget):
+        self.monitor = monitor
+        self.loop = loop
+        self.budget = budget  # seconds of audio per frame
+        self.started = None
+        self.last = None
+        self.sections = []
+
+    def tick(self):
+        now = time.perf_counter()
+        if self.started is not None:
+            self._close(now)
+        if self.monitor.enabled:
+            self.started = self.last = now
+        else:
+            self.started = None
+
+    def lap(self, section):
+        if self.started is None:
+            return
+        now = time.perf_counter()
+        self.sections.append((section, now - self.last))
+        self.last = now
+
+    def pause(self):
+        if self.started is not None:
+            self._close(time.perf_counter())
+            self.started = None
+
+    def _close(self, now):
+        sections, self.sections = self.sections, []
+        if now > self.last:
+            sections.append(('other', now - self.last))
+        self.monitor.record(self.loop, now - self.started, sections, self.budget)
+
+
+class _FrameMonitor:
+    """Per-frame timing of the audio loops against their budget (512 samples at 16 kHz =
+    32 ms). A frame longer than ``overrun_ms`` (default 1.25x the frame) is an overrun,
+    blamed on its slowest section; overruns can go to a JSON-lines slow-frame log.
+    p50/p99/max over the last ``sample_size`` frames feed the status panel."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loops = {}  # loop -> {'samples': deque, 'frames', 'overruns', 'blame': {section: overruns}}
+        self._slow_queue = None
+        self._published_at = 0.0
+        self._warned_at = None
+        self.configure({})
+
+    def configure(self, frame_cfg):
+        frame_cfg = frame_cfg or {}
+        self.enabled = bool(frame_cfg.get('enabled', True))
+        overrun_ms = frame_cfg.get('overrun_ms')
+        self.overrun = float(overrun_ms) / 1000.0 if overrun_ms is not None else None
+        self.sample_size = max(10, int(frame_cfg.get('sample_size', 1000)))
+        self.warn_interval = float(frame_cfg.get('warn_interval_seconds', 60))
+        self.path = frame_cfg.get('slow_frame_log') or None
+        with self._lock:
+            for st in self._loops.values():
+                st['samples'] = deque(st['samples'], maxlen=self.sample_size)
+            if self.path and self._slow_queue is None:
+                self._slow_queue = queue.Queue(maxsize=256)
+                threading.Thread(target=self._slow_writer, name='slow-frames', daemon=True).start()
+
+    def clock(self, loop, budget):
+        return _FrameClock(self, loop, budget)
+
+    def record(self, loop, seconds, sections, budget):
+        limit = self.overrun if self.overrun is not None else budget * 1.25
+        worst = max(sections, key=lambda s: s[1]) if seconds > limit and sections else None
+        now = time.monotonic()
+        with self._lock:
+            st = self._loops.get(loop)
+            if st is None:
+                st = self._loops[loop] = {'samples': deque(maxlen=self.sample_size), 'frames': 0,
+                                          'overruns': 0, 'blame': {}}
+            st['samples'].append(seconds)
+            st['frames'] += 1
+            if worst is not None:
+                st['overruns'] += 1
+                st['blame'][worst[0]] = st['blame'].get(worst[0], 0) + 1
+            publish = now - self._published_at >= 1.0
+            if publish:
+                self._published_at = now
+        metric_observe('butlerbox_audio_frame_seconds', seconds, loop=loop)
+        for section, spent in sections:
+            metric_observe('butlerbox_audio_frame_section_seconds', spent, loop=loop, section=section)
+        if worst is not None:
+            self._overrun(loop, seconds, sections, worst, budget, now)
+        if publish:
+            self._publish()
+
+    def _overrun(self, loop, seconds, sections, worst, budget, now):
+        metric_inc('butlerbox_audio_frame_overruns_total', loop=loop, section=worst[0])
+        if self.path and self._slow_queue is not None:
+            spent = {}
+            for section, s in sections:
+                spent[section] = round(spent.get(section, 0.0) + s * 1000, 2)
+            try:
+                self._slow_queue.put_nowait({'ts': round(time.time(), 3), 'loop': loop,
+                                             'ms': round(seconds * 1000, 2), 'budget_ms': round(budget * 1000, 2),
+                                             'worst': worst[0], 'sections': spent})
+            except queue.Full:
+                pass
+        if self._warned_at is None or now - self._warned_at >= self.warn_interval:
+            self._warned_at = now
+            log(f"⏱ Audio frame overrun ({loop}): {seconds * 1000:.0f}ms for a {budget * 1000:.0f}ms frame, "
+                f"mostly {worst[0]} ({worst[1] * 1000:.0f}ms)", "WARNING", event='frame_overrun', loop=loop,
+                ms=round(seconds * 1000, 1), section=worst[0])
+
+    def _slow_writer(self):
+        while True:
+            record = self._slow_queue.get()
+            path = self.path
+            if not path:
+                continue
+            try:
+                os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+                with open(path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(record) + '\n')
+            except OSError as e:
+                log(f"⚠️ Could not write slow frame log: {e}")
+
+    def snapshot(self):
+        """loop -> frames, overruns, p50/p99/max ms (recent frames) and overruns by section."""
+        out = {}
+        with self._lock:
+            for loop, st in self._loops.items():
+                ordered = sorted(st['samples'])
+                if not ordered:
+                    continue
+                out[loop] = {
+                    'frames': st['frames'],
+                    'overruns': st['overruns'],
+                    'p50_ms': round(ordered[(len(ordered) - 1) // 2] * 1000, 2),
+                    'p99_ms': round(ordered[int(round(0.99 * (len(ordered) - 1)))] * 1000, 2),
+                    'max_ms': round(ordered[-1] * 1000, 2),
+                    'blame': dict(sorted(st['blame'].items(), key=lambda kv: -kv[1])),
+                }
+        return out
+
+    def _publish(self):
+        snap = self.snapshot()
+        parts = []
+        for loop, label in _FRAME_LOOP_LABELS:
+            st = snap.get(loop)
+            if st is None:
+                continue
+            part = f"{label} {st['p50_ms']:.1f}/{st['p99_ms']:.1f}/{st['max_ms']:.1f}"
+            if st['overruns']:
+                part += f" over {st['overruns']} (" + ' '.join(f"{k} {v}" for k, v in list(st['blame'].items())[:2]) + ')'
+            parts.append(part)
+        summary = ' | '.join(parts) or None
+        overruns = sum(st['overruns'] for st in snap.values())
+        with status_lock:
+            if status.get('frame_summary') != summary:
+                status['frame_summary'] = summary
+            if status.get('frame_overruns') != overruns:
+                status['frame_overruns'] = overruns
+
+
+frame_monitor = _FrameMonitor()
+
 import builtins as _b
 _orig_print = _b.print
 def _safe_print(*args, **kwargs):
@@ -110,68 +817,133 @@ def _safe_print(*args, **kwargs):
     log(msg)
     if not RICH_AVAILABLE:
         _orig_print(*args, **kwargs)
-_b.print = _safe_print  # Monkey-patch global print early
+# main() routes print() through log (_b.print = _safe_print) only when the Rich UI runs.
+
+_LOG_LEVELS = {'DEBUG': logging.DEBUG, 'INFO': logging.INFO, 'WARNING': logging.WARNING,
+               'ERROR': logging.ERROR, 'CRITICAL': logging.CRITICAL}
 
-def log(message: str, level: str = "INFO"):
+def log(message: str, level: str = "INFO", **fields):
     """Append a message to in-memory log and optionally to rotating file.
     Before UI starts (or if Rich missing) also print directly so early errors are visible.
+    ``fields`` (event=, endpoint=, latency=, file=, ...) go to the JSON-lines log as-is.
+    Never blocks on disk: file records are queued for the log writer thread.
     """
     ts = time.strftime('%H:%M:%S')
     line = f"[{ts}] {message}"
+    global log_version
     with log_lock:
         log_buffer.append(line)
-        if len(log_buffer) > LOG_LIMIT:
-            del log_buffer[0:len(log_buffer)-LOG_LIMIT]
+        log_version += 1
     # Always echo to stdout until UI takes over (or if Rich not available)
     global ui_started
-    if (not RICH_AVAILABLE) or (not ui_started):
+    if log_to_stdout and ((not RICH_AVAILABLE) or (not ui_started)):
         _orig_print(line)
     # Forward to file logger if configured
-    global file_logger
-    if file_logger:
-        lvl = level.upper()
-        if lvl == 'DEBUG':
-            file_logger.debug(message)
-        elif lvl == 'WARNING':
-            file_logger.warning(message)
-        elif lvl == 'ERROR':
-            file_logger.error(message)
-        elif lvl == 'CRITICAL':
-            file_logger.critical(message)
-        else:
-            file_logger.info(message)
+    logger = file_logger
+    if logger:
+        logger.log(_LOG_LEVELS.get(level.upper(), logging.INFO), message, extra={'fields': fields})
 
-def _init_file_logging(cfg):
-    global file_logger
-    lg_cfg = (cfg or {}).get('logging') or {}
-    if not lg_cfg.get('file_enabled', False):
-        return
-    path = lg_cfg.get('file_path', 'logs/app.log')
-    max_bytes = int(lg_cfg.get('max_bytes', 1_048_576))
-    backup_count = int(lg_cfg.get('backup_count', 5))
-    encoding = lg_cfg.get('encoding', 'utf-8')
-    level_name = str(lg_cfg.get('level', 'INFO')).upper()
-    level = getattr(logging, level_name, logging.INFO)
+
+class _DroppingQueueHandler(QueueHandler):
+    """QueueHandler over a bounded queue: when the writer falls behind, records are
+    dropped and counted (status['log_dropped']) instead of blocking the caller."""
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with status_lock:
+                status['log_dropped'] += 1
+
+
+class _LogWriter(QueueListener):
+    """QueueListener whose stop() waits for room in a full queue instead of raising."""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+class _JsonLinesFormatter(logging.Formatter):
+    """One JSON object per line: ts, level, message plus the structured fields given to log()."""
+
+    def format(self, record):
+        entry = {
+            'ts': self.formatTime(record, '%Y-%m-%dT%H:%M:%S'),
+            'level': record.levelname,
+            'message': record.getMessage(),
+        }
+        entry.update(getattr(record, 'fields', None) or {})
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def _rotating_handler(path, lg_cfg, formatter):
     # Ensure directory exists
     try:
         os.makedirs(os.path.dirname(path), exist_ok=True)
     except Exception:
         pass
+    handler = RotatingFileHandler(path, maxBytes=int(lg_cfg.get('max_bytes', 1_048_576)),
+                                  backupCount=int(lg_cfg.get('backup_count', 5)),
+                                  encoding=lg_cfg.get('encoding', 'utf-8'))
+    handler.setFormatter(formatter)
+    return handler
+
+
+def _init_file_logging(cfg):
+    """Start the log writer thread for the text log (file_enabled) and/or the JSON-lines
+    log (json_enabled). Safe to call again: the previous writer is drained and replaced."""
+    global file_logger
+    lg_cfg = (cfg or {}).get('logging') or {}
+    level_name = str(lg_cfg.get('level', 'INFO')).upper()
+    level = getattr(logging, level_name, logging.INFO)
     try:
-        handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count, encoding=encoding)
-        fmt = logging.Formatter('%(asctime)s %(levelname)s %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-        handler.setFormatter(fmt)
-        logger = logging.getLogger('persistent')
-        logger.setLevel(level)
-        # Avoid duplicate handlers on re-init
-        if not any(isinstance(h, RotatingFileHandler) and getattr(h, 'baseFilename', None) == handler.baseFilename for h in logger.handlers):
-            logger.addHandler(handler)
-        file_logger = logger
-        logger.info('File logging initialized.')
+        handlers = []
+        if lg_cfg.get('file_enabled', False):
+            fmt = logging.Formatter('%(asctime)s %(levelname)s %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+            handlers.append(_rotating_handler(lg_cfg.get('file_path', 'logs/app.log'), lg_cfg, fmt))
+        if lg_cfg.get('json_enabled', False):
+            handlers.append(_rotating_handler(lg_cfg.get('json_path', 'logs/app.jsonl'), lg_cfg, _JsonLinesFormatter()))
     except Exception as e:
         _orig_print(f"Failed to init file logging: {e}")
+        return
+    _stop_file_logging()
+    if not handlers:
+        return
+    global log_writer
+    records = queue.Queue(maxsize=max(1, int(lg_cfg.get('queue_size', 10000))))
+    logger = logging.getLogger('persistent')
+    logger.setLevel(level)
+    logger.propagate = False
+    logger.handlers = [_DroppingQueueHandler(records)]
+    log_writer = _LogWriter(records, *handlers)
+    log_writer.start()
+    file_logger = logger
+    logger.info('File logging initialized.')
 
-def _build_layout(cfg):
+
+def _stop_file_logging():
+    """Flush queued records to disk and stop the log writer (no-op if not running)."""
+    global file_logger, log_writer
+    writer, log_writer = log_writer, None
+    file_logger = None
+    if writer is None:
+        return
+    writer.stop()
+    for h in writer.handlers:
+        h.close()
+
+atexit.register(_stop_file_logging)  # records still queued at exit reach the disk
+
+def _terminal_size():
+    """(width, height) of the console, with 80x40 when it cannot be queried."""
+    try:
+        size = console.size if console else None
+    except Exception:
+        size = None
+    return (size.width, size.height) if size else (80, 40)
+
+def _new_layout():
+    _load_rich()
     layout = Layout(name='root')
     layout.split_column(
         Layout(name='logs', ratio=7),
@@ -186,11 +958,10 @@ def _build_layout(cfg):
         Layout(name='shell', ratio=2),
         Layout(name='shortcuts', ratio=2)
     )
+    return layout
+
+def _logs_panel(term_h):
     # Logs (auto-tail). Estimate how many lines can fit: use console height and allocate ~70% to logs ratio wise.
-    try:
-        term_h = console.size.height if console else 40
-    except Exception:
-        term_h = 40
     # Layout: root split into logs (ratio 7) + bottom (ratio 3) => logs ≈ 7/10 of screen minus panel borders (2) and maybe title line.
     est_visible = max(5, int(term_h * 0.7) - 3)
     max_lines = min(800, est_visible)  # never exceed LOG_LIMIT window
@@ -199,12 +970,13 @@ def _build_layout(cfg):
         if total == 0:
             logs_text = "(no logs yet)"
         else:
-            # Always tail the last max_lines lines
-            start = total - max_lines
-            if start < 0:
-                start = 0
-            logs_text = "\n".join(log_buffer[start:total])
-    layout['logs'].update(Panel(logs_text, title=f'Logs', border_style='cyan', box=box.ROUNDED))
+            # Always tail the last max_lines lines (walk from the newest end of the deque)
+            tail = list(itertools.islice(reversed(log_buffer), max_lines))
+            tail.reverse()
+            logs_text = "\n".join(tail)
+    return Panel(logs_text, title=f'Logs', border_style='cyan', box=box.ROUNDED)
+
+def _shell_panel():
     # Shell / current input
     with command_lock:
         mode = command_mode
@@ -215,30 +987,27 @@ def _build_layout(cfg):
         shell_line = f"> (tts-only) {buf}"
     else:
         shell_line = "> press q or v to start typing (Enter=commit Esc=cancel)"
-    layout['shell'].update(Panel(shell_line, title='Shell', border_style='magenta', box=box.ROUNDED))
-    # Shortcuts panel
-    sc_cfg = cfg.get('shortcuts', {}) or {}
+    return Panel(shell_line, title='Shell', border_style='magenta', box=box.ROUNDED)
+
+def _shortcuts_panel(cfg):
+    # Shortcuts panel (static: depends on config only)
+    sc = _as_runtime_config(cfg).shortcuts
     entries = []
     def _fmt_key(label: str) -> str:
         # Wrap a key or key-combo label (already without surrounding brackets) with colored angle brackets
         return f"[blue]<[/blue]{label}[blue]>[/blue]"
     # General commands (configurable letters)
-    send_key = sc_cfg.get('send_text', 'q') or 'q'
-    tts_key = sc_cfg.get('tts_only', 'v') or 'v'
-    retry_key = sc_cfg.get('retry_failed', 'r') or 'r'
-    exit_key = sc_cfg.get('exit', 'x') or 'x'
-    reset_key = sc_cfg.get('reset_io', 'm') or 'm'
-    entries.append(f"{_fmt_key(send_key)} send ✉️")
-    entries.append(f"{_fmt_key(tts_key)} tts 🔊")
-    entries.append(f"{_fmt_key(retry_key)} retry 🔁")
-    entries.append(f"{_fmt_key(exit_key)} exit ❌")
-    entries.append(f"{_fmt_key(reset_key)} reset I/O")
+    entries.append(f"{_fmt_key(sc.send_text)} send ✉️")
+    entries.append(f"{_fmt_key(sc.tts_only)} tts 🔊")
+    entries.append(f"{_fmt_key(sc.retry_failed)} retry 🔁")
+    entries.append(f"{_fmt_key(sc.exit)} exit ❌")
+    entries.append(f"{_fmt_key(sc.reset_io)} reset I/O")
     entries.append(f"{_fmt_key('i/Alt+I')} cycle 🎤")
     entries.append(f"{_fmt_key('o/Alt+O')} cycle 🔈")
     # Recording shortcuts
-    if sc_cfg.get('start_recording'): entries.append(f"{_fmt_key(sc_cfg.get('start_recording'))} start")
-    if sc_cfg.get('abort_recording'): entries.append(f"{_fmt_key(sc_cfg.get('abort_recording'))} abort")
-    if sc_cfg.get('finalize_recording'): entries.append(f"{_fmt_key(sc_cfg.get('finalize_recording'))} send")
+    if sc.start_recording: entries.append(f"{_fmt_key(sc.start_recording.label)} start")
+    if sc.abort_recording: entries.append(f"{_fmt_key(sc.abort_recording.label)} abort")
+    if sc.finalize_recording: entries.append(f"{_fmt_key(sc.finalize_recording.label)} send")
     # Compress into three lines for readability
     if entries:
         per_line = (len(entries) + 2) // 3
@@ -248,8 +1017,11 @@ def _build_layout(cfg):
         shortcuts_text = '\n'.join([l for l in [line1, line2, line3] if l])
     else:
         shortcuts_text = ''
-    layout['shortcuts'].update(Panel(shortcuts_text, title='Shortcuts', border_style='green', box=box.ROUNDED))
-    # Right (status panel)
+    return Panel(shortcuts_text, title='Shortcuts', border_style='green', box=box.ROUNDED)
+
+def _status_panel(total_w):
+    """Right-hand status panel; returns (panel, scrolling) where scrolling means a device
+    name is wider than the panel and the marquee needs another frame."""
     with status_lock:
         f_uploads = len(pending_failed_uploads)
         last_wake = status['last_wake'] or '-'
@@ -262,14 +1034,47 @@ def _build_layout(cfg):
         msgs_received = status.get('msgs_received', 0)
         msgs_spoken = status.get('msgs_spoken', 0)
         msgs_ignored = status.get('msgs_ignored', 0)
+        msgs_duplicate = status.get('msgs_duplicate', 0)
+        msgs_rate_limited = status.get('msgs_rate_limited', 0)
         listener_health = status.get('listener_health', '-')
         endpoint_path = status.get('endpoint_path', '-')
         host_ip = status.get('host_ip', '-')
+        listener_server = status.get('listener_server') or '-'
+        inbound_depth = status.get('inbound_queue_depth', 0)
+        inbound_max = status.get('inbound_queue_max', 0)
+        inbound_rejected = status.get('inbound_rejected', 0)
+        sse_subs = status.get('sse_subscribers', 0)
+        sse_dropped = status.get('sse_dropped', 0)
+        tts_depth = status.get('tts_queue_depth', 0)
+        tts_max = status.get('tts_queue_max', 0)
+        tts_wait = status.get('tts_last_wait_ms')
+        tts_speak = status.get('tts_last_speak_ms')
+        tts_interrupts = status.get('tts_interrupts', 0)
+        tts_int_ms = status.get('tts_last_interrupt_ms')
+        cache_hits = status.get('tts_cache_hits', 0)
+        cache_lookups = cache_hits + status.get('tts_cache_misses', 0)
+        cache_mem = status.get('tts_cache_mem_bytes', 0)
+        cache_disk = status.get('tts_cache_disk_bytes', 0)
+        tts_backend = status.get('tts_backend') or '-'
+        tts_speaking = status.get('tts_speaking')
+        echo_frames = status.get('echo_suppressed_frames', 0)
+        echo_false = status.get('echo_false_wakes', 0)
+        tts_first = status.get('tts_last_first_audio_ms')
+        tts_to_audio = status.get('tts_last_to_audio_ms')
+        out_latency = status.get('output_latency_ms')
+        tts_gap = status.get('tts_last_max_gap_ms')
+        ui_frames = status.get('ui_frames', 0)
+        ui_skipped = status.get('ui_skipped', 0)
+        ui_build = status.get('ui_build_ms')
+        ui_cpu = status.get('ui_cpu_pct')
+        log_dropped = status.get('log_dropped', 0)
+        config_reload = status.get('config_reload')
+        trace_summary = status.get('trace_summary')
+        traces_finished = status.get('traces_finished', 0)
+        frame_summary = status.get('frame_summary')
+        config_version = status.get('config_version', 1)
+    backend_stats = tts_backend_stats().get(tts_backend, {})
     # Estimate available width for device name text inside status panel.
-    try:
-        total_w = console.size.width if console else 80
-    except Exception:
-        total_w = 80
     right_panel_w = max(20, int(total_w * 2 / 5) - 4)
     input_label_prefix = len("Input dev: ")
     output_label_prefix = len("Output dev: ")
@@ -310,37 +1115,154 @@ def _build_layout(cfg):
         f"Output dev: {_bounce(output_full, output_name_w, 'output')}",# 4. Output dev
         f"Last audio WH: {_fmt(aw)}",    # 5. Last audio WH
         f"Last text WH: {_fmt(tw)}",     # 6. Last text WH
-        f"Msgs: rec={msgs_received} speak={msgs_spoken} ign={msgs_ignored}",  # message counters
-        f"Listener: {listener_health} ({endpoint_path})",  # listener endpoint + health
+        f"Msgs: rec={msgs_received} speak={msgs_spoken} ign={msgs_ignored} dup={msgs_duplicate} rl={msgs_rate_limited}",  # message counters
+        f"Listener: {listener_health} ({endpoint_path}, {listener_server})",  # listener endpoint + health
+        f"Inbound q: {inbound_depth}/{inbound_max} rej={inbound_rejected} | SSE: {sse_subs} (drop {sse_dropped})",
+        f"TTS q: {tts_depth}/{tts_max} wait={tts_wait if tts_wait is not None else '-'}ms speak={tts_speak if tts_speak is not None else '-'}ms",
+        f"Output: to audio {tts_to_audio if tts_to_audio is not None else '-'}ms (device {out_latency if out_latency is not None else '-'}ms)",
+        f"TTS pipeline: first audio {tts_first if tts_first is not None else '-'}ms, max gap {tts_gap if tts_gap is not None else '-'}ms",
+        f"Echo: {'speaking' if tts_speaking else 'idle'} false wakes={echo_false} skipped frames={echo_frames}",
+        f"TTS interrupts: {tts_interrupts} (last {tts_int_ms if tts_int_ms is not None else '-'}ms)",
+        f"TTS backend: {tts_backend} " + ' '.join(f"{op}={st['avg_ms']:.0f}ms" for op, st in backend_stats.items()),
+        (f"TTS cache: hit {cache_hits * 100 // cache_lookups}% of {cache_lookups} | mem {cache_mem / 1048576:.1f}MB disk {cache_disk / 1048576:.1f}MB"
+         if speech_cache is not None and cache_lookups else ''),
+        (f"Traces p50/p95 s ({traces_finished}): {trace_summary}" if trace_summary else ''),
+        (f"Frames p50/p99/max ms: {frame_summary}" if frame_summary else ''),
         f"IP: {host_ip}",
         f"Dev errs: {status.get('device_errors',0)} | Recov: {status.get('device_recoveries',0)}", # 7. device stats
-        f"Failed uploads: {f_uploads}",  # (extra)
+        f"Failed uploads: {f_uploads}" + (f" | Log drops: {log_dropped}" if log_dropped else ''),  # (extra)
         f"Last dev err: {status.get('last_device_error','-') or '-'}", # (extra)
+        (f"Config: v{config_version}, last reload {config_reload}" if config_reload else ''),
         (f"Reason: {rec_reason}" if rec_reason else ''),              # (extra)
+        f"UI: {ui_frames} frames ({ui_skipped} skipped) last {ui_build if ui_build is not None else '-'}ms cpu {ui_cpu if ui_cpu is not None else '-'}%",
     ]
     status_lines = [l for l in status_lines if l]
-    layout['right'].update(Panel('\n'.join(status_lines), title='Status', border_style='blue', box=box.ROUNDED))
+    scrolling = len(input_full) > input_name_w or len(output_full) > output_name_w
+    return Panel('\n'.join(status_lines), title='Status', border_style='blue', box=box.ROUNDED), scrolling
+
+def _build_layout(cfg):
+    """Build every panel from scratch (the ``ui.full_redraw`` path and the bench baseline)."""
+    term_w, term_h = _terminal_size()
+    layout = _new_layout()
+    layout['logs'].update(_logs_panel(term_h))
+    layout['shell'].update(_shell_panel())
+    layout['shortcuts'].update(_shortcuts_panel(cfg))
+    layout['right'].update(_status_panel(term_w)[0])
     return layout
 
+
+class _RenderCache:
+    """Renderable wrapper that replays the lines it produced last time when Rich asks for
+    the same size again, so an unchanged panel costs a copy instead of a re-layout."""
+
+    def __init__(self, renderable):
+        self.renderable = renderable
+        self._size = None
+        self._lines = None
+
+    def __rich_console__(self, console, options):
+        size = (options.max_width, options.height)
+        if size != self._size:
+            self._lines = console.render_lines(self.renderable, options, pad=True)
+            self._size = size
+        new_line = Segment.line()
+        for line in self._lines:
+            yield from line
+            yield new_line
+
+
+class _TUIRenderer:
+    """Keeps one Layout and re-renders a panel only when its inputs changed: logs on
+    ``log_version``, shell on ``command_version``, status on ``status.version`` (and
+    while a long device name is scrolling), any of them on a terminal resize. The
+    shortcuts panel is rebuilt only when a config reload changes the shortcuts. Panels are wrapped in ``_RenderCache`` so a redraw
+    only re-lays-out the ones that changed. Frames where nothing changed are skipped."""
+
+    def __init__(self, cfg):
+        self.cfg = cfg
+        self.layout = _new_layout()
+        self._keys = {}
+        self._scrolling = False
+
+    def _dirty(self, panel, key):
+        if self._keys.get(panel) == key:
+            return False
+        self._keys[panel] = key
+        return True
+
+    def update(self, force=False):
+        """Re-render changed panels; returns True when the screen needs redrawing."""
+        if force:
+            self.layout = _build_layout(self.cfg)
+            return True
+        term_w, term_h = _terminal_size()
+        changed = self._dirty('size', (term_w, term_h))
+        if self._dirty('shortcuts', _as_runtime_config(self.cfg).shortcuts):
+            self.layout['shortcuts'].update(_RenderCache(_shortcuts_panel(self.cfg)))
+            changed = True
+        if self._dirty('logs', (log_version, term_h)):
+            self.layout['logs'].update(_RenderCache(_logs_panel(term_h)))
+            changed = True
+        if self._dirty('shell', command_version):
+            self.layout['shell'].update(_RenderCache(_shell_panel()))
+            changed = True
+        if self._dirty('status', (status.version, len(pending_failed_uploads), term_w)) or self._scrolling:
+            panel, self._scrolling = _status_panel(term_w)
+            self.layout['right'].update(_RenderCache(panel))
+            changed = True
+        return changed
+
+    def tick(self, draw, force=False):
+        """One UI frame: update, then ``draw(layout)`` if anything changed. Records frame stats."""
+        t0 = time.perf_counter()
+        if not self.update(force):
+            with status_lock:
+                status.quiet_set('ui_skipped', status['ui_skipped'] + 1)
+            return False
+        draw(self.layout)
+        elapsed = time.perf_counter() - t0
+        metric_observe('butlerbox_ui_frame_seconds', elapsed)
+        with status_lock:
+            status.quiet_set('ui_frames', status['ui_frames'] + 1)
+            status.quiet_set('ui_build_ms', round(elapsed * 1000, 2))
+        return True
+
+
 def ui_loop(cfg):
     if not RICH_AVAILABLE:
         return
     global ui_started
     ui_started = True
+    ui_cfg = cfg.get('ui', {}) or {}
+    interval = max(0.02, float(ui_cfg.get('refresh_seconds', 0.15)))
+    force = bool(ui_cfg.get('full_redraw', False))
     try:
-        with Live(console=console, refresh_per_second=12, screen=True) as live:
+        renderer = _TUIRenderer(cfg)
+        with Live(renderer.layout, console=console, auto_refresh=False, screen=True) as live:
+            draw = lambda layout: live.update(layout, refresh=True)
+            cpu_at, wall_at = time.thread_time(), time.monotonic()
             while not ui_stop_event.is_set():
                 with status_lock:
-                    status['ui_tick'] += 1
-                layout = _build_layout(cfg)
-                live.update(layout)
-                time.sleep(0.15)
+                    status.quiet_set('ui_tick', status['ui_tick'] + 1)
+                renderer.tick(draw, force)
+                now = time.monotonic()
+                if now - wall_at >= 5:
+                    cpu = time.thread_time()
+                    with status_lock:
+                        status.quiet_set('ui_cpu_pct', round((cpu - cpu_at) * 100 / (now - wall_at), 1))
+                    cpu_at, wall_at = cpu, now
+                time.sleep(interval)
     except Exception as e:
         _orig_print(f"UI loop error: {e}")
 
 
 CONFIG_PATH = "config.yaml"
 
+# Process exit codes (sysexits.h style; EX_CONFIG lets supervisors stop restarting on bad config)
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_CONFIG = 78
+
 tts_voice_id = None   # Resolved voice id (string) selected at startup
 tts_rate = None       # Configured speech rate (int)
 recording_active = False  # Global flag to pause generic keyboard handling during active recording
@@ -396,12 +1318,27 @@ def retry_failed_uploads(cfg):
     else:
         log("🎉 All previously failed uploads succeeded or were cleared.")
 
+def _match_voice(voices, voice_name=None, voice_index=None):
+    """Pick a voice from [(id, name)] by name (exact, then substring, then id) or legacy index."""
+    chosen = None
+    if voice_name:
+        vn = str(voice_name).lower()
+        exact = [v for v in voices if v[1].lower() == vn]
+        subset = [v for v in voices if vn in v[1].lower()]
+        by_id = [v for v in voices if str(v[0]).lower() == vn]
+        chosen = (exact or subset or by_id or [None])[0]
+    if not chosen and voice_index is not None and 0 <= voice_index < len(voices):
+        chosen = voices[voice_index]
+    return chosen
+
+
 def init_tts(cfg):
-    """Resolve desired voice/rate from config. Perform one engine discovery.
-    Keep fast & simple; per-utterance threads will re-init their own engine.
+    """Resolve backend and desired voice/rate from config. Perform one voice discovery.
+    Keep fast & simple; the TTS worker keeps its own warm backend instances.
     """
     global tts_voice_id, tts_rate, tts_enabled
     tts_cfg = cfg.get('tts', {}) or {}
+    voice_id, rate = None, None
     if tts_cfg.get('enabled', True) is False:
         tts_enabled = False
         log("TTS disabled via config.")
@@ -411,61 +1348,43 @@ def init_tts(cfg):
     voice_index = tts_cfg.get('voice_index')
     voice_name = tts_cfg.get('voice_name')
     log("TTS init starting...")
-    temp_engine = None
-
-    # Optionally pre-generate SpeechLib once
-    if comtypes is not None:
-        try:
-            dll_candidates = [
-                r"C:\\Windows\\System32\\Speech\\Common\\sapi.dll",
-                r"C:\\Windows\\SysWOW64\\Speech\\Common\\sapi.dll",
-            ]
-            for dll in dll_candidates:
-                if os.path.isfile(dll):
-                    try:
-                        comtypes.client.GetModule(dll)
-                        break
-                    except Exception:
-                        continue
-        except Exception as e:
-            log(f"TTS notice (prep) ignored: {e}")
+    pool = _ensure_tts_pool(tts_cfg)
+    backend_cls = TTS_BACKENDS[pool.name]
+    try:
+        backend_cls.prepare()
+    except Exception as e:
+        log(f"TTS notice (prep) ignored: {e}")
 
-    # Direct (simple) engine create; short timeout not needed here
+    # Temporary instance for discovery; the worker opens its own on its thread
     try:
-        temp_engine = pyttsx3.init(driverName='sapi5')
+        temp_backend = create_tts_backend(pool.name, tts_cfg)
+        temp_backend.open()
     except Exception as e:
-        log(f"TTS init (engine create) failed: {e}")
+        log(f"TTS init ({pool.name} backend create) failed: {e}")
         return
 
     try:
-        voices = (temp_engine.getProperty('voices') or []) if temp_engine else []
-        chosen = None
-        if voice_name:
-            vn = str(voice_name).lower()
-            exact = [v for v in voices if getattr(v, 'name', '').lower() == vn]
-            subset = [v for v in voices if vn in getattr(v, 'name', '').lower()]
-            chosen = (exact or subset or [None])[0]
-        if not chosen and voice_index is not None and 0 <= voice_index < len(voices):
-            chosen = voices[voice_index]
+        chosen = _match_voice(temp_backend.list_voices(), voice_name, voice_index)
         if chosen:
-            tts_voice_id = chosen.id
-            log(f"TTS voice selected: {getattr(chosen,'name','?')}")
+            voice_id = chosen[0]
+            log(f"TTS voice selected: {chosen[1] or chosen[0]} ({pool.name})")
         else:
-            log("TTS using default voice (no match).")
+            log(f"TTS using default voice (no match, {pool.name}).")
         if desired_rate is not None:
             try:
-                tts_rate = int(desired_rate)
+                rate = int(desired_rate)
             except Exception:
                 log("Invalid rate in config; ignoring.")
     except Exception as e:
         log(f"TTS init (voice discovery) failed: {e}")
+        voice_id, rate = tts_voice_id, tts_rate
     finally:
-        if temp_engine:
-            try:
-                temp_engine.stop()
-            except Exception:
-                pass
-    # Nothing else; per-call threads will apply voice/rate
+        try:
+            temp_backend.close()
+        except Exception:
+            pass
+    # The TTS worker applies voice/rate on its next utterance (a config reload lands here too)
+    tts_voice_id, tts_rate = voice_id, rate
 
 def _repair_speechlib_once():
     global _speechlib_repair_attempted
@@ -498,124 +1417,1797 @@ def _repair_speechlib_once():
         log(f"TTS repair skipped: {e}")
 
 
-def speak_text(text):
-    if not text or not tts_enabled:
-        return
-    def _speak(msg):
-        if pythoncom:
-            try:
-                pythoncom.CoInitialize()
-            except Exception:
-                pass
-        engine = None
-        try:
-            try:
-                engine = pyttsx3.init(driverName='sapi5')
-            except Exception as e:
-                if 'ISpeechVoice' in str(e):
-                    _repair_speechlib_once()
-                    engine = pyttsx3.init(driverName='sapi5')
-                else:
-                    raise
-            if tts_rate is not None:
-                try: engine.setProperty('rate', tts_rate)
-                except Exception: pass
-            if tts_voice_id is not None:
-                try: engine.setProperty('voice', tts_voice_id)
-                except Exception: pass
-            engine.say(msg)
-            engine.runAndWait()
-        except Exception as e:
-            log(f"TTS error: {e}")
-            # Fallback try PowerShell
-            try:
-                escaped = msg.replace('`','``').replace('"','\"')
-                ps_cmd = (
-                    f'powershell -NoProfile -Command "Add-Type -AssemblyName System.Speech; '
-                    f'$sp=New-Object System.Speech.Synthesis.SpeechSynthesizer; '
-                    f'$sp.Rate={(tts_rate if tts_rate else 0)}; $sp.Speak(\"{escaped}\");"'
-                )
-                os.system(ps_cmd)
-            except Exception:
-                pass
-        finally:
+def _speak_powershell(msg):
+    """Last-resort fallback when the pyttsx3 engine fails."""
+    try:
+        escaped = msg.replace('`','``').replace('"','\"')
+        ps_cmd = (
+            f'powershell -NoProfile -Command "Add-Type -AssemblyName System.Speech; '
+            f'$sp=New-Object System.Speech.Synthesis.SpeechSynthesizer; '
+            f'$sp.Rate={(tts_rate if tts_rate else 0)}; $sp.Speak(\"{escaped}\");"'
+        )
+        os.system(ps_cmd)
+    except Exception:
+        pass
+
+
+def _pcm_to_wav(pcm, rate, channels=1, width=2):
+    buf = io.BytesIO()
+    with wave.open(buf, 'wb') as wf:
+        wf.setnchannels(channels)
+        wf.setsampwidth(width)
+        wf.setframerate(rate)
+        wf.writeframes(pcm)
+    return buf.getvalue()
+
+
+# ---------------- TTS backends ------------- #
+class TTSBackend:
+    """Speech engine used by the TTS worker.
+
+    Instances come from a _BackendPool and are opened on the thread that first uses
+    them. ``speak`` must return early once ``cancel`` (a threading.Event) is set.
+    ``synthesize`` returns WAV bytes, or None when the engine cannot render to a buffer.
+    """
+    name = 'base'
+    thread_bound = False  # True when an instance must stay on the thread that opened it (COM)
+
+    def __init__(self, options=None):
+        self.options = options or {}
+        self._applied = (None, None)
+
+    @classmethod
+    def prepare(cls):
+        """One-time, process-wide setup before the first instance is opened."""
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def list_voices(self):
+        """Available voices as [(id, name)]."""
+        return []
+
+    def set_voice(self, voice_id, rate):
+        if (voice_id, rate) != self._applied:
+            self._apply_voice(voice_id, rate)
+            self._applied = (voice_id, rate)
+
+    def _apply_voice(self, voice_id, rate):
+        pass
+
+    def synthesize(self, text):
+        return None
+
+    def speak(self, text, cancel=None):
+        raise NotImplementedError
+
+    def stop(self):
+        pass
+
+    def fallback_speak(self, text):
+        """Best-effort speech after ``speak`` raised (instance is discarded afterwards)."""
+
+
+class Sapi5Backend(TTSBackend):
+    """Windows SAPI5 through pyttsx3, with SpeechLib repair and a PowerShell fallback."""
+    name = 'sapi5'
+    thread_bound = True
+
+    @classmethod
+    def prepare(cls):
+        # Optionally pre-generate SpeechLib once
+        if comtypes is None:
+            return
+        dll_candidates = [
+            r"C:\\Windows\\System32\\Speech\\Common\\sapi.dll",
+            r"C:\\Windows\\SysWOW64\\Speech\\Common\\sapi.dll",
+        ]
+        for dll in dll_candidates:
+            if os.path.isfile(dll):
+                try:
+                    comtypes.client.GetModule(dll)
+                    break
+                except Exception:
+                    continue
+
+    def open(self):
+        if pythoncom:
+            try:
+                pythoncom.CoInitialize()
+            except Exception:
+                pass
+        self._cancel = None
+        # pyttsx3.init() hands out one shared engine per driver; pooled instances need their own
+        try:
+            self._engine = pyttsx3.Engine(driverName='sapi5')
+        except Exception as e:
+            if 'ISpeechVoice' in str(e):
+                _repair_speechlib_once()
+                self._engine = pyttsx3.Engine(driverName='sapi5')
+            else:
+                raise
+        try:
+            self._engine.connect('started-word', self._on_word)
+        except Exception:
+            pass
+
+    def _on_word(self, name, location, length):
+        # Runs inside runAndWait on the owning thread; stopping here ends speech at a word boundary
+        if self._cancel is not None and self._cancel.is_set():
+            self.stop()
+
+    def close(self):
+        self.stop()
+        self._engine = None
+
+    def list_voices(self):
+        return [(v.id, getattr(v, 'name', '') or '') for v in (self._engine.getProperty('voices') or [])]
+
+    def _apply_voice(self, voice_id, rate):
+        if rate is not None:
+            try: self._engine.setProperty('rate', rate)
+            except Exception: pass
+        if voice_id is not None:
+            try: self._engine.setProperty('voice', voice_id)
+            except Exception: pass
+
+    def synthesize(self, text):
+        fd, path = tempfile.mkstemp(suffix='.wav', prefix='butlerbox_tts_')
+        os.close(fd)
+        try:
+            self._engine.save_to_file(text, path)
+            self._engine.runAndWait()
+            with open(path, 'rb') as f:
+                data = f.read()
+            return data if len(data) > 44 else None
+        finally:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def speak(self, text, cancel=None):
+        self._cancel = cancel
+        try:
+            self._engine.say(text)
+            self._engine.runAndWait()
+        finally:
+            self._cancel = None
+
+    def stop(self):
+        try:
+            if self._engine:
+                self._engine.stop()
+        except Exception:
+            pass
+
+    def fallback_speak(self, text):
+        _speak_powershell(text)
+
+
+class EspeakBackend(TTSBackend):
+    """espeak-ng / espeak command line. Voice ids are espeak voice names (e.g. ``pt-br``),
+    rate is words per minute like pyttsx3."""
+    name = 'espeak'
+
+    def open(self):
+        exe = self.options.get('executable') or shutil.which('espeak-ng') or shutil.which('espeak')
+        if not exe:
+            raise RuntimeError("espeak-ng / espeak not found on PATH")
+        self._exe = exe
+        self._args = []
+        self._proc = None
+
+    def list_voices(self):
+        out = subprocess.run([self._exe, '--voices'], capture_output=True, text=True, timeout=10).stdout
+        voices = []
+        for line in out.splitlines()[1:]:
+            # Pty Language Age/Gender VoiceName File Other...
+            parts = line.split()
+            if len(parts) >= 4:
+                voices.append((parts[1], parts[3]))
+        return voices
+
+    def _apply_voice(self, voice_id, rate):
+        args = []
+        if voice_id:
+            args += ['-v', str(voice_id)]
+        if rate:
+            args += ['-s', str(int(rate))]
+        self._args = args
+
+    def _cmd(self, *extra):
+        # Text goes through stdin (UTF-8) so it can never be parsed as options
+        return [self._exe, '-b', '1', *self._args, *extra]
+
+    def synthesize(self, text):
+        r = subprocess.run(self._cmd('--stdout'), input=text.encode('utf-8'), capture_output=True, timeout=60)
+        return r.stdout if r.returncode == 0 and len(r.stdout) > 44 else None
+
+    def speak(self, text, cancel=None):
+        proc = subprocess.Popen(self._cmd(), stdin=subprocess.PIPE,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        self._proc = proc
+        try:
+            proc.stdin.write(text.encode('utf-8'))
+            proc.stdin.close()
+            while proc.poll() is None:
+                if cancel is None:
+                    proc.wait()
+                elif cancel.wait(0.02):
+                    self.stop()
+                    break
+        finally:
+            self._proc = None
+
+    def stop(self):
+        proc = self._proc
+        if proc is not None and proc.poll() is None:
+            try:
+                proc.terminate()
+            except Exception:
+                pass
+
+
+_null_sink_lock = threading.Lock()
+
+
+class NullBackend(TTSBackend):
+    """Silent backend for benchmarks and load tests on any host.
+
+    Simulates ``ms_per_char`` of speech (sleeping when ``realtime`` is true) and
+    ``synth_ms_per_char`` of render time, and can append one JSON line per call to
+    ``sink_path`` with the timing it recorded.
+    """
+    name = 'null'
+
+    def open(self):
+        self._ms_per_char = float(self.options.get('ms_per_char', 60))
+        self._realtime = bool(self.options.get('realtime', True))
+        self._synth_ms_per_char = float(self.options.get('synth_ms_per_char', 0))
+        self._sink = self.options.get('sink_path')
+
+    def list_voices(self):
+        return [('null', 'Null (silent)')]
+
+    def _duration(self, text):
+        return len(text) * self._ms_per_char / 1000.0
+
+    def _record(self, op, text, seconds):
+        if not self._sink:
+            return
+        line = json.dumps({'ts': time.time(), 'op': op, 'chars': len(text), 'seconds': round(seconds, 4)})
+        with _null_sink_lock:
+            with open(self._sink, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+
+    def synthesize(self, text):
+        t0 = time.monotonic()
+        if self._synth_ms_per_char > 0:
+            time.sleep(len(text) * self._synth_ms_per_char / 1000.0)
+        data = _pcm_to_wav(b'\x00\x00' * int(16000 * self._duration(text)), 16000)
+        self._record('synthesize', text, time.monotonic() - t0)
+        return data
+
+    def speak(self, text, cancel=None):
+        t0 = time.monotonic()
+        if self._realtime:
+            if cancel is not None:
+                cancel.wait(self._duration(text))
+            else:
+                time.sleep(self._duration(text))
+        self._record('speak', text, time.monotonic() - t0)
+
+
+TTS_BACKENDS = {
+    'sapi5': Sapi5Backend,
+    'espeak': EspeakBackend,
+    'null': NullBackend,
+}
+
+
+def create_tts_backend(name, tts_cfg=None):
+    """Instantiate (not open) a backend by name with its ``tts.<name>`` options."""
+    cls = TTS_BACKENDS.get(name)
+    if cls is None:
+        raise ValueError(f"Unknown TTS backend '{name}' (expected one of: {', '.join(TTS_BACKENDS)})")
+    tts_cfg = tts_cfg or {}
+    options = tts_cfg.get(name)
+    if options is None and name == 'null':
+        options = tts_cfg.get(None)  # unquoted `null:` key in YAML
+    return cls(options or {})
+
+
+class _BackendPool:
+    """Warm, reusable instances of one backend (at most ``size`` open at once).
+
+    Thread-bound backends (SAPI5/COM) only reuse an idle instance on the thread that
+    opened it. ``reset()`` retires every instance; they are reopened on next use.
+    """
+
+    def __init__(self, name, tts_cfg, size):
+        self.name = name
+        self._tts_cfg = tts_cfg
+        self.size = max(1, int(size))
+        self._idle = []
+        self._open_count = 0
+        self._generation = 0
+        self._cond = threading.Condition()
+
+    def _new(self):
+        inst = create_tts_backend(self.name, self._tts_cfg)
+        inst.open()
+        inst._pool_owner = threading.get_ident()
+        inst._pool_generation = self._generation
+        with status_lock:
+            status['tts_engine_inits'] += 1
+        return inst
+
+    def acquire(self, timeout=None):
+        me = threading.get_ident()
+        retire = []
+        try:
+            with self._cond:
+                while True:
+                    for inst in list(self._idle):
+                        if inst._pool_generation != self._generation:
+                            self._idle.remove(inst)
+                            self._open_count -= 1
+                            retire.append(inst)
+                        elif not inst.thread_bound or inst._pool_owner == me:
+                            self._idle.remove(inst)
+                            return inst
+                    if self._open_count < self.size:
+                        self._open_count += 1
+                        break
+                    if self._idle:
+                        # Full of instances bound to other threads: retire one for this thread
+                        retire.append(self._idle.pop(0))
+                        break
+                    if not self._cond.wait(timeout):
+                        raise TimeoutError(f"No {self.name} TTS instance available")
+            try:
+                return self._new()
+            except Exception:
+                with self._cond:
+                    self._open_count -= 1
+                    self._cond.notify()
+                raise
+        finally:
+            for inst in retire:
+                try:
+                    inst.close()
+                except Exception:
+                    pass
+
+    def release(self, inst, broken=False):
+        with self._cond:
+            if not broken and inst._pool_generation == self._generation:
+                self._idle.append(inst)
+                self._cond.notify()
+                return
+            self._open_count -= 1
+            self._cond.notify()
+        try:
+            inst.close()
+        except Exception:
+            pass
+
+    def warm(self):
+        """Open one instance on the calling thread so the first utterance skips engine init."""
+        self.release(self.acquire())
+
+    def resize(self, size):
+        with self._cond:
+            self.size = max(1, int(size))
+            self._cond.notify_all()
+
+    def reset(self):
+        with self._cond:
+            self._generation += 1
+
+
+tts_pool = None            # _BackendPool for the configured tts.backend
+_tts_backend_stats = {}    # backend -> op -> [count, total seconds, max seconds]
+_tts_backend_stats_lock = threading.Lock()
+
+
+def _ensure_tts_pool(tts_cfg):
+    global tts_pool
+    name = str(tts_cfg.get('backend', 'sapi5') or 'sapi5').lower()
+    if name not in TTS_BACKENDS:
+        log(f"⚠️ Unknown tts.backend '{name}'; using sapi5.")
+        name = 'sapi5'
+    size = int(tts_cfg.get('pool_size', 1))
+    if (tts_cfg.get('pipeline', {}) or {}).get('enabled', True):
+        size = max(size, 2)  # the sentence pipeline renders on its own thread while the worker holds one
+    if tts_pool is not None and tts_pool.name == name:
+        tts_pool._tts_cfg = tts_cfg  # backend options from a reloaded config apply on reopen
+        tts_pool.resize(size)
+        tts_pool.reset()
+        return tts_pool
+    if tts_pool is not None:
+        tts_pool.reset()  # backend switched by a reload: instances in use close when released
+    tts_pool = _BackendPool(name, tts_cfg, size)
+    with status_lock:
+        status['tts_backend'] = name
+    return tts_pool
+
+
+def _timed_backend_call(backend, op, *args):
+    """Call ``backend.<op>(*args)`` and record per-backend latency stats + metrics."""
+    t0 = time.monotonic()
+    try:
+        return getattr(backend, op)(*args)
+    finally:
+        elapsed = time.monotonic() - t0
+        metric_observe('butlerbox_tts_backend_seconds', elapsed, backend=backend.name, op=op)
+        with _tts_backend_stats_lock:
+            st = _tts_backend_stats.setdefault(backend.name, {}).setdefault(op, [0, 0.0, 0.0])
+            st[0] += 1
+            st[1] += elapsed
+            st[2] = max(st[2], elapsed)
+
+
+def tts_backend_stats():
+    """Snapshot of per-backend latency: {backend: {op: {'count', 'avg_ms', 'max_ms'}}}."""
+    with _tts_backend_stats_lock:
+        return {
+            name: {op: {'count': c, 'avg_ms': round(total * 1000 / c, 1) if c else 0.0, 'max_ms': round(mx * 1000, 1)}
+                   for op, (c, total, mx) in ops.items()}
+            for name, ops in _tts_backend_stats.items()
+        }
+
+
+# ---------------- Synthesized speech cache ------------- #
+class _SpeechCache:
+    """Content-addressed cache of synthesized WAV bytes (cleaned text + voice + rate).
+
+    Two tiers: an in-memory LRU capped at ``memory_bytes`` and a directory of
+    ``<key>.wav`` files capped at ``disk_bytes`` (oldest evicted first; hits refresh mtime
+    so recency survives restarts).
+    """
+
+    def __init__(self, directory, memory_bytes, disk_bytes, max_text_chars):
+        self.directory = directory
+        self.memory_bytes = max(0, int(memory_bytes))
+        self.disk_bytes = max(0, int(disk_bytes))
+        self.max_text_chars = max(1, int(max_text_chars))
+        self._mem = OrderedDict()   # key -> wav bytes
+        self._mem_used = 0
+        self._disk = OrderedDict()  # key -> size on disk
+        self._disk_used = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if self.disk_bytes and directory:
+            try:
+                os.makedirs(directory, exist_ok=True)
+                entries = []
+                for fn in os.listdir(directory):
+                    if fn.endswith('.wav'):
+                        st = os.stat(os.path.join(directory, fn))
+                        entries.append((st.st_mtime, fn[:-4], st.st_size))
+                for _, key, size in sorted(entries):
+                    self._disk[key] = size
+                    self._disk_used += size
+            except OSError as e:
+                log(f"⚠️ TTS cache dir unavailable ({e}); memory tier only.")
+                self.disk_bytes = 0
+
+    @staticmethod
+    def key(text, voice_id, rate):
+        return hashlib.sha256(f"{voice_id}|{rate}|{text}".encode('utf-8')).hexdigest()
+
+    def cacheable(self, text):
+        return len(text) <= self.max_text_chars
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.wav')
+
+    def _remember(self, key, data):
+        # caller holds the lock
+        if len(data) > self.memory_bytes:
+            return
+        old = self._mem.pop(key, None)
+        if old is not None:
+            self._mem_used -= len(old)
+        self._mem[key] = data
+        self._mem_used += len(data)
+        while self._mem_used > self.memory_bytes and self._mem:
+            _, evicted = self._mem.popitem(last=False)
+            self._mem_used -= len(evicted)
+
+    def get(self, key):
+        with self._lock:
+            data = self._mem.get(key)
+            if data is not None:
+                self._mem.move_to_end(key)
+                self.hits += 1
+                return data
+            on_disk = key in self._disk
+        if on_disk:
+            try:
+                with open(self._path(key), 'rb') as f:
+                    data = f.read()
+                os.utime(self._path(key))
+            except OSError:
+                data = None
+            with self._lock:
+                if data is None:
+                    self._disk_used -= self._disk.pop(key, 0)
+                else:
+                    self._disk.move_to_end(key)
+                    self._remember(key, data)
+                    self.hits += 1
+                    return data
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, data):
+        evict = []
+        with self._lock:
+            self._remember(key, data)
+            if not self.disk_bytes or len(data) > self.disk_bytes or key in self._disk:
+                return
+            self._disk[key] = len(data)
+            self._disk_used += len(data)
+            while self._disk_used > self.disk_bytes and self._disk:
+                old_key, size = self._disk.popitem(last=False)
+                self._disk_used -= size
+                evict.append(old_key)
+        try:
+            tmp = self._path(key) + '.tmp'
+            with open(tmp, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, self._path(key))
+        except OSError as e:
+            log(f"⚠️ TTS cache write failed: {e}")
+            with self._lock:
+                self._disk_used -= self._disk.pop(key, 0)
+        for old_key in evict:
+            try:
+                os.remove(self._path(old_key))
+            except OSError:
+                pass
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'mem_bytes': self._mem_used,
+                'disk_bytes': self._disk_used,
+            }
+
+
+speech_cache = None  # _SpeechCache when tts.cache.enabled
+
+
+class _AudioOutput:
+    """PyAudio output stream on the selected output device, kept open between sounds.
+
+    The stream is reopened only when ``selected_output_device_index`` or the PCM format
+    changes. ``play`` blocks until the audio has been handed to the device; ``ends_at``
+    is when the device will actually have finished playing it (write end + latency).
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.latency = 0.0   # device-reported output latency (seconds)
+        self.ends_at = 0.0   # monotonic time the last sound finishes at the speaker
+        self._lock = threading.Lock()
+        self._pa = None
+        self._stream = None
+        self._key = None
+
+    def _close_stream(self):
+        if self._stream is not None:
+            try:
+                self._stream.stop_stream()
+                self._stream.close()
+            except Exception:
+                pass
+        self._stream = None
+        self._key = None
+
+    def _ensure(self, rate, channels, width):
+        key = (selected_output_device_index, rate, channels, width)
+        if self._stream is not None and key == self._key:
+            return self._stream
+        self._close_stream()
+        if self._pa is None:
+            self._pa = _new_pyaudio()
+        t0 = time.monotonic()
+        self._stream = self._pa.open(format=self._pa.get_format_from_width(width), channels=channels,
+                                     rate=rate, output=True, output_device_index=selected_output_device_index)
+        metric_observe('butlerbox_audio_output_open_seconds', time.monotonic() - t0, output=self.name)
+        self._key = key
+        try:
+            self.latency = float(self._stream.get_output_latency())
+        except Exception:
+            self.latency = 0.0
+        with status_lock:
+            status['output_stream_opens'] += 1
+            status['output_latency_ms'] = int(self.latency * 1000)
+        return self._stream
+
+    def play(self, pcm, rate, channels=1, width=2, cancel=None, on_start=None):
+        """Write ``pcm`` to the device in 20 ms chunks, stopping early once ``cancel`` is set.
+
+        ``on_start(t)`` gets the monotonic time the first chunk was accepted. Returns False
+        if nothing could be played (no device / PyAudio), so callers can fall back.
+        """
+        called = time.monotonic()
+        with self._lock:
+            try:
+                stream = self._ensure(rate, channels, width)
+            except Exception as e:
+                self._close_stream()
+                log(f"🔈 Output device unavailable ({self.name}): {e}")
+                return False
+            chunk = max(1, rate // 50) * channels * width
+            written = 0
+            try:
+                for off in range(0, len(pcm), chunk):
+                    if cancel is not None and cancel.is_set():
+                        break
+                    stream.write(pcm[off:off + chunk])
+                    if written == 0:
+                        first = time.monotonic()
+                        metric_observe('butlerbox_audio_output_latency_seconds',
+                                       first - called + self.latency, output=self.name)
+                        if on_start is not None:
+                            on_start(first)
+                    written += 1
+            except Exception as e:
+                # Device vanished mid-sound: reopen next time
+                self._close_stream()
+                log(f"🔈 Output write failed ({self.name}): {e}")
+                if written == 0:
+                    return False
+            self.ends_at = time.monotonic() + self.latency
+            return True
+
+
+speech_output = _AudioOutput('speech')
+
+
+def _decode_wav(data):
+    """(pcm, rate, channels, width) from WAV bytes, or None if it is not a PCM WAV."""
+    try:
+        with wave.open(io.BytesIO(data), 'rb') as wf:
+            return wf.readframes(wf.getnframes()), wf.getframerate(), wf.getnchannels(), wf.getsampwidth()
+    except (wave.Error, EOFError):
+        return None
+
+
+def _play_wav_bytes(data, on_start=None):
+    """Play an in-memory WAV on the selected output device, stopping early on a TTS interrupt.
+
+    Returns False when there is no way to play raw audio here (caller falls back to the engine).
+    """
+    decoded = _decode_wav(data)
+    if decoded is None:
+        return False
+    pcm, rate, channels, width = decoded
+    if speech_output.play(pcm, rate, channels, width, cancel=_tts_interrupt, on_start=on_start):
+        return True
+    if winsound:
+        try:
+            winsound.PlaySound(data, winsound.SND_MEMORY)
+            return True
+        except Exception:
+            pass
+    return False
+
+
+def _update_cache_status():
+    if speech_cache is None:
+        return
+    st = speech_cache.stats()
+    with status_lock:
+        status['tts_cache_hits'] = st['hits']
+        status['tts_cache_misses'] = st['misses']
+        status['tts_cache_mem_bytes'] = st['mem_bytes']
+        status['tts_cache_disk_bytes'] = st['disk_bytes']
+
+
+# ---------------- TTS worker (warm backend instances, ordered queue) ------------- #
+TTS_PRIORITY_ALERT = 0
+TTS_PRIORITY_HIGH = 3
+TTS_PRIORITY_NORMAL = 5
+TTS_PRIORITY_LOW = 8
+_TTS_PRIORITY_NAMES = {
+    'alert': TTS_PRIORITY_ALERT,
+    'high': TTS_PRIORITY_HIGH,
+    'normal': TTS_PRIORITY_NORMAL,
+    'low': TTS_PRIORITY_LOW,
+}
+_tts_seq = itertools.count()
+
+
+def parse_tts_priority(value, default=TTS_PRIORITY_NORMAL):
+    """Map 'alert'/'high'/'normal'/'low' or an int 0-9 (lower = more urgent) to a priority."""
+    if value is None or value == '':
+        return default
+    if isinstance(value, str) and value.strip().lower() in _TTS_PRIORITY_NAMES:
+        return _TTS_PRIORITY_NAMES[value.strip().lower()]
+    try:
+        return min(9, max(0, int(value)))
+    except (TypeError, ValueError):
+        return default
+
+
+class _Utterance:
+    __slots__ = ('text', 'enqueued_at', 'priority', 'seq', 'trace_id')
+
+    def __init__(self, text, priority=TTS_PRIORITY_NORMAL, trace_id=None):
+        self.text = text
+        self.enqueued_at = time.monotonic()
+        self.priority = priority
+        self.seq = next(_tts_seq)
+        self.trace_id = trace_id  # interaction this reply belongs to; released when spoken
+
+    def __lt__(self, other):
+        # PriorityQueue ordering: most urgent first, FIFO within a priority
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+tts_queue = None          # bounded PriorityQueue of _Utterance, drained by the TTS worker
+tts_starting = None       # threading.Event while main() initializes TTS on a background thread
+tts_queue_lock = threading.Lock()
+_tts_preempt_priority = TTS_PRIORITY_ALERT  # queued items at or above this urgency cut current speech
+
+# Barge-in / interrupt state
+_tts_state_lock = threading.Lock()
+_tts_current = None                 # _Utterance being spoken (None when idle)
+_tts_interrupt = threading.Event()  # passed to backend.speak as its cancel event
+_tts_interrupt_at = None            # monotonic time of the pending interrupt request
+_tts_interrupt_reason = ''
+_tts_idle_at = 0.0                  # monotonic time the worker last finished speaking
+
+
+def tts_speaking_within(tail=0.0):
+    """True while ButlerBox is speaking, or stopped less than ``tail`` seconds ago."""
+    with _tts_state_lock:
+        return _tts_current is not None or time.monotonic() - _tts_idle_at < tail
+
+
+def interrupt_speech(reason='', flush=False):
+    """Stop the utterance being spoken, optionally dropping everything still queued.
+
+    The engine stops at its next word boundary; the latency from this call to the
+    engine returning is logged and recorded. Returns True if speech was cut.
+    """
+    global _tts_interrupt_at, _tts_interrupt_reason
+    if flush and tts_queue is not None:
+        flushed = 0
+        while True:
+            try:
+                tts_queue.get_nowait()
+            except queue.Empty:
+                break
+            tts_queue.task_done()
+            flushed += 1
+        if flushed:
+            with status_lock:
+                status['tts_flushed'] += flushed
+                status['tts_queue_depth'] = tts_queue.qsize()
+            log(f"🧹 Flushed {flushed} queued utterance(s) ({reason or 'interrupt'})")
+    with _tts_state_lock:
+        if _tts_current is None or _tts_interrupt.is_set():
+            return False
+        _tts_interrupt_at = time.monotonic()
+        _tts_interrupt_reason = reason
+        _tts_interrupt.set()
+    return True
+
+
+def _cached_synthesize(backend, text):
+    """WAV for ``text`` from the speech cache, rendering (and caching) it on a miss."""
+    key = speech_cache.key(text, tts_voice_id, tts_rate)
+    data = speech_cache.get(key)
+    if data is None:
+        data = _timed_backend_call(backend, 'synthesize', text)
+        if data:
+            speech_cache.put(key, data)
+    _update_cache_status()
+    return data
+
+
+def _render_speech(backend, text):
+    """WAV bytes for ``text`` (speech cache first), or None if the backend cannot render."""
+    if speech_cache is not None and speech_cache.cacheable(text):
+        return _cached_synthesize(backend, text)
+    if _tts_output_mode == 'device':
+        return _timed_backend_call(backend, 'synthesize', text)
+    return None
+
+
+def _play_or_speak(backend, text, data, on_start=None):
+    """Play rendered audio if there is any (and a way to play it), else let the backend speak."""
+    played = bool(data) and _play_wav_bytes(data, on_start)
+    if not played and not _tts_interrupt.is_set():
+        _timed_backend_call(backend, 'speak', text, _tts_interrupt)
+
+
+# ---------------- Sentence pipeline (render sentence N+1 while N plays) ------------- #
+_tts_pipeline = {'enabled': False, 'min_chars': 160, 'lookahead': 2, 'max_sentence_chars': 300}
+_tts_synth_jobs = queue.Queue()  # callables run in order on the tts-synth thread
+_tts_synth_started = False       # the tts-synth thread is started once, whenever the pipeline is first enabled
+_tts_output_mode = 'device'      # device: render + play on selected_output_device_index; engine: backend speaks
+
+
+def _tts_synth_worker():
+    # Long-lived so thread-bound backends (SAPI5) keep a warm instance on this thread
+    if pythoncom:
+        try:
+            pythoncom.CoInitialize()
+        except Exception:
+            pass
+    while True:
+        job = _tts_synth_jobs.get()
+        try:
+            job()
+        except Exception as e:
+            log(f"TTS synth job failed: {e}")
+
+
+def _pipeline_sentences(text, backend):
+    """Sentences to pipeline for ``text``, or None when it should be spoken in one piece."""
+    if not _tts_pipeline['enabled'] or len(text) < _tts_pipeline['min_chars']:
+        return None
+    if type(backend).synthesize is TTSBackend.synthesize:
+        return None  # backend cannot render to a buffer
+    splitter = _SentenceSplitter(_tts_pipeline['max_sentence_chars'])
+    sentences = splitter.feed(text) + splitter.flush()
+    return sentences if len(sentences) > 1 else None
+
+
+def _pipeline_synthesize(text):
+    """Render one sentence on the tts-synth thread (cache first). None => speak it instead."""
+    if _tts_interrupt.is_set():
+        return None
+    backend = tts_pool.acquire()
+    broken = False
+    try:
+        backend.set_voice(tts_voice_id, tts_rate)
+        if speech_cache is not None and speech_cache.cacheable(text):
+            return _cached_synthesize(backend, text)
+        return _timed_backend_call(backend, 'synthesize', text)
+    except Exception as e:
+        broken = True
+        log(f"TTS synth error: {e} (sentence will be spoken directly)")
+        return None
+    finally:
+        tts_pool.release(backend, broken=broken)
+
+
+def _speak_pipelined(sentences, synthesize, play, lookahead=2, cancel=None, run=None):
+    """Play ``sentences`` in order while a producer renders up to ``lookahead`` ahead.
+
+    ``synthesize(text)`` returns audio (or None) and runs on the producer; ``play(text, audio)``
+    blocks until the sentence was heard. ``run(fn)`` starts the producer (default: a new thread).
+    Returns {'sentences', 'first_audio', 'gaps'} with times in seconds.
+    """
+    ready = queue.Queue(maxsize=max(1, lookahead))
+
+    def produce():
+        try:
+            for text in sentences:
+                if cancel is not None and cancel.is_set():
+                    break
+                try:
+                    audio = synthesize(text)
+                except Exception:
+                    audio = None
+                ready.put((text, audio))
+        finally:
+            ready.put(None)
+
+    started = time.monotonic()
+    if run is None:
+        threading.Thread(target=produce, name='tts-pipeline', daemon=True).start()
+    else:
+        run(produce)
+    first_audio = None
+    gaps = []
+    played = 0
+    last_end = None
+    while True:
+        item = ready.get()
+        if item is None:
+            break
+        if cancel is not None and cancel.is_set():
+            continue  # drain so the producer is never left blocked
+        text, audio = item
+        t = time.monotonic()
+        if first_audio is None:
+            first_audio = t - started
+        else:
+            gaps.append(t - last_end)
+        play(text, audio)
+        last_end = time.monotonic()
+        played += 1
+    return {'sentences': played, 'first_audio': first_audio, 'gaps': gaps}
+
+
+def _record_pipeline_timings(timings):
+    if timings['first_audio'] is not None:
+        metric_observe('butlerbox_tts_first_audio_seconds', timings['first_audio'])
+    for gap in timings['gaps']:
+        metric_observe('butlerbox_tts_sentence_gap_seconds', gap)
+    with status_lock:
+        if timings['first_audio'] is not None:
+            status['tts_last_first_audio_ms'] = int(timings['first_audio'] * 1000)
+        status['tts_last_max_gap_ms'] = int(max(timings['gaps']) * 1000) if timings['gaps'] else 0
+
+
+def start_tts_worker(cfg):
+    """Create the utterance queue and start the single long-lived TTS worker thread (and
+    the tts-synth thread once the pipeline is enabled). Safe to call again on a reload."""
+    global tts_queue, _tts_preempt_priority, speech_cache, _tts_pipeline, _tts_output_mode, _tts_synth_started
+    tts_cfg = cfg.get('tts', {}) or {}
+    size = max(1, int(tts_cfg.get('queue_size', 32)))
+    cache_cfg = tts_cfg.get('cache', {}) or {}
+    if cache_cfg.get('enabled', False) and speech_cache is None:
+        speech_cache = _SpeechCache(
+            cache_cfg.get('dir', 'cache/tts'),
+            float(cache_cfg.get('memory_mb', 16)) * 1024 * 1024,
+            float(cache_cfg.get('disk_mb', 128)) * 1024 * 1024,
+            cache_cfg.get('max_text_chars', 120),
+        )
+        _update_cache_status()
+    _tts_preempt_priority = parse_tts_priority(tts_cfg.get('preempt_priority'), TTS_PRIORITY_ALERT)
+    _tts_output_mode = str(tts_cfg.get('output', 'device')).lower()
+    if _tts_output_mode not in ('device', 'engine'):
+        log(f"⚠️ Unknown tts.output '{_tts_output_mode}'; using device.")
+        _tts_output_mode = 'device'
+    pipe_cfg = tts_cfg.get('pipeline', {}) or {}
+    _tts_pipeline = {
+        'enabled': bool(pipe_cfg.get('enabled', True)),
+        'min_chars': int(pipe_cfg.get('min_chars', 160)),
+        'lookahead': max(1, int(pipe_cfg.get('lookahead', 2))),
+        'max_sentence_chars': int(pipe_cfg.get('max_sentence_chars', 300)),
+    }
+    with tts_queue_lock:
+        new_queue = tts_queue is None
+        if new_queue:
+            tts_queue = queue.PriorityQueue(maxsize=size)
+        elif tts_queue.maxsize != size:
+            log(f"⚠️ tts.queue_size {size} needs a restart (queue stays at {tts_queue.maxsize}).")
+        start_synth = _tts_pipeline['enabled'] and not _tts_synth_started
+        if start_synth:
+            _tts_synth_started = True
+    if tts_pool is None:
+        _ensure_tts_pool(tts_cfg)
+    if new_queue:
+        with status_lock:
+            status['tts_queue_max'] = size
+        threading.Thread(target=_tts_worker, name='tts-worker', daemon=True).start()
+    if start_synth:
+        threading.Thread(target=_tts_synth_worker, name='tts-synth', daemon=True).start()
+        _tts_synth_jobs.put(tts_pool.warm)
+
+
+def _tts_worker():
+    global _tts_current, _tts_idle_at
+    if pythoncom:
+        try:
+            pythoncom.CoInitialize()
+        except Exception:
+            pass
+    try:
+        tts_pool.warm()
+    except Exception as e:
+        log(f"TTS warm-up ({tts_pool.name}) failed: {e}")
+    while True:
+        item = tts_queue.get()
+        with _tts_state_lock:
+            _tts_current = item
+            _tts_interrupt.clear()
+        started = time.monotonic()
+        wait_s = started - item.enqueued_at
+        with status_lock:
+            status['tts_speaking'] = True
+            status['tts_queue_depth'] = tts_queue.qsize()
+            status['tts_last_wait_ms'] = int(wait_s * 1000)
+        metric_observe('butlerbox_tts_queue_wait_seconds', wait_s)
+        tracer.mark(item.trace_id, 'tts_start', chars=len(item.text))
+        publish_event('tts_start', chars=len(item.text))
+        backend = None
+        broken = False
+        first_sound = []
+
+        def on_start(t):
+            if not first_sound:
+                first_sound.append(t)
+
+        try:
+            backend = tts_pool.acquire()
+            backend.set_voice(tts_voice_id, tts_rate)
+            sentences = _pipeline_sentences(item.text, backend)
+            if sentences:
+                timings = _speak_pipelined(
+                    sentences, _pipeline_synthesize,
+                    lambda text, data: _play_or_speak(backend, text, data, on_start),
+                    lookahead=_tts_pipeline['lookahead'], cancel=_tts_interrupt, run=_tts_synth_jobs.put,
+                )
+                _record_pipeline_timings(timings)
+            else:
+                data = None if _tts_interrupt.is_set() else _render_speech(backend, item.text)
+                _play_or_speak(backend, item.text, data, on_start)
+        except Exception as e:
+            log(f"TTS error: {e} (engine will be recreated)")
+            broken = True
+            with status_lock:
+                status['tts_errors'] += 1
+            if backend is not None:
+                backend.fallback_speak(item.text)
+        finally:
+            if backend is not None:
+                tts_pool.release(backend, broken=broken)
+            with _tts_state_lock:
+                _tts_current = None
+                _tts_idle_at = max(time.monotonic(), speech_output.ends_at)
+                interrupted_at = _tts_interrupt_at if _tts_interrupt.is_set() else None
+                reason = _tts_interrupt_reason
+                _tts_interrupt.clear()
+            if interrupted_at is not None:
+                latency = time.monotonic() - interrupted_at
+                metric_observe('butlerbox_tts_interrupt_seconds', latency)
+                with status_lock:
+                    status['tts_interrupts'] += 1
+                    status['tts_last_interrupt_ms'] = int(latency * 1000)
+                log(f"🔇 Speech interrupted ({reason or 'interrupt'}) in {latency * 1000:.0f}ms")
+            speak_s = time.monotonic() - started
+            metric_observe('butlerbox_tts_speak_seconds', speak_s)
+            if first_sound:
+                # Enqueue -> audible: queue wait + rendering + device buffer
+                to_audio = first_sound[0] + speech_output.latency - item.enqueued_at
+                metric_observe('butlerbox_tts_time_to_audio_seconds', to_audio)
+                with status_lock:
+                    status['tts_last_to_audio_ms'] = int(to_audio * 1000)
+            with status_lock:
+                status['tts_speaking'] = tts_queue.qsize() > 0
+                status['tts_last_speak_ms'] = int(speak_s * 1000)
+            publish_event('tts_end', chars=len(item.text), seconds=round(speak_s, 3))
+            tracer.mark(item.trace_id, 'tts_end', chars=len(item.text), interrupted=interrupted_at is not None)
+            tracer.release(item.trace_id)
+            tts_queue.task_done()
+
+
+def speak_text(text, block=False, timeout=None, priority=TTS_PRIORITY_NORMAL, trace_id=None):
+    """Queue text for the TTS worker. Returns False if it was dropped (queue full).
+
+    Lower ``priority`` values are spoken first; an item at or above the configured
+    preempt priority (``tts.preempt_priority``, default alert) cuts off less urgent speech.
+    A ``trace_id`` hold (see _Tracer.reply) is released once the text is spoken or dropped.
+    """
+    if not text or not tts_enabled:
+        tracer.release(trace_id)
+        return False
+    if tts_queue is None:
+        starting = tts_starting
+        if starting is not None:
+            starting.wait()  # startup is still bringing TTS up; don't start a second worker
+        if tts_queue is None:
+            start_tts_worker({})
+    item = _Utterance(text, priority, trace_id)
+    with _tts_state_lock:
+        current = _tts_current
+    if current is not None and priority <= _tts_preempt_priority and priority < current.priority:
+        interrupt_speech('preempted by priority item')
+    try:
+        tts_queue.put(item, block=block, timeout=timeout)
+    except queue.Full:
+        with status_lock:
+            status['tts_dropped'] += 1
+        log(f"⛔ TTS queue full; dropped utterance ({len(text)} chars)")
+        tracer.release(trace_id)
+        return False
+    with status_lock:
+        status['tts_queue_depth'] = tts_queue.qsize()
+    return True
+
+
+# ---------------- Text normalization (precompiled, guarded steps) ------------- #
+class TextRule:
+    """An optional normalizer rule: ``pattern`` and ``replace`` (a string or ``callable(match) -> str``).
+
+    All rules are combined into one regex, so back-references inside a pattern must be
+    named (``(?P=name)``) and inline flags must be scoped (``(?i:...)``).
+    """
+    __slots__ = ('name', 'pattern', 'replace')
+
+    def __init__(self, name, pattern, replace=' '):
+        self.name = name
+        self.pattern = pattern
+        self.replace = replace
+
+
+class TextNormalizer:
+    """Prepare text for TTS: remove URLs & noisy symbol clusters while preserving meaning.
+
+    Steps (each precompiled, and skipped when a substring check shows it cannot match):
+        1. Strip markdown links [label](url) -> label
+        2. Optional rules (emoji, markdown, numbers, extra_rules), all in one combined scan
+        3. Remove raw http(s)/www URLs
+        4. Replace certain symbols (@ # $ % ^ & * _ + = ~ ` | < > { } [ ]) with a space
+        5. Collapse repeated punctuation like '!!!' -> '!'
+        6. Collapse whitespace
+    Sentence punctuation (.,!?;:) is preserved.
+    """
+
+    _LINK_RE = re.compile(r'\[(.*?)\]\((https?://[^)]+)\)')
+    _HTTP_RE = re.compile(r'https?://\S+')
+    _WWW_RE = re.compile(r'www\.\S+')
+    # One symbol at a time: runs become runs of spaces, which step 6 collapses anyway (and it is faster)
+    _SYMBOL_RE = re.compile(r'[\@\#\$%\^&\*_+=~`|<>\\\{\}\[\]]')
+    _PUNCT_RUN_RE = re.compile(r'([!?.])\1+')
+
+    def __init__(self, rules=()):
+        self.rules = tuple(rules)
+        self._rules_re = None
+        if self.rules:
+            # URLs are consumed here too, so rules never rewrite text inside a URL
+            parts = [f'(?P<_r{i}>{rule.pattern})' for i, rule in enumerate(self.rules)]
+            self._rules_re = re.compile('|'.join(parts + [r'(?P<_url>(?:https?://|www\.)\S+)']), re.MULTILINE)
+            self._replace = {f'_r{i}': rule.replace for i, rule in enumerate(self.rules)}
+            self._replace['_url'] = ' '
+
+    def _apply_rule(self, m):
+        rep = self._replace[m.lastgroup]
+        return rep(m) if callable(rep) else rep
+
+    def normalize(self, original):
+        if not original:
+            return ''
+        text = original
+        if '](' in text:
+            text = self._LINK_RE.sub(r'\1', text)
+        if self._rules_re is not None:
+            text = self._rules_re.sub(self._apply_rule, text)
+        if '://' in text:
+            text = self._HTTP_RE.sub(' ', text)
+        if 'www.' in text:
+            text = self._WWW_RE.sub(' ', text)
+        text = self._SYMBOL_RE.sub(' ', text)
+        if '!!' in text or '??' in text or '..' in text:
+            text = self._PUNCT_RUN_RE.sub(r'\1', text)
+        return ' '.join(text.split())
+
+
+_PT_UNITS = ('zero', 'um', 'dois', 'três', 'quatro', 'cinco', 'seis', 'sete', 'oito', 'nove', 'dez',
+             'onze', 'doze', 'treze', 'catorze', 'quinze', 'dezesseis', 'dezessete', 'dezoito', 'dezenove')
+_PT_TENS = ('', '', 'vinte', 'trinta', 'quarenta', 'cinquenta', 'sessenta', 'setenta', 'oitenta', 'noventa')
+_PT_HUNDREDS = ('', 'cento', 'duzentos', 'trezentos', 'quatrocentos', 'quinhentos',
+                'seiscentos', 'setecentos', 'oitocentos', 'novecentos')
+_EN_UNITS = ('zero', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine', 'ten',
+             'eleven', 'twelve', 'thirteen', 'fourteen', 'fifteen', 'sixteen', 'seventeen', 'eighteen', 'nineteen')
+_EN_TENS = ('', '', 'twenty', 'thirty', 'forty', 'fifty', 'sixty', 'seventy', 'eighty', 'ninety')
+
+
+def _pt_below_1000(n):
+    if n == 100:
+        return 'cem'
+    parts = []
+    if n >= 100:
+        parts.append(_PT_HUNDREDS[n // 100])
+    r = n % 100
+    if r:
+        parts.append(_PT_UNITS[r] if r < 20 else _PT_TENS[r // 10] + (f' e {_PT_UNITS[r % 10]}' if r % 10 else ''))
+    return ' e '.join(parts)
+
+
+def number_to_words_pt(n):
+    """Brazilian Portuguese cardinal for 0 <= n < 10**9."""
+    if n == 0:
+        return 'zero'
+    groups = []
+    millions, thousands, rest = n // 1000000, n // 1000 % 1000, n % 1000
+    if millions:
+        groups.append((millions, 'um milhão' if millions == 1 else f'{_pt_below_1000(millions)} milhões'))
+    if thousands:
+        groups.append((thousands, 'mil' if thousands == 1 else f'{_pt_below_1000(thousands)} mil'))
+    if rest:
+        groups.append((rest, _pt_below_1000(rest)))
+    words = ' '.join(w for _, w in groups[:-1])
+    last_value, last = groups[-1]
+    if not words:
+        return last
+    # "mil e cem", "mil e vinte", but "mil duzentos e trinta"
+    return f"{words} {'e ' if last_value < 100 or last_value % 100 == 0 else ''}{last}"
+
+
+def _en_below_1000(n):
+    parts = []
+    if n >= 100:
+        parts.append(f'{_EN_UNITS[n // 100]} hundred')
+    r = n % 100
+    if r:
+        parts.append(_EN_UNITS[r] if r < 20 else _EN_TENS[r // 10] + (f'-{_EN_UNITS[r % 10]}' if r % 10 else ''))
+    return ' '.join(parts)
+
+
+def number_to_words_en(n):
+    """English cardinal for 0 <= n < 10**9."""
+    if n == 0:
+        return 'zero'
+    parts = []
+    for value, scale in ((n // 1000000, ' million'), (n // 1000 % 1000, ' thousand'), (n % 1000, '')):
+        if value:
+            parts.append(_en_below_1000(value) + scale)
+    return ' '.join(parts)
+
+
+def _number_rule(lang):
+    """Spell out numbers ('pt': 1.234,5 / 'en': 1,234.5). Larger than 999 999 999 is left as is."""
+    if lang == 'en':
+        pattern = r'\b(?P<num_int>\d{1,3}(?:,\d{3})+(?!\d)|\d+)(?:\.(?P<num_frac>\d+))?\b'
+        words, thousands, point = number_to_words_en, ',', 'point'
+    else:
+        pattern = r'\b(?P<num_int>\d{1,3}(?:\.\d{3})+(?!\d)|\d+)(?:,(?P<num_frac>\d+))?\b'
+        words, thousands, point = number_to_words_pt, '.', 'vírgula'
+
+    def spell(m):
+        value = int(m.group('num_int').replace(thousands, ''))
+        if value >= 1000000000:
+            return m.group(0)
+        spoken = words(value)
+        frac = m.group('num_frac')
+        if frac:
+            if lang == 'en' or frac[0] == '0' or len(frac) > 3:
+                frac_words = ' '.join(words(int(d)) for d in frac)
+            else:
+                frac_words = words(int(frac))
+            spoken = f'{spoken} {point} {frac_words}'
+        return spoken
+
+    return TextRule('numbers', pattern, spell)
+
+
+def _markdown_rules(normalize):
+    def heading(m):
+        # Heading text goes through the same rules, then ends its own sentence
+        text = normalize(m.group('md_heading')).strip(' #')
+        if not text:
+            return ' '
+        return f" {text}{'' if text[-1] in '.!?:;' else '.'} "
+
+    return [
+        TextRule('md_code', r'```[\s\S]*?(?:```|\Z)'),
+        TextRule('md_heading', r'^[ \t]*#{1,6}[ \t]+(?P<md_heading>[^\n]*)$', heading),
+    ]
+
+
+# Optional rule sets: name -> factory(normalize) returning rules; normalize is the finished normalizer
+TEXT_RULE_SETS = {
+    # Emoji & pictographs (plus joiners / variation selectors) -> word break
+    'emoji': lambda normalize: [TextRule('emoji', '[\U0001F000-\U0001FAFF\u2600-\u27BF\u2B00-\u2BFF\uFE0F\u200D]+')],
+    # Fenced code blocks are not speakable; headings become their own sentence
+    'markdown': _markdown_rules,
+}
+
+
+def build_text_normalizer(cleanup_cfg=None):
+    """Normalizer for the ``text_cleanup`` config section (optional rules + extra_rules)."""
+    cleanup_cfg = cleanup_cfg or {}
+    built = []
+
+    def normalize(text):
+        return built[0].normalize(text)
+
+    rules = []
+    for name, factory in TEXT_RULE_SETS.items():
+        if cleanup_cfg.get(name):
+            rules.extend(factory(normalize))
+    if cleanup_cfg.get('numbers'):
+        rules.append(_number_rule(str(cleanup_cfg['numbers']).lower()))
+    for i, extra in enumerate(cleanup_cfg.get('extra_rules') or []):
+        try:
+            rule = _extra_rule(extra, f'extra{i}')
+            TextNormalizer(rules + [rule])  # must also compile inside the combined pattern
+            rules.append(rule)
+        except (KeyError, TypeError, re.error) as e:
+            hint = " (inline flags must be scoped, e.g. (?i:kg))" if 'global flags' in str(e) else ''
+            log(f"⚠️ text_cleanup.extra_rules[{i}] ignored: {e}{hint}")
+    built.append(TextNormalizer(rules))
+    return built[0]
+
+
+_TEMPLATE_REF_RE = re.compile(r'\\(\d+)|\\g<([^>]*)>')
+
+
+def _extra_rule(extra, default_name):
+    """TextRule for one ``extra_rules`` entry. A ``replace`` with group references
+    (``\\1``, ``\\g<name>``) is expanded against the rule's own pattern, so its group
+    numbers count from the rule, not from the combined regex."""
+    pattern = extra['pattern']
+    own = re.compile(pattern, re.MULTILINE)
+    replace = str(extra.get('replace', ' '))
+    if '\\' not in replace:
+        return TextRule(extra.get('name', default_name), pattern, replace)
+    for num, name in _TEMPLATE_REF_RE.findall(replace):
+        if num and int(num) > own.groups:
+            raise re.error(f"replace refers to group {num}, the pattern has {own.groups}")
+        if name and not (name.isdigit() and int(name) <= own.groups) and name not in own.groupindex:
+            raise re.error(f"replace refers to unknown group '{name}'")
+
+    def expand(m):
+        mm = own.match(m.string, m.start())
+        return mm.expand(replace) if mm is not None else m.group()
+
+    return TextRule(extra.get('name', default_name), pattern, expand)
+
+
+text_normalizer = TextNormalizer()
+
+
+def cleanup_text(original: str) -> str:
+    """Prepare text for TTS with the configured normalizer (see TextNormalizer)."""
+    return text_normalizer.normalize(original)
+
+
+class _SentenceSplitter:
+    """Incrementally split streamed text deltas into complete sentences.
+
+    A sentence ends at ``.``/``!``/``?``/``…`` followed by whitespace, or at a blank line.
+    The terminator is only recognised once the following whitespace arrives, so numbers
+    like ``3.14`` split across chunks are kept intact. Text without any boundary is cut at
+    the last space once it grows beyond ``max_chars``.
+    """
+
+    _BOUNDARY = re.compile(r'[.!?…]+["\')\]»”]*\s+|\n[ \t]*\n')
+
+    def __init__(self, max_chars=400):
+        self.max_chars = max(40, int(max_chars))
+        self._buf = ''
+
+    def feed(self, delta):
+        """Add a text delta; return the list of sentences completed by it."""
+        if not delta:
+            return []
+        self._buf += delta
+        out = []
+        pos = 0
+        for m in self._BOUNDARY.finditer(self._buf):
+            sentence = self._buf[pos:m.end()].strip()
+            if sentence:
+                out.append(sentence)
+            pos = m.end()
+        rest = self._buf[pos:]
+        while len(rest) > self.max_chars:
+            cut = rest.rfind(' ', 0, self.max_chars)
+            if cut <= 0:
+                cut = self.max_chars
+            head, rest = rest[:cut].strip(), rest[cut:].lstrip()
+            if head:
+                out.append(head)
+        self._buf = rest
+        return out
+
+    def flush(self):
+        """Return whatever is left as a final sentence."""
+        rest = self._buf.strip()
+        self._buf = ''
+        return [rest] if rest else []
+
+
+def load_config():
+    try:
+        return _read_config_file(CONFIG_PATH)
+    except ConfigError as e:
+        log(f"CONFIG ERROR: {e}")
+        raise SystemExit(EXIT_CONFIG)
+
+
+def _read_config_file(path):
+    """Parse a YAML config file into a dict; raises ConfigError when it cannot."""
+    if not os.path.exists(path):
+        raise ConfigError(f"{path} not found.")
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+    except (OSError, yaml.YAMLError) as e:
+        raise ConfigError(f"could not read {path}: {e}") from None
+    if not isinstance(data, dict):
+        raise ConfigError(f"{path} must be a mapping of settings.")
+    return data
+
+
+# ---------------- Typed runtime configuration ------------- #
+class ConfigError(ValueError):
+    """Invalid config value; the message starts with the offending key."""
+
+
+def _cfg_section(data, key):
+    value = data.get(key)
+    if value is None:
+        return {}
+    if not isinstance(value, dict):
+        raise ConfigError(f"{key}: expected a mapping, got {value!r}")
+    return value
+
+
+def _cfg_key(path, key):
+    return f"{path}.{key}" if path else key
+
+
+def _cfg_number(section, path, key, default, cast=float, minimum=None, maximum=None):
+    value = section.get(key)
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        raise ConfigError(f"{_cfg_key(path, key)}: expected a number, got {value!r}")
+    try:
+        number = cast(value)
+    except (TypeError, ValueError):
+        raise ConfigError(f"{_cfg_key(path, key)}: expected a number, got {value!r}") from None
+    if minimum is not None and number < minimum:
+        raise ConfigError(f"{_cfg_key(path, key)}: must be >= {minimum}, got {value!r}")
+    if maximum is not None and number > maximum:
+        raise ConfigError(f"{_cfg_key(path, key)}: must be <= {maximum}, got {value!r}")
+    return number
+
+
+def _cfg_str(section, path, key, default=''):
+    value = section.get(key)
+    if value is None or value == '':
+        return default
+    if not isinstance(value, (str, int, float)) or isinstance(value, bool):
+        raise ConfigError(f"{_cfg_key(path, key)}: expected a string, got {value!r}")
+    return str(value)
+
+
+@dataclass(frozen=True, slots=True)
+class WebhookTarget:
+    """One normalized audio_webhooks / text_webhooks entry."""
+    url: str
+    timeout: float
+    file_field: str = 'file'
+    extra_fields: tuple = ()  # ((name, value), ...) form fields sent with audio uploads
+    debug: bool = False
+
+    @classmethod
+    def parse(cls, entry, path, default_timeout):
+        if isinstance(entry, str):
+            entry = {'url': entry}
+        if not isinstance(entry, dict):
+            raise ConfigError(f"{path}: expected a url or a mapping with 'url', got {entry!r}")
+        url = _cfg_str(entry, path, 'url')
+        if not url:
+            raise ConfigError(f"{path}.url: missing")
+        extra = entry.get('extra_fields') or {}
+        if not isinstance(extra, dict):
+            raise ConfigError(f"{path}.extra_fields: expected a mapping, got {extra!r}")
+        fields = []
+        for name, value in extra.items():
+            if not isinstance(value, (str, int, float)) or isinstance(value, bool):
+                raise ConfigError(f"{path}.extra_fields.{name}: expected a string or number, got {value!r}")
+            fields.append((str(name), str(value)))
+        return cls(url=url,
+                   timeout=_cfg_number(entry, path, 'timeout_seconds', default_timeout, minimum=0.1),
+                   file_field=_cfg_str(entry, path, 'file_field_name', 'file'),
+                   extra_fields=tuple(fields),
+                   debug=bool(entry.get('debug', False)))
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """webhook_retry: exponential backoff with optional +/-25% jitter."""
+    max_attempts: int = 1
+    base_delay: float = 1.0
+    backoff: float = 2.0
+    max_delay: float = 30.0
+    jitter: bool = True
+
+    def delay(self, attempt):
+        """Seconds to wait after failed ``attempt`` (1-based) before the next one."""
+        delay = min(self.base_delay * (self.backoff ** (attempt - 1)), self.max_delay)
+        if self.jitter:
+            jitter_span = delay * 0.25
+            delay = max(0.05, delay + random.uniform(-jitter_span, jitter_span))
+        return delay
+
+
+@dataclass(frozen=True, slots=True)
+class Shortcut:
+    """A parsed shortcut: a console char (Ctrl+<letter> is its control char) or a typed sequence."""
+    kind: str                   # 'char' | 'sequence'
+    value: str
+    label: str
+    hotkey: Optional[str]       # spec for the keyboard module; None for sequences (console only)
+
+    @classmethod
+    def parse(cls, spec, path):
+        if spec is None or spec == '':
+            return None
+        if not isinstance(spec, str):
+            raise ConfigError(f"{path}: expected a string, got {spec!r}")
+        raw = spec.strip()
+        lower = raw.lower()
+        if lower.startswith('ctrl+'):
+            if len(lower) != 6 or not 'a' <= lower[-1] <= 'z':
+                raise ConfigError(f"{path}: only ctrl+<letter> combinations are supported, got {spec!r}")
+            # Control char: Ctrl+A => 0x01 ... Ctrl+Z => 0x1A
+            return cls('char', chr(ord(lower[-1]) - 96), f"Ctrl+{lower[-1].upper()}", lower)
+        if len(lower) == 1:
+            return cls('char', lower, raw, lower)
+        # Sequence of characters (case-insensitive, no modifiers)
+        return cls('sequence', lower, raw, None)
+
+
+@dataclass(frozen=True, slots=True)
+class ShortcutConfig:
+    use_global: bool = False
+    send_text: str = 'q'
+    tts_only: str = 'v'
+    retry_failed: str = 'r'
+    exit: str = 'x'
+    reset_io: str = 'm'
+    start_recording: Optional[Shortcut] = None
+    abort_recording: Optional[Shortcut] = None
+    finalize_recording: Optional[Shortcut] = None
+
+    @classmethod
+    def parse(cls, sc):
+        keys = {}
+        for name, default in (('send_text', 'q'), ('tts_only', 'v'), ('retry_failed', 'r'), ('exit', 'x'), ('reset_io', 'm')):
+            key = _cfg_str(sc, 'shortcuts', name, default).lower()
+            if len(key) != 1:
+                raise ConfigError(f"shortcuts.{name}: expected a single key, got {sc.get(name)!r}")
+            keys[name] = key
+        recording = {name: Shortcut.parse(sc.get(name), f"shortcuts.{name}")
+                     for name in ('start_recording', 'abort_recording', 'finalize_recording')}
+        if recording['abort_recording'] and recording['abort_recording'] == recording['finalize_recording']:
+            raise ConfigError("shortcuts.abort_recording and shortcuts.finalize_recording are the same key")
+        return cls(use_global=bool(sc.get('use_global', False)), **keys, **recording)
+
+
+@dataclass(frozen=True, slots=True)
+class RecordingConfig:
+    silence_threshold: int = 500
+    silence_duration: float = 10.0
+    max_record: float = 120.0
+    output_dir: str = 'recordings'
+
+
+@dataclass(frozen=True, slots=True)
+class RuntimeConfig:
+    """config.yaml validated once at startup: defaults applied, types coerced, shortcuts
+    parsed and webhook lists normalized. Hot paths (recording, uploads, shortcuts, UI) use
+    the typed fields; subsystems that read their section once at init use ``get`` on the
+    read-only ``raw`` mapping, so a RuntimeConfig can be passed wherever ``cfg`` is."""
+    access_key: str
+    wakeword_path: str
+    model_path: str
+    wakeword_sensitivity: float
+    recording: RecordingConfig
+    retry: RetryPolicy
+    audio_webhooks: tuple
+    text_webhooks: tuple
+    shortcuts: ShortcutConfig
+    raw: MappingProxyType
+
+    def get(self, key, default=None):
+        return self.raw.get(key, default)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Validate a loaded config dict; raises ConfigError naming the bad key."""
+        if not isinstance(data, dict):
+            raise ConfigError(f"config: expected a mapping, got {type(data).__name__}")
+        rec = _cfg_section(data, 'recording')
+        retry = _cfg_section(data, 'webhook_retry')
+        webhooks = {}
+        for name, default_timeout in (('audio_webhooks', 30.0), ('text_webhooks', 10.0)):
+            entries = data.get(name) or []
+            if not isinstance(entries, list):
+                raise ConfigError(f"{name}: expected a list, got {entries!r}")
+            webhooks[name] = tuple(WebhookTarget.parse(e, f"{name}[{i}]", default_timeout) for i, e in enumerate(entries))
+        _check_sections(data)
+        return cls(
+            access_key=_cfg_str(data, '', 'access_key'),
+            wakeword_path=_cfg_str(data, '', 'wakeword_path'),
+            model_path=_cfg_str(data, '', 'model_path'),
+            wakeword_sensitivity=_cfg_number(data, '', 'wakeword_sensitivity', 0.5, minimum=0, maximum=1),
+            recording=RecordingConfig(
+                silence_threshold=_cfg_number(rec, 'recording', 'silence_threshold', 500, int, minimum=0),
+                silence_duration=_cfg_number(rec, 'recording', 'silence_duration_seconds', 10.0, minimum=0.1),
+                max_record=_cfg_number(rec, 'recording', 'max_record_seconds', 120.0, minimum=1),
+                output_dir=_cfg_str(rec, 'recording', 'output_dir', 'recordings'),
+            ),
+            retry=RetryPolicy(
+                max_attempts=_cfg_number(retry, 'webhook_retry', 'max_attempts', 1, int, minimum=1),
+                base_delay=_cfg_number(retry, 'webhook_retry', 'base_delay_seconds', 1.0, minimum=0),
+                backoff=_cfg_number(retry, 'webhook_retry', 'backoff_factor', 2.0, minimum=1),
+                max_delay=_cfg_number(retry, 'webhook_retry', 'max_delay_seconds', 30.0, minimum=0),
+                jitter=bool(retry.get('jitter', True)),
+            ),
+            audio_webhooks=webhooks['audio_webhooks'],
+            text_webhooks=webhooks['text_webhooks'],
+            shortcuts=ShortcutConfig.parse(_cfg_section(data, 'shortcuts')),
+            raw=MappingProxyType(data),
+        )
+
+
+def _check_sections(data):
+    """Type-check the values the config_reload, tracing, frame_budget, text_cleanup and tts
+    sections are read with, so a bad one is a ConfigError here rather than an exception when
+    the section is applied (at startup, or after a reload has already swapped the config in)."""
+    _cfg_number(_cfg_section(data, 'config_reload'), 'config_reload', 'poll_seconds', None)
+    trace = _cfg_section(data, 'tracing')
+    for key in ('reply_window_seconds', 'max_open', 'sample_size'):
+        _cfg_number(trace, 'tracing', key, None)
+    frame = _cfg_section(data, 'frame_budget')
+    for key in ('overrun_ms', 'sample_size', 'warn_interval_seconds'):
+        _cfg_number(frame, 'frame_budget', key, None)
+    extra = _cfg_section(data, 'text_cleanup').get('extra_rules') or []
+    if not isinstance(extra, list):
+        raise ConfigError(f"text_cleanup.extra_rules: expected a list, got {extra!r}")
+    tts = _cfg_section(data, 'tts')
+    _cfg_number(tts, 'tts', 'queue_size', None, int)
+    _cfg_number(tts, 'tts', 'pool_size', None, int, minimum=1)
+    pipe = _cfg_section(tts, 'pipeline')
+    for key in ('min_chars', 'lookahead', 'max_sentence_chars'):
+        _cfg_number(pipe, 'tts.pipeline', key, None, int)
+    cache = _cfg_section(tts, 'cache')
+    for key in ('memory_mb', 'disk_mb'):
+        _cfg_number(cache, 'tts.cache', key, None)
+    _cfg_number(cache, 'tts.cache', 'max_text_chars', None, int)
+    echo = _cfg_section(tts, 'echo_suppression')
+    for key in ('tail_seconds', 'loudness_margin_db'):
+        _cfg_number(echo, 'tts.echo_suppression', key, None)
+
+
+class LiveConfig:
+    """Handle on the current RuntimeConfig that main() passes everywhere as ``cfg``.
+
+    A reload swaps ``current`` in one assignment; attribute reads and ``get`` go to
+    whatever is current. Code that needs a consistent view for a whole operation (a
+    recording, an upload) takes ``_as_runtime_config(cfg)`` once and uses that snapshot.
+    """
+    __slots__ = ('current', 'version')
+
+    def __init__(self, runtime_config):
+        self.current = runtime_config
+        self.version = 1
+
+    def __getattr__(self, name):
+        return getattr(self.current, name)
+
+    def get(self, key, default=None):
+        return self.current.get(key, default)
+
+    def swap(self, runtime_config):
+        self.current = runtime_config
+        self.version += 1
+
+
+def _as_runtime_config(cfg):
+    """Accept a RuntimeConfig, a LiveConfig (returns its current snapshot) or a plain
+    config dict (tools, tests)."""
+    if isinstance(cfg, RuntimeConfig):
+        return cfg
+    if isinstance(cfg, LiveConfig):
+        return cfg.current
+    return RuntimeConfig.from_dict(dict(cfg or {}))
+
+
+_CUE_FREQS = {
+    "wake_detected": 900,
+    "recording_stopped": 600,
+    "webhook_success": 1200,
+    "webhook_failure": 300,
+}
+
+
+def _tone_pcm(freq, ms, rate=22050, volume=0.4):
+    """16-bit mono sine beep with 5 ms fades (replacement for winsound.Beep)."""
+    n = int(rate * ms / 1000)
+    fade = max(1, int(rate * 0.005))
+    samples = array.array('h', (
+        int(32767 * volume * min(1.0, i / fade, (n - i) / fade) * math.sin(2 * math.pi * freq * i / rate))
+        for i in range(n)
+    ))
+    return samples.tobytes()
+
+
+class _CuePlayer:
+    """Sound cues decoded / generated once and played on their own stream and thread.
+
+    ``play`` only enqueues, so the wake loop and recorder never wait for a beep. Cues
+    are dropped (and counted) if the small queue is full.
+    """
+
+    def __init__(self, audio_cfg):
+        self.enabled = audio_cfg.get("enabled", True) is not False
+        self.rate = 22050
+        self._cues = {}
+        self._queue = queue.Queue(maxsize=8)
+        self._output = _AudioOutput('cue')
+        decoded = {}
+        for event, path in (audio_cfg.get("events", {}) or {}).items():
+            if not path:
+                continue
             try:
-                if engine:
-                    engine.stop()
-            except Exception:
-                pass
-            if pythoncom:
+                with open(path, 'rb') as f:
+                    data = f.read()
+            except OSError as e:
+                log(f"⚠️ Cue '{event}' not loaded ({e}); using a tone.")
+                continue
+            cue = _decode_wav(data)
+            if cue is None:
+                log(f"⚠️ Cue '{event}' is not a PCM WAV; using a tone.")
+                continue
+            decoded[event] = cue + (data,)
+        if decoded:
+            # Tones share the WAVs' rate so the cue stream is not reopened between cues
+            self.rate = next(iter(decoded.values()))[1]
+        for event in _CUE_FREQS:
+            self._cues[event] = decoded.get(event) or self._tone(event)
+        self._cues.update(decoded)
+        if self.enabled:
+            threading.Thread(target=self._run, name='cue-player', daemon=True).start()
+
+    def _tone(self, event):
+        pcm = _tone_pcm(_CUE_FREQS.get(event, 750), 180, self.rate)
+        return pcm, self.rate, 1, 2, _pcm_to_wav(pcm, self.rate)
+
+    def play(self, event):
+        if not self.enabled:
+            return
+        cue = self._cues.get(event)
+        if cue is None:
+            cue = self._cues.setdefault(event, self._tone(event))
+        try:
+            self._queue.put_nowait((event, cue))
+        except queue.Full:
+            with status_lock:
+                status['cues_dropped'] += 1
+
+    def _run(self):
+        # Open the device up front (10 ms of silence) so the first real cue starts immediately
+        self._output.play(b'\x00\x00' * (self.rate // 100), self.rate)
+        while True:
+            event, (pcm, rate, channels, width, wav) = self._queue.get()
+            played = self._output.play(pcm, rate, channels, width)
+            if not played and winsound:
                 try:
-                    pythoncom.CoUninitialize()
+                    winsound.PlaySound(wav, winsound.SND_MEMORY)
+                    played = True
                 except Exception:
                     pass
-    threading.Thread(target=_speak, args=(text,), daemon=True).start()
+            if played:
+                with status_lock:
+                    status['cues_played'] += 1
 
 
-def cleanup_text(original: str) -> str:
-        """Prepare text for TTS: remove URLs & noisy symbol clusters while preserving meaning.
-
-        Steps:
-            1. Strip markdown links [label](url) -> label
-            2. Remove raw http(s)/www URLs
-            3. Replace clusters of certain symbols (@ # $ % ^ & * _ + = ~ ` | < > { } [ ]) with a space
-            4. Collapse repeated punctuation like '!!!' -> '!'
-            5. Collapse whitespace
-        Sentence punctuation (.,!?;:) is preserved.
-        """
-        if not original:
-                return ''
-        text = original
-        # Markdown links
-        text = re.sub(r'\[(.*?)\]\((https?://[^)]+)\)', r'\1', text)
-        # Raw URLs
-        text = re.sub(r'https?://\S+', ' ', text)
-        text = re.sub(r'www\.\S+', ' ', text)
-        # Symbol clusters (keep normal punctuation)
-        text = re.sub(r'[\@\#\$%\^&\*_+=~`|<>\\\{\}\[\]]+', ' ', text)
-        # Reduce repeated punctuation (e.g., !!!! -> !, ??? -> ?)
-        text = re.sub(r'([!?.])\1{1,}', r'\1', text)
-        # Collapse whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        return text
+cue_player = None
+_cue_player_lock = threading.Lock()  # startup builds the player on a background thread
 
 
-def load_config():
-    if not os.path.exists(CONFIG_PATH):
-        log("CONFIG ERROR: config.yaml not found.")
-        raise SystemExit(1)
-    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
-    return data
+def init_cue_player(cfg):
+    global cue_player
+    with _cue_player_lock:
+        if cue_player is None:  # an early play_sound may already have built one
+            cue_player = _CuePlayer(cfg.get("audio_feedback", {}) or {})
 
 
 def play_sound(event, cfg):
-    audio_cfg = cfg.get("audio_feedback", {})
-    if not audio_cfg.get("enabled", True):
-        return
-    events = audio_cfg.get("events", {})
-    path = events.get(event)
-    if path and os.path.isfile(path):
-        # Play specified wav file asynchronously if possible
-        if winsound:
-            try:
-                winsound.PlaySound(path, winsound.SND_FILENAME | winsound.SND_ASYNC)
-                return
-            except Exception:
-                pass
-    # Fallback simple beeps with different frequencies
-    if winsound:
-        freq_map = {
-            "wake_detected": 900,
-            "recording_stopped": 600,
-            "webhook_success": 1200,
-            "webhook_failure": 300,
-        }
-        freq = freq_map.get(event, 750)
-        try:
-            winsound.Beep(freq, 180)
-        except Exception:
-            pass
+    """Queue a sound cue; returns immediately (once the cue player exists)."""
+    global cue_player
+    if cue_player is None:
+        with _cue_player_lock:
+            if cue_player is None:
+                cue_player = _CuePlayer(cfg.get("audio_feedback", {}) or {})
+    cue_player.play(event)
 
 
 def write_wave(filename, sample_rate, raw_bytes):
@@ -634,95 +3226,82 @@ def amplitude_is_silence(pcm_bytes, threshold):
     return peak < threshold
 
 
-def send_to_webhook_single(file_path, webhook_cfg, default_field_name="file"):
-    url = webhook_cfg.get("url")
-    if not url:
-        return False, "No URL"
-    timeout = webhook_cfg.get("timeout_seconds", 30)
-    file_field = webhook_cfg.get("file_field_name", default_field_name)
-    extra_fields = webhook_cfg.get("extra_fields", {}) or {}
-    debug = bool(webhook_cfg.get("debug", False))
+def send_to_webhook_single(file_path, target, trace_id=None, attempt=1):
+    """POST one recording to a WebhookTarget; returns (ok, status code or error)."""
+    url = target.url
+    headers = {TRACE_HEADER: trace_id} if trace_id else None
+    t0 = time.monotonic()
     try:
         with open(file_path, "rb") as f:
-            files = {file_field: (os.path.basename(file_path), f, "audio/wav")}
-            data = {k: str(v) for k, v in extra_fields.items() if isinstance(v, (str, int, float))}
-            r = requests.post(url, files=files, data=data, timeout=timeout)
+            files = {target.file_field: (os.path.basename(file_path), f, "audio/wav")}
+            r = requests.post(url, files=files, data=dict(target.extra_fields), headers=headers, timeout=target.timeout)
         ok = (r.status_code == 200)
+        elapsed = time.monotonic() - t0
+        tracer.mark(trace_id, 'upload_attempt', endpoint=url, attempt=attempt, code=r.status_code, duration_ms=round(elapsed * 1000, 1))
+        metric_observe('butlerbox_upload_duration_seconds', elapsed, kind='audio', endpoint=url)
+        metric_inc('butlerbox_webhook_requests_total', kind='audio', endpoint=url, result='ok' if ok else 'fail')
         with status_lock:
             status['last_audio_webhook'] = {
                 'time': time.strftime('%H:%M:%S'),
                 'success': ok,
                 'code': r.status_code,
             }
-        log(f"➡️  Webhook {url} responded {r.status_code}{' (success)' if ok else ''}")
-        if debug:
+        publish_event('upload_result', kind='audio', endpoint=url, success=ok, code=r.status_code, file=file_path)
+        log(f"➡️  Webhook {url} responded {r.status_code}{' (success)' if ok else ''}",
+            event='upload', kind='audio', endpoint=url, code=r.status_code, success=ok,
+            latency=round(elapsed, 3), file=file_path, trace_id=trace_id)
+        if target.debug:
             body = r.text[:400].replace('\n', ' ')
             log(f"🔍 Body: {body}")
         return ok, r.status_code
     except Exception as e:
+        tracer.mark(trace_id, 'upload_attempt', endpoint=url, attempt=attempt, error=str(e),
+                    duration_ms=round((time.monotonic() - t0) * 1000, 1))
+        metric_inc('butlerbox_webhook_requests_total', kind='audio', endpoint=url, result='error')
         with status_lock:
             status['last_audio_webhook'] = {
                 'time': time.strftime('%H:%M:%S'),
                 'success': False,
                 'code': 'ERR'
             }
-        log(f"❌ Webhook error for {url}: {e}")
+        publish_event('upload_result', kind='audio', endpoint=url, success=False, code='ERR', error=str(e), file=file_path)
+        log(f"❌ Webhook error for {url}: {e}", "ERROR",
+            event='upload', kind='audio', endpoint=url, success=False, error=str(e), file=file_path, trace_id=trace_id)
         return False, str(e)
 
 
-def _retry_params(cfg):
-    retry_cfg = cfg.get("webhook_retry", {}) or {}
-    max_attempts = int(retry_cfg.get("max_attempts", 1))
-    if max_attempts < 1:
-        max_attempts = 1
-    base_delay = float(retry_cfg.get("base_delay_seconds", 1.0))
-    backoff = float(retry_cfg.get("backoff_factor", 2.0))
-    max_delay = float(retry_cfg.get("max_delay_seconds", 30.0))
-    jitter = bool(retry_cfg.get("jitter", True))
-    return {
-        "max_attempts": max_attempts,
-        "base_delay": base_delay,
-        "backoff": backoff,
-        "max_delay": max_delay,
-        "jitter": jitter,
-    }
-
-
-def send_to_webhook_with_retry(file_path, webhook_cfg, cfg, default_field_name="file"):
-    params = _retry_params(cfg)
-    attempts = params["max_attempts"]
+def send_to_webhook_with_retry(file_path, target, retry, trace_id=None):
+    attempts = retry.max_attempts
     for attempt in range(1, attempts + 1):
-        ok, info = send_to_webhook_single(file_path, webhook_cfg, default_field_name=default_field_name)
+        ok, info = send_to_webhook_single(file_path, target, trace_id, attempt)
         if ok:
+            metric_observe('butlerbox_webhook_attempts', attempt, kind='audio')
             if attempt > 1:
                 log(f"✅ Succeeded after {attempt} attempt(s).")
             return True
         if attempt == attempts:
-            log(f"❌ Exhausted {attempts} attempt(s) for webhook {webhook_cfg.get('url')}")
+            metric_observe('butlerbox_webhook_attempts', attempt, kind='audio')
+            log(f"❌ Exhausted {attempts} attempt(s) for webhook {target.url}",
+                event='upload_exhausted', kind='audio', endpoint=target.url, attempts=attempts, file=file_path)
             return False
-        # compute delay
-        delay = params["base_delay"] * (params["backoff"] ** (attempt - 1))
-        delay = min(delay, params["max_delay"])
-        if params["jitter"]:
-            # add +/- 25% jitter
-            jitter_span = delay * 0.25
-            delay = delay + random.uniform(-jitter_span, jitter_span)
-            delay = max(0.05, delay)
-        log(f"⏳ Retry {attempt + 1}/{attempts} for {webhook_cfg.get('url')} in {delay:.2f}s (last error/status: {info})")
+        delay = retry.delay(attempt)
+        log(f"⏳ Retry {attempt + 1}/{attempts} for {target.url} in {delay:.2f}s (last error/status: {info})")
         time.sleep(delay)
     return False
 
 
-def send_to_any_webhook(file_path, cfg):
+def send_to_any_webhook(file_path, cfg, trace_id=None):
     # Audio uploads use 'audio_webhooks'
-    webhooks_list = cfg.get("audio_webhooks") or []
+    rc = _as_runtime_config(cfg)
+    webhooks_list = rc.audio_webhooks
     if not webhooks_list:
         log("⚠️  No audio webhooks configured (expecting 'audio_webhooks:' list in config.yaml).")
         return False
     log(f"📡 Attempting up to {len(webhooks_list)} audio webhook(s) sequentially...")
     for idx, wh in enumerate(webhooks_list, 1):
-        success = send_to_webhook_with_retry(file_path, wh, cfg)
+        success = send_to_webhook_with_retry(file_path, wh, rc.retry, trace_id)
         if success:
+            tracer.mark(trace_id, 'upload_done', endpoint=wh.url)
             log(f"✅ Audio webhook #{idx} succeeded; stopping attempts.")
             return True
     log(f"↪️  Audio webhook #{idx} failed after retries; trying next...")
@@ -731,59 +3310,63 @@ def send_to_any_webhook(file_path, cfg):
 
 def send_text_to_webhooks(text, cfg):
     """Send text JSON to 'text_webhooks'. Success if any returns 200."""
-    webhooks_list = cfg.get("text_webhooks") or []
+    rc = _as_runtime_config(cfg)
+    webhooks_list = rc.text_webhooks
     if not webhooks_list:
         log("⚠️  No text webhooks configured (expecting 'text_webhooks:' list); text not sent.")
         return False
     log(f"📨 Sending text to {len(webhooks_list)} text webhook(s)...")
     any_success = False
     for idx, wh in enumerate(webhooks_list, 1):
-        url = wh.get("url")
-        if not url:
-            log(f"#{idx} missing url; skipping")
-            continue
+        url = wh.url
         # Build a lightweight wrapper to reuse retry logic without file
         def single_text_attempt():
             try:
-                r = requests.post(url, json={"text": text}, timeout=wh.get("timeout_seconds", 10))
+                t0 = time.monotonic()
+                r = requests.post(url, json={"text": text}, timeout=wh.timeout)
                 ok_local = (r.status_code == 200)
+                elapsed = time.monotonic() - t0
+                metric_observe('butlerbox_upload_duration_seconds', elapsed, kind='text', endpoint=url)
+                metric_inc('butlerbox_webhook_requests_total', kind='text', endpoint=url, result='ok' if ok_local else 'fail')
                 with status_lock:
                     status['last_text_webhook'] = {
                         'time': time.strftime('%H:%M:%S'),
                         'success': ok_local,
                         'code': r.status_code,
                     }
-                log(f"➡️  Text webhook #{idx} {url} -> {r.status_code}{' (success)' if ok_local else ''}")
+                publish_event('upload_result', kind='text', endpoint=url, success=ok_local, code=r.status_code)
+                log(f"➡️  Text webhook #{idx} {url} -> {r.status_code}{' (success)' if ok_local else ''}",
+                    event='upload', kind='text', endpoint=url, code=r.status_code, success=ok_local,
+                    latency=round(elapsed, 3))
                 return ok_local, r.status_code
             except Exception as e:
+                metric_inc('butlerbox_webhook_requests_total', kind='text', endpoint=url, result='error')
                 with status_lock:
                     status['last_text_webhook'] = {
                         'time': time.strftime('%H:%M:%S'),
                         'success': False,
                         'code': 'ERR'
                     }
-                log(f"❌ Text webhook #{idx} error: {e}")
+                publish_event('upload_result', kind='text', endpoint=url, success=False, code='ERR', error=str(e))
+                log(f"❌ Text webhook #{idx} error: {e}", "ERROR",
+                    event='upload', kind='text', endpoint=url, success=False, error=str(e))
                 return False, str(e)
 
         # Adapt retry loop
-        params = _retry_params(cfg)
-        attempts = params["max_attempts"]
+        attempts = rc.retry.max_attempts
         for attempt in range(1, attempts + 1):
             ok, info = single_text_attempt()
             if ok:
                 any_success = True
+                metric_observe('butlerbox_webhook_attempts', attempt, kind='text')
                 if attempt > 1:
                     log(f"✅ Text webhook succeeded after {attempt} attempt(s).")
                 break
             if attempt == attempts:
+                metric_observe('butlerbox_webhook_attempts', attempt, kind='text')
                 log(f"❌ Text webhook #{idx} exhausted {attempts} attempt(s).")
                 break
-            delay = params["base_delay"] * (params["backoff"] ** (attempt - 1))
-            delay = min(delay, params["max_delay"])
-            if params["jitter"]:
-                jitter_span = delay * 0.25
-                delay = delay + random.uniform(-jitter_span, jitter_span)
-                delay = max(0.05, delay)
+            delay = rc.retry.delay(attempt)
             log(f"⏳ Retry {attempt + 1}/{attempts} for text webhook #{idx} in {delay:.2f}s (last: {info})")
             time.sleep(delay)
         if any_success:
@@ -814,30 +3397,23 @@ def _set_flag(kind):
 
 
 def register_global_shortcuts(cfg):
-    sc_cfg = cfg.get("shortcuts", {}) or {}
-    if not sc_cfg.get("use_global"):
+    sc = _as_runtime_config(cfg).shortcuts
+    if not sc.use_global:
         return
     if keyboard is None:
         log("⚠️ Global shortcuts requested but 'keyboard' module not available. Install with: pip install keyboard (may require admin).")
         return
 
-    def _normalize(spec):
-        if not spec:
+    def _hotkey(shortcut):
+        if shortcut is None:
             return None
-        s = str(spec).strip().lower()
-        # ctrl+<letter>
-        if s.startswith('ctrl+') and len(s) == 6 and 'a' <= s[-1] <= 'z':
-            return s.replace('+', '+')  # keep format
-        # single char
-        if len(s) == 1:
-            return s
-        # sequences (multi-char) not supported globally
-        log(f"ℹ️ Global shortcut '{spec}' ignored (multi-character sequences not supported globally).")
-        return None
+        if shortcut.hotkey is None:
+            log(f"ℹ️ Global shortcut '{shortcut.label}' ignored (multi-character sequences not supported globally).")
+        return shortcut.hotkey
 
-    start_spec = _normalize(sc_cfg.get('start_recording'))
-    abort_spec = _normalize(sc_cfg.get('abort_recording'))
-    finalize_spec = _normalize(sc_cfg.get('finalize_recording'))
+    start_spec = _hotkey(sc.start_recording)
+    abort_spec = _hotkey(sc.abort_recording)
+    finalize_spec = _hotkey(sc.finalize_recording)
     if not any([start_spec, abort_spec, finalize_spec]):
         log("ℹ️ No valid global shortcuts to register.")
         return
@@ -860,45 +3436,21 @@ def register_global_shortcuts(cfg):
         return
 
 
-def record_audio_after_wake(porcupine, audio_stream, cfg):
-    rec_cfg = cfg.get("recording", {})
-    silence_threshold = rec_cfg.get("silence_threshold", 500)
-    silence_duration = rec_cfg.get("silence_duration_seconds", 10)
-    max_record = rec_cfg.get("max_record_seconds", 120)
-    output_dir = rec_cfg.get("output_dir", "recordings")
-
-    shortcuts_cfg = cfg.get("shortcuts", {}) or {}
-    raw_abort = str(shortcuts_cfg.get("abort_recording", '')).strip()
-    raw_finalize = str(shortcuts_cfg.get("finalize_recording", '')).strip()
-
-    use_global = bool(shortcuts_cfg.get("use_global"))
-
-    def _parse_shortcut(spec):
-        if not spec:
-            return None
-        spec_l = spec.lower()
-        # Ctrl+<letter>
-        if spec_l.startswith('ctrl+') and len(spec_l) == 6:
-            letter = spec_l[-1]
-            if 'a' <= letter <= 'z':
-                # Control char: Ctrl+A => 0x01 ... Ctrl+Z => 0x1A
-                ctrl_char = chr(ord(letter) - 96)
-                return {"type": "char", "value": ctrl_char, "label": f"Ctrl+{letter.upper()}"}
-        # Single character
-        if len(spec_l) == 1:
-            return {"type": "char", "value": spec_l, "label": spec}
-        # Sequence of characters (case-insensitive, no modifiers)
-        return {"type": "sequence", "value": spec_l, "label": spec}
-
-    abort_sc = _parse_shortcut(raw_abort)
-    finalize_sc = _parse_shortcut(raw_finalize)
+def record_audio_after_wake(porcupine, audio_stream, cfg, trace_id=None):
+    rc = _as_runtime_config(cfg)
+    silence_threshold = rc.recording.silence_threshold
+    silence_duration = rc.recording.silence_duration
+    max_record = rc.recording.max_record
+    output_dir = rc.recording.output_dir
+    use_global = rc.shortcuts.use_global
+    abort_sc = rc.shortcuts.abort_recording
+    finalize_sc = rc.shortcuts.finalize_recording
 
-    if abort_sc and finalize_sc and abort_sc == finalize_sc:
-        log("⚠️  abort_recording and finalize_recording shortcuts are identical; abort will take precedence.")
-
-    start_time = time.time()
-    last_sound_time = start_time
+    # Timing counts audio frames rather than the clock: the same as wall time on a live mic,
+    # and exact when a recorded stream is replayed faster than real time (tools/replay_audio.py)
     frames = []
+    last_sound_frame = 0
+    reason = ''
 
     frame_length = porcupine.frame_length
     sample_rate = porcupine.sample_rate
@@ -909,13 +3461,14 @@ def record_audio_after_wake(porcupine, audio_stream, cfg):
     with status_lock:
         status['recording'] = True
         status['recording_reason'] = 'active'
+    publish_event('recording_started')
     keys_info = []
     if abort_sc:
-        keys_info.append(f"[{abort_sc['label']}] abort")
+        keys_info.append(f"[{abort_sc.label}] abort")
     if finalize_sc:
-        keys_info.append(f"[{finalize_sc['label']}] finalize/send")
+        keys_info.append(f"[{finalize_sc.label}] finalize/send")
     extra = (" | ".join(keys_info)) if keys_info else ""
-    log(f"🎙 Recording (max {max_record}s, stop after {silence_duration}s silence){(' -- ' + extra) if extra else ''}...")
+    log(f"🎙 Recording (max {max_record:g}s, stop after {silence_duration:g}s silence){(' -- ' + extra) if extra else ''}...")
 
     aborted = False
     # Sequence buffer: list of (char, timestamp)
@@ -927,11 +3480,15 @@ def record_audio_after_wake(porcupine, audio_stream, cfg):
     shortcut_abort_requested = False
     shortcut_finalize_requested = False
 
+    clock = frame_monitor.clock('record', frame_duration)
     while True:
+        clock.tick()
         pcm = audio_stream.read(frame_length, exception_on_overflow=False)
+        clock.lap('read')
         frames.append(pcm)
         if not amplitude_is_silence(pcm, silence_threshold):
-            last_sound_time = time.time()
+            last_sound_frame = len(frames)
+        clock.lap('analysis')
 
         # Global shortcut checks (if enabled)
         if use_global:
@@ -967,11 +3524,11 @@ def record_audio_after_wake(porcupine, audio_stream, cfg):
                 def _match(sc):
                     if not sc:
                         return False
-                    if sc['type'] == 'char':
-                        return ch == sc['value']
-                    if sc['type'] == 'sequence':
+                    if sc.kind == 'char':
+                        return ch == sc.value
+                    if sc.kind == 'sequence':
                         s = ''.join(c for c, _ in seq_buffer)
-                        return s.endswith(sc['value'])
+                        return s.endswith(sc.value)
                     return False
 
                 if abort_sc and _match(abort_sc):
@@ -985,23 +3542,29 @@ def record_audio_after_wake(porcupine, audio_stream, cfg):
                     break
             if aborted or reason.startswith("✋"):
                 break
+        clock.lap('shortcuts')
 
-        elapsed = time.time() - start_time
-        silence_elapsed = time.time() - last_sound_time
+        elapsed = len(frames) * frame_duration
+        silence_elapsed = (len(frames) - last_sound_frame) * frame_duration
 
         if elapsed >= max_record:
-            reason = f"⏱ Max length {max_record}s reached"
+            reason = f"⏱ Max length {max_record:g}s reached"
             break
         if silence_elapsed >= silence_duration and elapsed > 0.5:  # ensure we captured something
-            reason = f"🤫 Silence {silence_duration}s"
+            reason = f"🤫 Silence {silence_duration:g}s"
             break
 
-    log(f"🛑 Recording stopped: {reason}")
+    clock.pause()
+    recorded_s = round(len(frames) * frame_duration, 2)
+    tracer.mark(trace_id, 'recording_stop', reason=reason, aborted=aborted)
+    log(f"🛑 Recording stopped: {reason}", event='recording_stopped', reason=reason,
+        seconds=recorded_s, trace_id=trace_id)
     play_sound("recording_stopped", cfg)
     recording_active = False
     with status_lock:
         status['recording'] = False
         status['recording_reason'] = reason
+    publish_event('recording_stopped', reason=reason, aborted=aborted, seconds=recorded_s)
 
     if aborted:
         log("🚫 Recording discarded (no file saved / no upload).")
@@ -1009,8 +3572,6 @@ def record_audio_after_wake(porcupine, audio_stream, cfg):
 
     # If we stopped because of silence, trim the trailing silence_duration seconds
     if "Silence" in reason:
-        frame_length = porcupine.frame_length
-        frame_duration = frame_length / float(sample_rate)
         frames_to_trim = int(silence_duration / frame_duration)
         if frames_to_trim > 0 and len(frames) > frames_to_trim + 5:  # keep at least a few frames
             original_count = len(frames)
@@ -1023,33 +3584,157 @@ def record_audio_after_wake(porcupine, audio_stream, cfg):
     # Build file name with timestamp
     ts = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
     filename = os.path.join(output_dir, f"recording_{ts}.wav")
+    n = 1
+    while os.path.exists(filename):  # two recordings in one second (e.g. a replayed stream)
+        n += 1
+        filename = os.path.join(output_dir, f"recording_{ts}_{n}.wav")
     raw_bytes = b"".join(frames)
     write_wave(filename, sample_rate, raw_bytes)
+    tracer.mark(trace_id, 'file_written', file=filename, bytes=len(raw_bytes))
     size_kb = len(raw_bytes) / 1024
-    log(f"💾 Saved {filename} ({size_kb:.1f} KB)")
+    log(f"💾 Saved {filename} ({size_kb:.1f} KB)", event='recording_saved', file=filename, bytes=len(raw_bytes),
+        trace_id=trace_id)
     return filename, False
 
 
-def listen_loop(cfg):
-    access_key = cfg.get("access_key")
-    wake_path = cfg.get("wakeword_path")
-    model_path = cfg.get("model_path")
+def _upload_recording(path, cfg, wake_t=None, trace_id=None):
+    """Background upload of a finished recording; deletes on success, queues for retry on failure."""
+    ok = send_to_any_webhook(path, cfg, trace_id)
+    if not ok:
+        tracer.finish(trace_id, 'upload_failed')
+    if ok:
+        if wake_t is not None:
+            metric_observe('butlerbox_wake_to_upload_seconds', time.monotonic() - wake_t)
+        play_sound("webhook_success", cfg)
+        try:
+            os.remove(path)
+            log(f"🧹 Deleted local file {path}")
+        except Exception as e:
+            log(f"⚠️ Could not delete file: {e}")
+    else:
+        play_sound("webhook_failure", cfg)
+        _record_failed_upload(path)
+
+
+# In-flight recording uploads, so shutdown can wait for them
+_upload_threads = set()
+_upload_threads_lock = threading.Lock()
+
+
+def _start_upload(path, cfg, wake_t=None, trace_id=None):
+    """Run _upload_recording on a tracked background thread."""
+    def _run():
+        try:
+            _upload_recording(path, cfg, wake_t, trace_id)
+        finally:
+            with _upload_threads_lock:
+                _upload_threads.discard(threading.current_thread())
+    t = threading.Thread(target=_run, name='upload', daemon=True)
+    with _upload_threads_lock:
+        _upload_threads.add(t)
+    t.start()
+
+
+class _EchoGate:
+    """Keep ButlerBox's own voice from waking it up.
+
+    While the TTS worker is speaking (plus ``tail_seconds``), mic frames are either not
+    passed to Porcupine at all (``skip``) or a detection has to be confirmed (``gate``).
+    Either way a frame or detection still counts when the mic is louder than the echo
+    level measured during playback by ``loudness_margin_db`` (null: never).
+    """
+
+    def __init__(self, tts_cfg):
+        ec = tts_cfg.get('echo_suppression', {}) or {}
+        self.mode = str(ec.get('mode', 'gate')).lower()
+        if self.mode not in ('off', 'gate', 'skip'):
+            log(f"⚠️ Unknown tts.echo_suppression.mode '{self.mode}'; using gate.")
+            self.mode = 'gate'
+        self.tail = float(ec.get('tail_seconds', 0.6))
+        margin = ec.get('loudness_margin_db', 12)
+        self.margin_db = None if margin is None else float(margin)
+        self._echo_db = None                # running echo level while speaking
+        self._recent = deque(maxlen=16)     # last ~0.5 s of frame levels
+        self._in_window = False
+
+    @staticmethod
+    def _level_db(pcm):
+        energy = sum(s * s for s in pcm) / (len(pcm) or 1)
+        return 10 * math.log10(energy / (32768.0 * 32768.0)) if energy > 0 else -120.0
+
+    def _loud(self, db):
+        return self.margin_db is not None and self._echo_db is not None and db >= self._echo_db + self.margin_db
+
+    def should_process(self, pcm):
+        """Whether this frame goes to wake detection."""
+        if self.mode == 'off' or not tts_speaking_within(self.tail):
+            if self._in_window:
+                self._in_window = False
+                self._echo_db = None
+                self._recent.clear()
+            return True
+        self._in_window = True
+        db = self._level_db(pcm)
+        self._recent.append(db)
+        if self.mode == 'skip' and not self._loud(db):
+            self._echo_db = db if self._echo_db is None else 0.95 * self._echo_db + 0.05 * db
+            with status_lock:
+                status['echo_suppressed_frames'] += 1
+            return False
+        if not self._loud(db):
+            self._echo_db = db if self._echo_db is None else 0.95 * self._echo_db + 0.05 * db
+        return True
+
+    def accept_wake(self):
+        """Whether a detection is real (False: counted as a false wake and ignored)."""
+        if not self._in_window:
+            return True
+        if self._recent and self._loud(max(self._recent)):
+            with status_lock:
+                status['echo_loud_wakes'] += 1
+            return True
+        with status_lock:
+            status['echo_false_wakes'] += 1
+        publish_event('wake_suppressed', reason='self-echo')
+        return False
+
+
+_pyaudio_init_lock = threading.Lock()
+
+
+def _new_pyaudio():
+    """PyAudio() serialized: Pa_Initialize is not thread-safe and startup opens the mic
+    and the cue output on different threads."""
+    with _pyaudio_init_lock:
+        return pyaudio.PyAudio()
+
+
+def open_mic(cfg):
+    """Create Porcupine and open the mic stream. Returns a dict for listen_loop, or an
+    exit code (EXIT_CONFIG) when the wake word setup is invalid."""
+    rc = _as_runtime_config(cfg)
+    access_key, wake_path, model_path = rc.access_key, rc.wakeword_path, rc.model_path
     if not all([access_key, wake_path, model_path]):
         log("CONFIG ERROR: access_key, wakeword_path, model_path must be set in config.yaml")
-        return
+        return EXIT_CONFIG
     # Friendly validation for common misconfigurations
-    if isinstance(access_key, str) and access_key.startswith("YOUR_"):
+    if access_key.startswith("YOUR_"):
         log("CONFIG ERROR: Replace placeholder access_key in config.yaml with your real Picovoice Access Key from console.picovoice.ai")
-        return
+        return EXIT_CONFIG
     if not os.path.isfile(wake_path):
         log(f"CONFIG ERROR: wakeword_path file not found: {wake_path}")
-        return
+        return EXIT_CONFIG
     if not os.path.isfile(model_path):
         log(f"CONFIG ERROR: model_path file not found: {model_path}")
-        return
+        return EXIT_CONFIG
 
-    porcupine = pvporcupine.create(access_key=access_key, keyword_paths=[wake_path], model_path=model_path)
-    pa = pyaudio.PyAudio()
+    try:
+        porcupine = _create_porcupine(rc)
+    except Exception as e:
+        # Invalid/expired access key, or keyword and model from different Porcupine versions
+        log(f"CONFIG ERROR: could not create Porcupine: {e}")
+        return EXIT_CONFIG
+    pa = _new_pyaudio()
     global selected_input_device_index, selected_output_device_index
     # Try to capture selected input device index/name for status
     try:
@@ -1070,24 +3755,91 @@ def listen_loop(cfg):
         selected_output_device_index = out_default
     except Exception:
         pass
+    mic = {
+        'porcupine': porcupine,
+        'pa': pa,
+        'keyword_name': _keyword_name(rc),
+    }
     def _open_input(idx):
+        # Reads the engine from the dict: a config reload may swap in one with another frame size
         return pa.open(
-            rate=porcupine.sample_rate,
+            rate=mic['porcupine'].sample_rate,
             channels=1,
             format=pyaudio.paInt16,
             input=True,
             input_device_index=idx if idx is not None else None,
-            frames_per_buffer=porcupine.frame_length,
+            frames_per_buffer=mic['porcupine'].frame_length,
         )
-    audio_stream = _open_input(selected_input_device_index)
-    keyword_name = os.path.splitext(os.path.basename(wake_path))[0]
+    mic['open_input'] = _open_input
+    mic['stream'] = _open_input(selected_input_device_index)
+    return mic
+
+
+def _create_porcupine(rc):
+    return pvporcupine.create(access_key=rc.access_key, keyword_paths=[rc.wakeword_path],
+                              model_path=rc.model_path, sensitivities=[rc.wakeword_sensitivity])
+
+
+def _keyword_name(rc):
+    return os.path.splitext(os.path.basename(rc.wakeword_path))[0]
+
+
+def _take_pending_porcupine():
+    """Hand over an engine built by a config reload (or None); called between mic frames."""
+    global _pending_porcupine
+    with _pending_porcupine_lock:
+        pending, _pending_porcupine = _pending_porcupine, None
+    return pending
+
+
+def listen_loop(cfg, mic=None):
+    """Wake word loop on an open mic (from open_mic); returns the process exit code."""
+    if mic is None:
+        mic = open_mic(cfg)
+        if not isinstance(mic, dict):
+            return mic
+    porcupine, pa, audio_stream = mic['porcupine'], mic['pa'], mic['stream']
+    _open_input, keyword_name = mic['open_input'], mic['keyword_name']
+    global selected_input_device_index, selected_output_device_index
+    tts_cfg = cfg.get("tts", {}) or {}
+    barge_in = bool(tts_cfg.get("barge_in", True))
+    barge_in_flush = bool(tts_cfg.get("barge_in_flush", False))
+    echo_gate = _EchoGate(tts_cfg)
+    cfg_version = getattr(cfg, 'version', None)  # LiveConfig: re-read the tts settings after a reload
+    clock = frame_monitor.clock('listen', porcupine.frame_length / porcupine.sample_rate)
     log(f"🎤 Listening for wake word '{keyword_name}' ... Press Ctrl+C to exit.")
 
     global manual_record_request
 
     try:
         global mic_reset_request, speaker_reset_request, cycle_input_device_request, cycle_output_device_request
-        while True:
+        while not listen_stop_event.is_set():
+            clock.tick()
+            pending = _take_pending_porcupine()
+            if pending is not None:
+                new_engine, keyword_name = pending
+                old_engine, porcupine = porcupine, new_engine
+                mic['porcupine'] = porcupine
+                clock.budget = new_engine.frame_length / new_engine.sample_rate
+                if (new_engine.frame_length, new_engine.sample_rate) != (old_engine.frame_length, old_engine.sample_rate):
+                    try:
+                        audio_stream.close()
+                    except Exception:
+                        pass
+                    try:
+                        audio_stream = _open_input(selected_input_device_index)
+                    except Exception as e:
+                        log(f"❌ Mic reopen for the new wake word engine failed: {e}")  # the read error path retries
+                old_engine.delete()
+                log(f"🔑 Wake word engine swapped; listening for '{keyword_name}'.", event='wake_engine_swap', keyword=keyword_name)
+            if getattr(cfg, 'version', None) != cfg_version:
+                cfg_version = cfg.version
+                new_tts_cfg = cfg.get("tts", {}) or {}
+                if new_tts_cfg != tts_cfg:
+                    tts_cfg = new_tts_cfg
+                    barge_in = bool(tts_cfg.get("barge_in", True))
+                    barge_in_flush = bool(tts_cfg.get("barge_in_flush", False))
+                    echo_gate = _EchoGate(tts_cfg)
             # Handle pending device actions
             if mic_reset_request:
                 mic_reset_request = False
@@ -1099,10 +3851,12 @@ def listen_loop(cfg):
                     audio_stream = _open_input(selected_input_device_index)
                     with status_lock:
                         status['device_recoveries'] += 1
+                    publish_event('device_recovered', source='mic_reset')
                     log("🔄 Mic reset complete")
                 except Exception as e:
                     with status_lock:
                         status['device_errors'] += 1
+                    publish_event('device_error', source='mic_reset', error=str(e))
                     log(f"❌ Mic reset failed: {e}")
             if cycle_input_device_request:
                 cycle_input_device_request = False
@@ -1148,39 +3902,37 @@ def listen_loop(cfg):
                         info = pa.get_device_info_by_index(selected_output_device_index)
                         with status_lock:
                             status['output_device'] = info.get('name')
-                        log(f"➡️  Selected output device {info.get('name')} (note: TTS library may ignore)")
+                        log(f"➡️  Selected output device {info.get('name')} (speech and cues reopen on it)")
                 except Exception as e:
                     log(f"⚠️ Could not cycle output device: {e}")
             if speaker_reset_request:
                 speaker_reset_request = False
                 try:
-                    init_tts(cfg)
+                    init_tts(cfg)  # also retires pooled backend instances
                     log("🔁 Speaker (TTS) reset")
                 except Exception as e:
                     log(f"❌ Speaker reset failed: {e}")
             if manual_record_request:
                 manual_record_request = False
                 # Provide the same audible cue as a wake detection
+                wake_t = time.monotonic()
+                trace_id = tracer.start('manual')
+                if barge_in:
+                    interrupt_speech('manual start', flush=barge_in_flush)
                 play_sound("wake_detected", cfg)
                 with status_lock:
                     status['last_wake'] = time.strftime('%H:%M:%S')
                     status['manual_start_count'] += 1
-                audio_file, aborted = record_audio_after_wake(porcupine, audio_stream, cfg)
+                publish_event('wake_detected', source='manual', trace_id=trace_id)
+                clock.lap('commands')
+                clock.pause()
+                audio_file, aborted = record_audio_after_wake(porcupine, audio_stream, cfg, trace_id)
                 if not aborted and audio_file:
-                    def uploader(path):
-                        ok = send_to_any_webhook(path, cfg)
-                        if ok:
-                            play_sound("webhook_success", cfg)
-                            try:
-                                os.remove(path)
-                                log(f"🧹 Deleted local file {path}")
-                            except Exception as e:
-                                log(f"⚠️ Could not delete file: {e}")
-                        else:
-                            play_sound("webhook_failure", cfg)
-                            _record_failed_upload(path)
-                    threading.Thread(target=uploader, args=(audio_file,), daemon=True).start()
+                    _start_upload(audio_file, cfg, wake_t, trace_id)
+                else:
+                    tracer.finish(trace_id, 'aborted')
                 continue
+            clock.lap('commands')
 
             try:
                 pcm = audio_stream.read(porcupine.frame_length, exception_on_overflow=False)
@@ -1189,6 +3941,7 @@ def listen_loop(cfg):
                 with status_lock:
                     status['device_errors'] += 1
                     status['last_device_error'] = time.strftime('%H:%M:%S')
+                publish_event('device_error', source='read', error=str(e))
                 log(f"🎧 Device read error: {e}. Attempting reopen...")
                 recovered = False
                 for _ in range(5):
@@ -1207,6 +3960,7 @@ def listen_loop(cfg):
                         )
                         with status_lock:
                             status['device_recoveries'] += 1
+                        publish_event('device_recovered', source='read')
                         log("🎧 Device stream recovered.")
                         recovered = True
                         break
@@ -1214,38 +3968,42 @@ def listen_loop(cfg):
                         continue
                 if not recovered:
                     log("❌ Unable to recover audio device; will retry on next loop.")
+                clock.lap('device_recovery')
                 continue
+            clock.lap('read')
             pcm_unpacked = struct.unpack_from("h" * porcupine.frame_length, pcm)
+            if not echo_gate.should_process(pcm_unpacked):
+                clock.lap('process')
+                continue
             result = porcupine.process(pcm_unpacked)
+            clock.lap('process')
+            if result >= 0 and not echo_gate.accept_wake():
+                log("🔇 Ignored wake word while speaking (self-echo)")
+                continue
             if result >= 0:
-                log(f"🔑 Wake word '{keyword_name}' detected!")
+                wake_t = time.monotonic()
+                trace_id = tracer.start('wakeword')
+                log(f"🔑 Wake word '{keyword_name}' detected!", event='wake', keyword=keyword_name, trace_id=trace_id)
+                if barge_in:
+                    interrupt_speech('wake word', flush=barge_in_flush)
                 play_sound("wake_detected", cfg)
                 with status_lock:
                     status['last_wake'] = time.strftime('%H:%M:%S')
-                audio_file, aborted = record_audio_after_wake(porcupine, audio_stream, cfg)
+                publish_event('wake_detected', source='wakeword', keyword=keyword_name, trace_id=trace_id)
+                clock.lap('wake')
+                clock.pause()
+                audio_file, aborted = record_audio_after_wake(porcupine, audio_stream, cfg, trace_id)
                 if aborted or not audio_file:
+                    tracer.finish(trace_id, 'aborted')
                     continue
-
-                def uploader(path):
-                    ok = send_to_any_webhook(path, cfg)
-                    if ok:
-                        play_sound("webhook_success", cfg)
-                        try:
-                            os.remove(path)
-                            log(f"🧹 Deleted local file {path}")
-                        except Exception as e:
-                            log(f"⚠️ Could not delete file: {e}")
-                    else:
-                        play_sound("webhook_failure", cfg)
-                        _record_failed_upload(path)
-
-                threading.Thread(target=uploader, args=(audio_file,), daemon=True).start()
+                _start_upload(audio_file, cfg, wake_t, trace_id)
     except KeyboardInterrupt:
-        log("👋 Exiting.")
+        _log_exit()
     finally:
         audio_stream.close()
         pa.terminate()
         porcupine.delete()
+    return EXIT_OK
 
 
 
@@ -1253,19 +4011,18 @@ def keyboard_loop(cfg):
     if msvcrt is None:
         log("Keyboard interaction not available on this platform.")
         return
-    sc_cfg = cfg.get('shortcuts', {}) or {}
-    send_key = sc_cfg.get('send_text', 'q') or 'q'
-    tts_key = sc_cfg.get('tts_only', 'v') or 'v'
-    retry_key = sc_cfg.get('retry_failed', 'r') or 'r'
-    exit_key = sc_cfg.get('exit', 'x') or 'x'
-    reset_key = sc_cfg.get('reset_io', 'm') or 'm'
+    def _keys():
+        sc = _as_runtime_config(cfg).shortcuts  # per key press, so a config reload applies
+        return sc.send_text, sc.tts_only, sc.retry_failed, sc.exit, sc.reset_io
+    send_key, tts_key, retry_key, exit_key, reset_key = _keys()
     log(f"⌨️  Keyboard: '{send_key}'=compose send+tts, '{tts_key}'=compose tts-only, Enter=commit, Esc=cancel, {retry_key}=retry uploads, {exit_key}=exit notice, {reset_key}=reset I/O")
-    global command_mode, command_buffer, mic_reset_request, speaker_reset_request, cycle_input_device_request, cycle_output_device_request
+    global command_mode, command_buffer, command_version, mic_reset_request, speaker_reset_request, cycle_input_device_request, cycle_output_device_request
     # Alt key detection (msvcrt): an initial '\x00' or '\xe0' followed by scan code.
     # We'll map scan codes for I and O (23, 24) to cycle requests.
     while True:
         if msvcrt.kbhit():
             ch = msvcrt.getwch()
+            send_key, tts_key, retry_key, exit_key, reset_key = _keys()
             alt_scan = None
             if ch in ('\x00', '\xe0') and msvcrt.kbhit():
                 scan = msvcrt.getwch()
@@ -1289,6 +4046,7 @@ def keyboard_loop(cfg):
                     text = ''.join(command_buffer).strip()
                     command_buffer.clear()
                     command_mode = None
+                    command_version += 1
                 if mode and text:
                     if mode == 'send_text':
                         log(f"🔤 Speaking & sending: {text}")
@@ -1301,6 +4059,7 @@ def keyboard_loop(cfg):
                 with command_lock:
                     command_buffer.clear()
                     command_mode = None
+                    command_version += 1
                 log("↩️  Input canceled")
             elif ch and len(ch) == 1:
                 lower = ch.lower()
@@ -1311,13 +4070,16 @@ def keyboard_loop(cfg):
                                 command_buffer.pop()
                         elif 32 <= ord(ch) < 127:
                             command_buffer.append(ch)
+                        command_version += 1
                     else:
                         if lower == send_key.lower():
                             command_mode = 'send_text'
                             command_buffer = []
+                            command_version += 1
                         elif lower == tts_key.lower():
                             command_mode = 'speak_only'
                             command_buffer = []
+                            command_version += 1
                         elif lower == retry_key.lower():
                             threading.Thread(target=retry_failed_uploads, args=(cfg,), daemon=True).start()
                         # Removed manual log scrolling shortcuts
@@ -1338,20 +4100,188 @@ def keyboard_loop(cfg):
 
 
 # ---------------- Flask webhook (incoming text) ------------- #
-app = Flask(__name__)
+app = None  # Flask app, created (and flask imported) by start_webhook_listener
+
+# Bounded queue between the HTTP handler and speech. Created by start_webhook_listener.
+inbound_queue = None
+
+
+class _TTLCache:
+    """Thread-safe set of recently seen keys; entries expire after ``ttl`` seconds and
+    the oldest are evicted (LRU) beyond ``max_entries``."""
+
+    def __init__(self, ttl, max_entries):
+        self.ttl = float(ttl)
+        self.max_entries = max(1, int(max_entries))
+        self._items = OrderedDict()  # key -> monotonic time first seen
+        self._lock = threading.Lock()
+
+    def seen(self, key):
+        """Return True if ``key`` is still live; otherwise record it and return False."""
+        now = time.monotonic()
+        with self._lock:
+            ts = self._items.get(key)
+            if ts is not None and now - ts < self.ttl:
+                self._items.move_to_end(key)
+                return True
+            self._items[key] = now
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+            return False
+
+    def discard(self, key):
+        with self._lock:
+            self._items.pop(key, None)
+
+
+class _RateLimiter:
+    """Per-client token buckets (``rate`` tokens/s, capacity ``burst``) with LRU eviction."""
+
+    def __init__(self, rate, burst, max_clients):
+        self.rate = max(0.001, float(rate))
+        self.burst = max(1.0, float(burst))
+        self.max_clients = max(1, int(max_clients))
+        self._buckets = OrderedDict()  # client -> [tokens, last monotonic time]
+        self._lock = threading.Lock()
+
+    def allow(self, client):
+        """Take one token for ``client``. Returns (allowed, seconds until next token)."""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(client)
+            if bucket is None:
+                bucket = [self.burst, now]
+                self._buckets[client] = bucket
+                while len(self._buckets) > self.max_clients:
+                    self._buckets.popitem(last=False)
+            else:
+                bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+            self._buckets.move_to_end(client)
+            if bucket[0] >= 1.0:
+                bucket[0] -= 1.0
+                return True, 0.0
+            return False, (1.0 - bucket[0]) / self.rate
+
+
+def _message_key(data, text):
+    """Idempotency key: explicit id (payload ``id`` or Idempotency-Key / X-Message-Id header),
+    else None so the caller can fall back to a content hash."""
+    msg_id = data.get("id") if isinstance(data, dict) else None
+    if msg_id is None:
+        from flask import request
+        msg_id = request.headers.get("Idempotency-Key") or request.headers.get("X-Message-Id")
+    if msg_id is not None and str(msg_id).strip():
+        return f"id:{str(msg_id).strip()}"
+    return None
+
+
+def _content_key(text):
+    normalized = ' '.join(text.split()).lower()
+    return "sha1:" + hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+
+def _update_inbound_depth():
+    q = inbound_queue
+    with status_lock:
+        status['inbound_queue_depth'] = q.qsize() if q is not None else 0
+
+
+def _inbound_worker():
+    """Clean inbound texts off the request thread and hand them to the TTS worker in order."""
+    while True:
+        text, _enqueued_at, priority, trace_id = inbound_queue.get()
+        _update_inbound_depth()
+        try:
+            cleaned = cleanup_text(text)
+            if cleaned:
+                # Blocks while the TTS queue is full so backpressure reaches the inbound queue
+                speak_text(cleaned, block=True, priority=priority, trace_id=trace_id)
+                with status_lock:
+                    status['msgs_spoken'] += 1
+            else:
+                tracer.release(trace_id)
+                with status_lock:
+                    status['msgs_ignored'] += 1
+        except Exception as e:
+            tracer.release(trace_id)
+            log(f"❌ Inbound worker error: {e}")
+        finally:
+            inbound_queue.task_done()
+
+
+def _wait_for_port(port, timeout, server_thread=None, interval=0.05):
+    """Poll until 127.0.0.1:port accepts connections; True once it does. Gives up at
+    ``timeout`` or as soon as ``server_thread`` has died (e.g. the bind failed)."""
+    import socket
+    deadline = time.monotonic() + timeout
+    while True:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.settimeout(0.2)
+            if s.connect_ex(("127.0.0.1", port)) == 0:
+                return True
+        if server_thread is not None and not server_thread.is_alive():
+            return False
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
 
 
 def start_webhook_listener(cfg):
+    global app
+    from flask import Flask, Response, request, jsonify
+    app = Flask(__name__)
     listener_cfg = cfg.get("webhook_listener", {})
     host = listener_cfg.get("host", "0.0.0.0")
     port = listener_cfg.get("port", 5000)
     endpoint = listener_cfg.get("endpoint", "/response")
     health_path = listener_cfg.get("health_endpoint", "/health")
+    stream_path = listener_cfg.get("stream_endpoint", "/response/stream")
+    metrics_path = listener_cfg.get("metrics_endpoint", "/metrics")
+    events_path = listener_cfg.get("events_endpoint", "/events")
+    interrupt_path = listener_cfg.get("interrupt_endpoint", "/interrupt")
+    reload_path = listener_cfg.get("reload_endpoint", "/reload")
+    event_bus.configure(listener_cfg.get("events_buffer", 64), listener_cfg.get("events_max_subscribers", 16))
+    stream_max_chars = int(listener_cfg.get("stream_max_sentence_chars", 400))
+    stream_put_timeout = float(listener_cfg.get("stream_queue_timeout_seconds", 30))
+
+    server_mode = str(listener_cfg.get("server", "flask") or "flask").lower()
+    threads = max(1, int(listener_cfg.get("threads", 4)))
+    queue_size = max(1, int(listener_cfg.get("inbound_queue_size", 32)))
+    workers = max(1, int(listener_cfg.get("inbound_workers", 1)))
+    retry_after = max(1, int(listener_cfg.get("retry_after_seconds", 2)))
+    if server_mode == "waitress":
+        try:
+            import waitress  # type: ignore  # noqa: F401
+        except ImportError:
+            log("⚠️ webhook_listener.server is 'waitress' but waitress is not installed (pip install waitress); using Flask dev server.")
+            server_mode = "flask"
+    elif server_mode != "flask":
+        log(f"⚠️ Unknown webhook_listener.server '{server_mode}'; using Flask dev server.")
+        server_mode = "flask"
+
+    dedup_cfg = listener_cfg.get("dedup", {}) or {}
+    dedup_cache = None
+    dedup_by_content = bool(dedup_cfg.get("content_hash", True))
+    if dedup_cfg.get("enabled", False):
+        dedup_cache = _TTLCache(dedup_cfg.get("ttl_seconds", 30), dedup_cfg.get("max_entries", 1024))
+    rl_cfg = listener_cfg.get("rate_limit", {}) or {}
+    rate_limiter = None
+    if rl_cfg.get("enabled", False):
+        rate_limiter = _RateLimiter(rl_cfg.get("per_second", 2), rl_cfg.get("burst", 5), rl_cfg.get("max_clients", 256))
 
-    log(f"🌐 Initializing webhook listener on {host}:{port}{endpoint} (health: {health_path})")
+    global inbound_queue
+    inbound_queue = queue.Queue(maxsize=queue_size)
+    for _ in range(workers):
+        threading.Thread(target=_inbound_worker, daemon=True).start()
+
+    log(f"🌐 Initializing webhook listener on {host}:{port}{endpoint} (stream: {stream_path}, health: {health_path}, server: {server_mode})")
     # Record endpoint path and attempt host IP resolution (best-effort)
     with status_lock:
         status['endpoint_path'] = endpoint
+        status['listener_server'] = server_mode
+        status['inbound_queue_max'] = queue_size
         try:
             import socket
             if host in ("0.0.0.0", "::"):
@@ -1370,8 +4300,23 @@ def start_webhook_listener(cfg):
         except Exception:
             status['host_ip'] = host
 
+    def _rate_limited():
+        """Return a 429 response if the calling client is over its budget, else None."""
+        if rate_limiter is None:
+            return None
+        allowed, wait_s = rate_limiter.allow(request.remote_addr or "?")
+        if allowed:
+            return None
+        with status_lock:
+            status['msgs_rate_limited'] += 1
+        wait_s = max(1, int(wait_s + 0.999))
+        return jsonify({"error": "rate limited", "retry_after": wait_s}), 429, {"Retry-After": str(wait_s)}
+
     @app.route(endpoint, methods=["POST"])
     def handle_response():
+        limited = _rate_limited()
+        if limited is not None:
+            return limited
         data = request.json
         if not data or "text" not in data:
             return jsonify({"error": "Invalid payload, 'text' field is required."}), 400
@@ -1387,23 +4332,183 @@ def start_webhook_listener(cfg):
                 status['msgs_received'] += 1
                 status['msgs_ignored'] += 1
             return jsonify({"status": "ignored", "reason": "blank text"}), 204
-        original_text = text
-        cleaned = cleanup_text(original_text)
-        log(f"📥 Received text: {original_text}")
         with status_lock:
             status['msgs_received'] += 1
-        if cleaned:
-            speak_text(cleaned)
+        dedup_key = None
+        if dedup_cache is not None:
+            dedup_key = _message_key(data, text)
+            if dedup_key is None and dedup_by_content:
+                dedup_key = _content_key(text)
+            if dedup_key is not None and dedup_cache.seen(dedup_key):
+                with status_lock:
+                    status['msgs_duplicate'] += 1
+                log(f"♻️ Duplicate inbound text ignored ({dedup_key[:16]})")
+                return jsonify({"status": "duplicate", "message": "Already received"}), 200
+        trace_id = tracer.reply(request.headers.get(TRACE_HEADER) or data.get("trace_id"), kind='text', chars=len(text))
+        try:
+            inbound_queue.put_nowait((text, time.monotonic(), parse_tts_priority(data.get("priority")), trace_id))
+        except queue.Full:
+            tracer.release(trace_id)
+            if dedup_key is not None:
+                # Not accepted, so a retry must not be treated as a duplicate
+                dedup_cache.discard(dedup_key)
             with status_lock:
-                status['msgs_spoken'] += 1
-        else:
+                status['inbound_rejected'] += 1
+            log(f"⛔ Inbound queue full ({queue_size}); rejected text (Retry-After {retry_after}s)")
+            return jsonify({"error": "busy", "retry_after": retry_after}), 503, {"Retry-After": str(retry_after)}
+        _update_inbound_depth()
+        log(f"📥 Received text: {text}", event='inbound', chars=len(text), trace_id=trace_id)
+        return jsonify({"status": "success", "message": "Queued", "trace_id": trace_id}), 200
+
+    @app.route(stream_path, methods=["POST"])
+    def handle_stream():
+        """Speak a streamed reply sentence by sentence as it arrives.
+
+        Body is either NDJSON (``application/x-ndjson``; one ``{"text": "<delta>"}`` object
+        per line, ``delta``/``content`` also accepted) or raw text deltas. Send it with
+        chunked transfer encoding so sentences are queued before the reply completes.
+        """
+        limited = _rate_limited()
+        if limited is not None:
+            return limited
+        dedup_key = _message_key(None, '') if dedup_cache is not None else None
+        if dedup_key is not None and dedup_cache.seen(dedup_key):
             with status_lock:
-                status['msgs_ignored'] += 1
-        return jsonify({"status": "success", "message": "Spoken"}), 200
+                status['msgs_duplicate'] += 1
+            return jsonify({"status": "duplicate", "message": "Already received"}), 200
+        ctype = (request.content_type or '').lower()
+        ndjson = 'ndjson' in ctype or 'jsonl' in ctype
+        priority = parse_tts_priority(request.args.get("priority") or request.headers.get("X-Priority"))
+        splitter = _SentenceSplitter(stream_max_chars)
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        started = time.monotonic()
+        first_ms = None
+        queued = 0
+        with status_lock:
+            status['streams_received'] += 1
+        # Holds the trace open until the stream ends; each queued sentence adds its own hold
+        trace_id = tracer.reply(request.headers.get(TRACE_HEADER) or request.args.get("trace_id"), kind='stream')
+        log(f"📡 Inbound stream started ({'ndjson' if ndjson else 'text'})", trace_id=trace_id)
+
+        def _queue(sentences):
+            nonlocal first_ms, queued
+            for sentence in sentences:
+                tracer.hold(trace_id)
+                # Block (bounded) rather than reject: the stream itself is the backpressure
+                try:
+                    inbound_queue.put((sentence, time.monotonic(), priority, trace_id), timeout=stream_put_timeout)
+                except queue.Full:
+                    tracer.release(trace_id)
+                    raise
+                queued += 1
+                if first_ms is None:
+                    first_ms = (time.monotonic() - started) * 1000.0
+                with status_lock:
+                    status['msgs_received'] += 1
+                _update_inbound_depth()
+
+        def _ndjson_delta(line):
+            line = line.strip()
+            if not line:
+                return ''
+            try:
+                obj = json.loads(line)
+            except ValueError:
+                return line + ' '
+            if isinstance(obj, dict):
+                for field in ('text', 'delta', 'content'):
+                    if isinstance(obj.get(field), str):
+                        return obj[field]
+                return ''
+            return obj if isinstance(obj, str) else ''
+
+        stream = request.stream
+        try:
+            if ndjson:
+                while True:
+                    raw = stream.readline()
+                    if not raw:
+                        break
+                    _queue(splitter.feed(_ndjson_delta(decoder.decode(raw))))
+            else:
+                while True:
+                    raw = stream.read(1024)
+                    if not raw:
+                        break
+                    _queue(splitter.feed(decoder.decode(raw)))
+            tail = decoder.decode(b'', final=True)
+            _queue(splitter.feed(tail) + splitter.flush())
+        except queue.Full:
+            if dedup_key is not None:
+                dedup_cache.discard(dedup_key)
+            with status_lock:
+                status['inbound_rejected'] += 1
+            log(f"⛔ Inbound stream aborted: queue full for {stream_put_timeout:.0f}s after {queued} sentence(s)")
+            return jsonify({"error": "busy", "sentences": queued, "retry_after": retry_after}), 503, {"Retry-After": str(retry_after)}
+        finally:
+            tracer.release(trace_id)
+        total_ms = (time.monotonic() - started) * 1000.0
+        first_txt = f"{first_ms:.0f}ms" if first_ms is not None else "-"
+        log(f"📡 Inbound stream done: {queued} sentence(s), first queued after {first_txt}, total {total_ms:.0f}ms")
+        return jsonify({"status": "success", "sentences": queued, "trace_id": trace_id,
+                        "first_sentence_ms": first_ms, "total_ms": total_ms}), 200
+
+    if metrics_path:
+        @app.route(metrics_path, methods=["GET"])
+        def handle_metrics():
+            return Response(render_metrics(), mimetype='text/plain; version=0.0.4; charset=utf-8')
+
+    if interrupt_path:
+        @app.route(interrupt_path, methods=["POST"])
+        def handle_interrupt():
+            """Stop current speech; ``{"flush": true}`` also drops queued utterances."""
+            data = request.get_json(silent=True) or {}
+            cut = interrupt_speech('http', flush=bool(data.get("flush", False)))
+            return jsonify({"status": "success", "interrupted": cut}), 200
+
+    if reload_path:
+        @app.route(reload_path, methods=["POST"])
+        def handle_reload():
+            """Re-read config.yaml now; 422 with the validation error if it was rejected."""
+            if live_config is None:
+                return jsonify({"error": "config reload not available"}), 503
+            ok, detail = reload_config('http')
+            if not ok:
+                return jsonify({"status": "rejected", "error": detail}), 422
+            return jsonify({"status": "success", "changed": detail, "version": live_config.version}), 200
+
+    if events_path:
+        @app.route(events_path, methods=["GET"])
+        def handle_events():
+            """Server-sent events: one ``event: <type>`` / JSON ``data:`` record per ButlerBox event."""
+            sub = event_bus.subscribe()
+            if sub is None:
+                return jsonify({"error": "too many subscribers"}), 503, {"Retry-After": str(retry_after)}
+
+            def _stream():
+                try:
+                    yield "retry: 3000\n\n"
+                    while not sub.dropped:
+                        try:
+                            ev = sub.queue.get(timeout=15)
+                        except queue.Empty:
+                            yield ": keepalive\n\n"
+                            continue
+                        yield f"id: {ev['seq']}\nevent: {ev['type']}\ndata: {json.dumps(ev, default=str)}\n\n"
+                    yield "event: dropped\ndata: {}\n\n"
+                finally:
+                    event_bus.unsubscribe(sub)
+
+            return Response(_stream(), mimetype='text/event-stream',
+                            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
     @app.route(health_path, methods=["GET"])
     def handle_health():
-        return jsonify({"status": "ok", "endpoint": endpoint}), 200
+        with status_lock:
+            depth = status.get('inbound_queue_depth', 0)
+            rejected = status.get('inbound_rejected', 0)
+        return jsonify({"status": "ok", "endpoint": endpoint, "server": server_mode,
+                        "inbound_queue_depth": depth, "inbound_rejected": rejected}), 200
 
     # Suppress Flask default banner/log noise when using Rich full-screen UI
     logging.getLogger('werkzeug').setLevel(logging.ERROR)
@@ -1418,32 +4523,37 @@ def start_webhook_listener(cfg):
             tb = traceback.format_exc(limit=6)
             log(f"❌ Flask listener crashed: {e}\n{tb}")
 
+    def _run_waitress():
+        try:
+            from waitress import serve  # type: ignore
+            serve(app, host=host, port=port, threads=threads)
+        except Exception as e:
+            log(f"❌ Waitress listener failed on {host}:{port}: {e}")
+
+    server_thread = threading.Thread(target=_run_waitress if server_mode == "waitress" else _run_flask, daemon=True)
+    server_thread.start()
+
     # Optionally allow using waitress (more production-stable) as a fallback if Flask dev server crashes immediately
     use_waitress_fallback = listener_cfg.get("waitress_fallback", True)
-    threading.Thread(target=_run_flask, daemon=True).start()
 
     # Launch a watchdog to detect early failure & retry with waitress
-    if use_waitress_fallback:
+    if use_waitress_fallback and server_mode == "flask":
         def _watchdog():
-            # Give Flask a moment to start and pass self-test; if health still fails due to server crash, attempt waitress
-            time.sleep(1.5)
-            # If no successful health yet and port not listening, try waitress
+            # Poll for Flask to bind (up to 1.5s, or until its thread dies); if it never listens, try waitress
             try:
-                import socket
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                    s.settimeout(0.2)
-                    if s.connect_ex(("127.0.0.1", port)) != 0:  # not listening
-                        log("♻️ Retrying listener with waitress WSGI server...")
-                        try:
-                            from waitress import serve  # type: ignore
-                            def _serve_waitress():
-                                with status_lock:
-                                    # Mark as attempting (will be confirmed by health thread soon or assumed ok)
-                                    status['listener_health'] = 'ok'
-                                serve(app, host=host, port=port)
-                            threading.Thread(target=_serve_waitress, daemon=True).start()
-                        except Exception as we:
-                            log(f"❌ Waitress fallback failed: {we}")
+                if not _wait_for_port(port, 1.5, server_thread):
+                    log("♻️ Retrying listener with waitress WSGI server...")
+                    try:
+                        from waitress import serve  # type: ignore
+                        def _serve_waitress():
+                            with status_lock:
+                                # Mark as attempting (will be confirmed by health thread soon or assumed ok)
+                                status['listener_health'] = 'ok'
+                                status['listener_server'] = 'waitress'
+                            serve(app, host=host, port=port, threads=threads)
+                        threading.Thread(target=_serve_waitress, daemon=True).start()
+                    except Exception as we:
+                        log(f"❌ Waitress fallback failed: {we}")
             except Exception:
                 pass
         threading.Thread(target=_watchdog, daemon=True).start()
@@ -1451,7 +4561,8 @@ def start_webhook_listener(cfg):
     # Optional self-test (loopback) if enabled
     if listener_cfg.get("self_test", True):
         def _self_test():
-            time.sleep(1.0)
+            # Waits for the bind (including a waitress fallback) instead of a fixed delay
+            _wait_for_port(port, 5.0)
             try:
                 url = f"http://127.0.0.1:{port}{health_path}"
                 r = requests.get(url, timeout=2)
@@ -1470,39 +4581,324 @@ def start_webhook_listener(cfg):
         threading.Thread(target=_self_test, daemon=True).start()
 
 
-def main():
-    cfg = load_config()
+class _StartupTimer:
+    """Per-phase startup timings (phases run on several threads) and the timing report.
+    Offsets are measured from the start of module import."""
+
+    def __init__(self):
+        self.phases = [('imports', 0.0, _IMPORT_SECONDS, 'MainThread')]  # (name, start offset, seconds, thread)
+        self.listening_at = None
+        self._lock = threading.Lock()
+
+    def record(self, name, started):
+        now = time.perf_counter()
+        with self._lock:
+            self.phases.append((name, started - _IMPORT_STARTED, now - started, threading.current_thread().name))
+
+    def run(self, name, fn, *args):
+        started = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            self.record(name, started)
+
+    def background(self, name, fn, *args):
+        """Run a phase on its own thread; failures are logged, not raised."""
+        def _phase():
+            try:
+                self.run(name, fn, *args)
+            except Exception as e:
+                log(f"❌ Startup phase '{name}' failed: {e}")
+        t = threading.Thread(target=_phase, name=f'startup-{name}', daemon=True)
+        t.start()
+        return t
+
+    def report_when_done(self, threads):
+        """Wait for the background phases, then log the timing report."""
+        for t in threads:
+            t.join()
+        ready_at = time.perf_counter() - _IMPORT_STARTED
+        with self._lock:
+            phases = sorted(self.phases, key=lambda p: p[1])
+        listen_ms = int(self.listening_at * 1000) if self.listening_at is not None else None
+        log("⏱ Startup timing (ms from launch):")
+        for name, start, seconds, thread in phases:
+            log(f"   {name:<10} {start * 1000:6.0f} → {(start + seconds) * 1000:6.0f}  ({seconds * 1000:.0f}ms, {thread})")
+        log(f"   listening at {listen_ms if listen_ms is not None else '-'}ms; everything up at {ready_at * 1000:.0f}ms",
+            event='startup', listening_ms=listen_ms, ready_ms=int(ready_at * 1000),
+            phases={name: int(seconds * 1000) for name, _, seconds, _ in phases})
+        with status_lock:
+            status['startup_listen_ms'] = listen_ms
+            status['startup_ready_ms'] = int(ready_at * 1000)
+
+
+def _parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="ButlerBox: wake word -> record -> webhook, and webhook text -> speech.")
+    ap.add_argument("--config", default=CONFIG_PATH, help="path to the YAML config (default: %(default)s)")
+    ap.add_argument("--headless", action="store_true",
+                    help="service mode: no console UI or keyboard input, logs to stdout and/or the log file "
+                         "(same as service.headless: true)")
+    return ap.parse_args(argv)
+
+
+_exit_signal = None  # name of the signal that ended the run (logged by the KeyboardInterrupt handler)
+
+
+def _log_exit():
+    if _exit_signal:
+        log(f"🛑 {_exit_signal} received; shutting down...")
+    log("👋 Exiting.")
+
+
+def _install_signal_handlers():
+    """SIGTERM (docker stop, systemd) takes the same clean path as Ctrl+C; SIGHUP
+    (where the platform has it) asks the config watcher to reload config.yaml."""
+    def _on_term(signum, frame):
+        # No log() here: the handler runs on the main thread, which may be inside log()
+        # holding log_lock; the KeyboardInterrupt handler logs the signal instead
+        global _exit_signal
+        _exit_signal = signal.Signals(signum).name
+        raise KeyboardInterrupt
+    signal.signal(signal.SIGTERM, _on_term)
+    if hasattr(signal, 'SIGHUP'):
+        signal.signal(signal.SIGHUP, lambda signum, frame: config_reload_event.set())
+
+
+# ---------------- Live config reload ------------- #
+live_config = None                       # LiveConfig once main() has validated config.yaml
+config_reload_event = threading.Event()  # set by SIGHUP; the watcher thread does the reload
+_config_reload_lock = threading.Lock()
+# Sections applied by a reload; changes anywhere else are kept but need a restart to take effect
+_RELOADABLE_KEYS = frozenset({
+    'audio_webhooks', 'text_webhooks', 'webhook_retry', 'recording', 'shortcuts', 'tts', 'text_cleanup',
+    'access_key', 'wakeword_path', 'model_path', 'wakeword_sensitivity', 'config_reload', 'tracing',
+    'frame_budget',
+})
+_WAKE_KEYS = ('access_key', 'wakeword_path', 'model_path', 'wakeword_sensitivity')
+
+
+def reload_config(source):
+    """Re-read CONFIG_PATH and swap it in. A file that does not validate (or a wake word
+    engine that cannot be built from it) is rejected and the running config is kept.
+    Returns (ok, changed top-level keys or the error message)."""
+    global text_normalizer, _pending_porcupine, global_hotkeys_ready
+    with _config_reload_lock:
+        old = live_config.current
+        engine = None
+        normalizer = None
+        try:
+            new = RuntimeConfig.from_dict(_read_config_file(CONFIG_PATH))
+            changed = sorted(k for k in set(old.raw) | set(new.raw) if old.raw.get(k) != new.raw.get(k))
+            if 'text_cleanup' in changed:
+                try:
+                    normalizer = build_text_normalizer(new.get('text_cleanup'))
+                except Exception as e:
+                    raise ConfigError(f"text_cleanup: {e}") from None
+            if any(k in changed for k in _WAKE_KEYS):
+                for key in ('wakeword_path', 'model_path'):
+                    if not os.path.isfile(getattr(new, key)):
+                        raise ConfigError(f"{key}: file not found: {getattr(new, key)}")
+                try:
+                    engine = _create_porcupine(new)
+                except Exception as e:
+                    raise ConfigError(f"could not create Porcupine: {e}") from None
+        except ConfigError as e:
+            metric_inc('butlerbox_config_reloads_total', result='rejected')
+            with status_lock:
+                status['config_reload'] = f"{time.strftime('%H:%M:%S')} rejected ({source})"
+            log(f"⚠️ Config reload ({source}) rejected, keeping the running config: {e}", "WARNING",
+                event='config_reload', source=source, success=False, error=str(e))
+            return False, str(e)
+        if not changed:
+            log(f"🔄 Config reload ({source}): no changes.")
+            return True, []
+        live_config.swap(new)
+        if engine is not None:
+            with _pending_porcupine_lock:
+                stale, _pending_porcupine = _pending_porcupine, (engine, _keyword_name(new))
+            if stale is not None:
+                stale[0].delete()
+        if normalizer is not None:
+            text_normalizer = normalizer
+        try:
+            if 'tracing' in changed:
+                tracer.configure(new.get('tracing'))
+            if 'frame_budget' in changed:
+                frame_monitor.configure(new.get('frame_budget'))
+            if 'tts' in changed:
+                init_tts(new)  # re-resolves voice/rate and retires pooled engines
+                start_tts_worker(new)
+            if 'shortcuts' in changed:
+                if global_hotkeys_ready:
+                    try:
+                        keyboard.unhook_all_hotkeys()
+                    except Exception as e:
+                        log(f"⚠️ Could not remove global shortcuts: {e}")
+                    global_hotkeys_ready = False
+                register_global_shortcuts(new)
+        except Exception as e:  # validated above, so this is a bug or an environment failure
+            log(f"❌ Config reload ({source}) applied with errors: {e}", "ERROR")
+        metric_inc('butlerbox_config_reloads_total', result='ok')
+        with status_lock:
+            status['config_version'] = live_config.version
+            status['config_reload'] = f"{time.strftime('%H:%M:%S')} ok ({source})"
+        log(f"🔄 Config reloaded ({source}): {', '.join(changed)}", event='config_reload', source=source,
+            success=True, changed=changed)
+        restart = [k for k in changed if k not in _RELOADABLE_KEYS]
+        if restart:
+            log(f"ℹ️ Changes to {', '.join(restart)} take effect after a restart.")
+        publish_event('config_reloaded', source=source, changed=changed, restart_needed=restart)
+        return True, changed
+
+
+def _config_file_stamp():
+    try:
+        st = os.stat(CONFIG_PATH)
+        return st.st_mtime_ns, st.st_size
+    except OSError:
+        return None
+
+
+def _config_watcher():
+    """Reload on SIGHUP, and on config.yaml changes when config_reload.watch is on."""
+    stamp = _config_file_stamp()
+    while True:
+        reload_cfg = live_config.get('config_reload', {}) or {}
+        watch = bool(reload_cfg.get('watch', True))
+        poll = max(0.2, float(reload_cfg.get('poll_seconds', 2)))
+        signalled = config_reload_event.wait(poll if watch else None)
+        config_reload_event.clear()
+        current = _config_file_stamp()
+        source = None
+        if signalled:
+            stamp, source = current, 'SIGHUP'
+        elif watch and current is not None and current != stamp:
+            stamp, source = current, 'file change'  # a rejected edit is not retried until the file changes again
+        if source is None:
+            continue
+        try:
+            reload_config(source)
+        except Exception as e:  # keep watching: one bad edit must not end reloads
+            log(f"❌ Config reload ({source}) failed: {e}", "ERROR")
+
+
+def start_config_watcher():
+    threading.Thread(target=_config_watcher, name='config-watcher', daemon=True).start()
+
+
+def shutdown(cfg, ui_thread=None):
+    """Stop the UI and give in-flight uploads up to service.shutdown_timeout_seconds to finish."""
+    ui_stop_event.set()
+    if ui_thread is not None:
+        ui_thread.join(2)  # let Rich leave the alternate screen
+    service_cfg = cfg.get('service', {}) or {}
+    timeout = float(service_cfg.get('shutdown_timeout_seconds', 30))
+    with _upload_threads_lock:
+        uploads = list(_upload_threads)
+    if uploads:
+        log(f"⏳ Waiting up to {timeout:g}s for {len(uploads)} upload(s) to finish...")
+        deadline = time.monotonic() + timeout
+        for t in uploads:
+            t.join(max(0.0, deadline - time.monotonic()))
+        unfinished = sum(1 for t in uploads if t.is_alive())
+        if unfinished:
+            log(f"⚠️ {unfinished} upload(s) still running at shutdown; their recordings stay on disk.")
+    with pending_failed_uploads_lock:
+        failed = len(pending_failed_uploads)
+    if failed:
+        log(f"📌 {failed} failed upload(s) left on disk for retry.")
+
+
+def main(argv=None):
+    global text_normalizer, CONFIG_PATH, log_to_stdout, tts_starting, live_config
+    startup = _StartupTimer()
+    config_started = time.perf_counter()
+    args = _parse_args(argv)
+    CONFIG_PATH = args.config
+    try:
+        cfg = RuntimeConfig.from_dict(load_config())
+    except ConfigError as e:
+        log(f"CONFIG ERROR: {e}")
+        return EXIT_CONFIG
+    service_cfg = cfg.get('service', {}) or {}
+    headless = args.headless or bool(service_cfg.get('headless', False))
+    run_ui = RICH_AVAILABLE and not headless
+    if headless:
+        log_to_stdout = bool(service_cfg.get('log_stdout', True))
+    if run_ui:
+        _b.print = _safe_print  # Rich owns the screen: route stray prints into the log panel
+    text_normalizer = build_text_normalizer(cfg.get('text_cleanup'))
+    tracer.configure(cfg.get('tracing'))
+    frame_monitor.configure(cfg.get('frame_budget'))
     _init_file_logging(cfg)
+    _install_signal_handlers()
     log("Startup: validating config...")
-    access_key = cfg.get("access_key", "")
-    wakeword_path = cfg.get("wakeword_path")
-    model_path = cfg.get("model_path")
+    access_key = cfg.access_key
+    wakeword_path = cfg.wakeword_path
+    model_path = cfg.model_path
     if not access_key:
         log("CONFIG ERROR: access_key missing in config.yaml")
-        return
-    if isinstance(access_key, str) and access_key.startswith("YOUR_"):
+        return EXIT_CONFIG
+    if access_key.startswith("YOUR_"):
         log("CONFIG ERROR: Replace placeholder access_key in config.yaml with your real Picovoice Access Key from console.picovoice.ai (exiting early).")
-        return
+        return EXIT_CONFIG
     if not wakeword_path or not os.path.isfile(wakeword_path):
         log(f"CONFIG ERROR: wakeword_path not found: {wakeword_path}")
-        return
+        return EXIT_CONFIG
     if not model_path or not os.path.isfile(model_path):
         log(f"CONFIG ERROR: model_path not found: {model_path}")
-        return
+        return EXIT_CONFIG
+    startup.record('config', config_started)
+    live_config = cfg = LiveConfig(cfg)
+
+    def _speech():
+        try:
+            init_tts(cfg)
+            start_tts_worker(cfg)
+        finally:
+            tts_starting.set()
+
+    def _listener():
+        start_webhook_listener(cfg)
+        port = (cfg.get("webhook_listener", {}) or {}).get("port", 5000)
+        if not _wait_for_port(port, 5.0):
+            log(f"⚠️ Webhook listener not accepting connections on port {port} yet.")
+
+    ui_thread = None
+    code = EXIT_OK
+    try:
+        # Everything except the mic comes up on background threads; listening starts as
+        # soon as Porcupine and the input stream are ready.
+        log("Startup: TTS, sound cues, webhook listener" + ("" if headless else ", UI") + " in parallel with the mic...")
+        tts_starting = threading.Event()
+        background = [
+            startup.background('tts', _speech),
+            startup.background('cues', init_cue_player, cfg),
+            startup.background('listener', _listener),
+            startup.background('shortcuts', register_global_shortcuts, cfg),
+        ]
+        if run_ui:
+            ui_thread = threading.Thread(target=ui_loop, args=(cfg,), daemon=True)
+            ui_thread.start()
+        if msvcrt and not headless:
+            threading.Thread(target=keyboard_loop, args=(cfg,), daemon=True).start()
+        mic = startup.run('mic', open_mic, cfg)
+        if not isinstance(mic, dict):
+            return mic
+        startup.listening_at = time.perf_counter() - _IMPORT_STARTED
+        threading.Thread(target=startup.report_when_done, args=(background,), name='startup-report', daemon=True).start()
+        start_config_watcher()
+        log("Startup: entering listen loop (Ctrl+C to exit)")
+        code = listen_loop(cfg, mic)
+    except KeyboardInterrupt:
+        _log_exit()
+    finally:
+        shutdown(cfg, ui_thread)
+    # TTS worker is a daemon thread; it exits with the process.
+    return code
 
-    log("Startup: initializing TTS...")
-    init_tts(cfg)
-    register_global_shortcuts(cfg)
-    log("Startup: starting webhook listener + UI/keyboard threads...")
-    start_webhook_listener(cfg)
-    if RICH_AVAILABLE:
-        threading.Thread(target=ui_loop, args=(cfg,), daemon=True).start()
-    if msvcrt:
-        threading.Thread(target=keyboard_loop, args=(cfg,), daemon=True).start()
-    log("Startup: entering listen loop (Ctrl+C to exit)")
-    listen_loop(cfg)
-    # Per-call TTS threads will exit naturally; nothing to clean.
 
+_IMPORT_SECONDS = time.perf_counter() - _IMPORT_STARTED
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""Check and benchmark the ButlerBox TTS text normalizer.
+
+--check verifies the golden outputs in tools/samples/normalizer_golden.json and that,
+with default rules, the single-pass normalizer gives exactly what the previous
+six-pass cleanup_text gave on randomized inputs. Without --check it times both on
+large generated inputs.
+
+    python tools/bench_normalizer.py --check
+    python tools/bench_normalizer.py --sizes 10000 100000 1000000
+    python tools/bench_normalizer.py --rules emoji markdown numbers=pt
+"""
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import main as butlerbox  # noqa: E402
+
+GOLDEN = os.path.join(os.path.dirname(os.path.abspath(__file__)), "samples", "normalizer_golden.json")
+
+
+def legacy_cleanup_text(original):
+    """cleanup_text as it was before the single-pass normalizer (reference)."""
+    if not original:
+        return ''
+    text = original
+    text = re.sub(r'\[(.*?)\]\((https?://[^)]+)\)', r'\1', text)
+    text = re.sub(r'https?://\S+', ' ', text)
+    text = re.sub(r'www\.\S+', ' ', text)
+    text = re.sub(r'[\@\#\$%\^&\*_+=~`|<>\\\{\}\[\]]+', ' ', text)
+    text = re.sub(r'([!?.])\1{1,}', r'\1', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    return text
+
+
+_FUZZ_TOKENS = [
+    "a", "Olá", "mundo", "ok", " ", "  ", "\n", "\t", "\u00a0", ".", "..", "!", "!!", "?", "???", ",", ":",
+    "http://x.com", "https://a.b/c?d=1", "www.site.com", "www.", "http://", "www.http://y", "[", "]", "(", ")",
+    "[link](http://z.org)", "](", "@", "#", "$", "%", "^", "&", "*", "_", "+", "=", "~", "`", "|", "<", ">",
+    "\\", "{", "}", "é", "42", "3,5",
+]
+
+
+def fuzz_inputs(count, seed=1234):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield "".join(rng.choice(_FUZZ_TOKENS) for _ in range(rng.randint(0, 24)))
+
+
+def run_check(fuzz_count):
+    with open(GOLDEN, "r", encoding="utf-8") as f:
+        cases = json.load(f)
+    failures = 0
+    for case in cases:
+        normalizer = butlerbox.build_text_normalizer(case.get("rules"))
+        got = normalizer.normalize(case["input"])
+        if got != case["expected"]:
+            failures += 1
+            print(f"FAIL {case['name']}: expected {case['expected']!r}, got {got!r}")
+        if not case.get("rules") and legacy_cleanup_text(case["input"]) != case["expected"]:
+            failures += 1
+            print(f"FAIL {case['name']}: differs from legacy cleanup_text")
+    default = butlerbox.TextNormalizer()
+    for text in fuzz_inputs(fuzz_count):
+        want, got = legacy_cleanup_text(text), default.normalize(text)
+        if want != got:
+            failures += 1
+            print(f"FAIL fuzz {text!r}: legacy {want!r}, new {got!r}")
+            if failures > 20:
+                break
+    print(f"{len(cases)} golden cases, {fuzz_count} fuzz inputs: {'OK' if not failures else f'{failures} failure(s)'}")
+    return 0 if not failures else 1
+
+
+_PARAGRAPH = (
+    "## Resumo do dia\n\n"
+    "Claro! Aqui está o que encontrei sobre o assunto 🙂. Segundo o artigo "
+    "[Energia solar em casa](https://example.com/solar?utm=feed) o custo médio caiu 12,5 por cento "
+    "desde 2021... Veja também www.exemplo.com.br/guia para detalhes!!!\n"
+    "- **Painéis**: entre 4 e 12 unidades\n- *Inversor*: 1 por instalação\n\n"
+    "```python\nprint('ok')\n```\n"
+    "Quer que eu envie o link completo?? Posso também resumir os pontos principais.   \n\n"
+)
+
+
+_PROSE = (
+    "O relatório de energia da semana está pronto. O consumo total foi um pouco menor que na semana "
+    "passada, e o maior gasto continua sendo o ar-condicionado do escritório. Programar o desligamento "
+    "automático no fim da tarde pode economizar mais, sem perder conforto. Quer que eu configure isso?\n"
+)
+
+PROFILES = {"llm": _PARAGRAPH, "prose": _PROSE}
+
+
+def make_input(size, profile="llm"):
+    unit = PROFILES[profile]
+    return (unit * (size // len(unit) + 1))[:size]
+
+
+def _best_of(fn, text, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _parse_rules(items):
+    cfg = {}
+    for item in items or []:
+        name, _, value = item.partition("=")
+        cfg[name] = value or True
+    return cfg
+
+
+def run_bench(sizes, repeat, rules, profiles):
+    normalizer = butlerbox.build_text_normalizer(rules)
+    label = ", ".join(f"{k}={v}" if v is not True else k for k, v in rules.items()) or "default rules"
+    print(f"TextNormalizer ({label}) vs legacy six-pass cleanup_text, best of {repeat}")
+    results = []
+    for profile in profiles:
+        for size in sizes:
+            text = make_input(size, profile)
+            legacy = _best_of(legacy_cleanup_text, text, repeat)
+            new = _best_of(normalizer.normalize, text, repeat)
+            mb = size / 1e6
+            results.append({"profile": profile, "chars": size, "legacy_ms": round(legacy * 1000, 3),
+                            "new_ms": round(new * 1000, 3), "speedup": round(legacy / new, 2) if new else None})
+            print(f"  {profile:>5} {size:>9} chars: legacy {legacy * 1000:8.2f}ms ({mb / legacy:6.1f} MB/s)"
+                  f"  new {new * 1000:8.2f}ms ({mb / new:6.1f} MB/s)  x{legacy / new:.2f}")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="verify golden outputs and legacy equivalence")
+    parser.add_argument("--fuzz", type=int, default=5000, help="randomized inputs compared with legacy (--check)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000, 1000000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--profile", nargs="+", choices=sorted(PROFILES), default=["llm", "prose"],
+                        help="input shape: llm (markdown, links, emoji, numbers) or prose (plain sentences)")
+    parser.add_argument("--rules", nargs="*", help="optional rules for the benchmark: emoji markdown numbers=pt|en")
+    parser.add_argument("--json", dest="json_path", help="write benchmark results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        return run_check(args.fuzz)
+    results = run_bench(args.sizes, args.repeat, _parse_rules(args.rules), args.profile)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+"""Benchmark ButlerBox TTS backends on a text corpus.
+
+For each backend: instance open time, then per utterance the synthesize latency and
+real-time factor (synthesis time / audio duration); with --speak also the blocking
+speak time. Uses the same backend classes and tts.* options as the app.
+
+--pipeline instead compares long replies rendered whole vs. through the app's sentence
+pipeline (render N+1 while N plays): time to first audio and gaps between sentences.
+Playback is simulated by waiting for each WAV's duration (divided by --speed) unless
+--play is given; the null backend defaults to 5 ms/char here so a run takes seconds.
+
+    python tools/bench_tts.py --backend null --backend espeak
+    python tools/bench_tts.py --backend sapi5 --config config.yaml --speak
+    python tools/bench_tts.py --backend null --json bench.json
+    python tools/bench_tts.py --backend espeak --pipeline --lookahead 2
+    python tools/bench_tts.py --backend espeak --pipeline --speed 4   # faster, but less time to render ahead
+"""
+import argparse
+import io
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+import wave
+
+import yaml
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import main as butlerbox  # noqa: E402
+
+SAMPLES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "samples")
+DEFAULT_CORPUS = os.path.join(SAMPLES, "tts_corpus.txt")
+DEFAULT_REPLIES = os.path.join(SAMPLES, "tts_long_replies.txt")
+
+
+def load_corpus(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [ln.strip() for ln in f if ln.strip() and not ln.lstrip().startswith("#")]
+
+
+def wav_seconds(data):
+    try:
+        with wave.open(io.BytesIO(data), "rb") as wf:
+            return wf.getnframes() / float(wf.getframerate() or 1)
+    except (wave.Error, EOFError):
+        return 0.0
+
+
+def _pct(values, p):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(p / 100.0 * (len(values) - 1))))]
+
+
+def _summary(values):
+    if not values:
+        return None
+    return {
+        "mean_ms": round(statistics.mean(values) * 1000, 1),
+        "p50_ms": round(_pct(values, 50) * 1000, 1),
+        "p95_ms": round(_pct(values, 95) * 1000, 1),
+        "max_ms": round(max(values) * 1000, 1),
+    }
+
+
+def bench_backend(name, tts_cfg, corpus, speak):
+    cls = butlerbox.TTS_BACKENDS[name]
+    cls.prepare()
+    backend = butlerbox.create_tts_backend(name, tts_cfg)
+    t0 = time.monotonic()
+    backend.open()
+    open_s = time.monotonic() - t0
+    try:
+        chosen = butlerbox._match_voice(backend.list_voices(), tts_cfg.get("voice_name"), tts_cfg.get("voice_index"))
+        backend.set_voice(chosen[0] if chosen else None, tts_cfg.get("rate"))
+        synth, rtf, spoken = [], [], []
+        audio_total = 0.0
+        for text in corpus:
+            t0 = time.monotonic()
+            data = backend.synthesize(text)
+            elapsed = time.monotonic() - t0
+            if data:
+                synth.append(elapsed)
+                audio = wav_seconds(data)
+                audio_total += audio
+                if audio > 0:
+                    rtf.append(elapsed / audio)
+            if speak:
+                t0 = time.monotonic()
+                backend.speak(text)
+                spoken.append(time.monotonic() - t0)
+    finally:
+        backend.close()
+    return {
+        "backend": name,
+        "utterances": len(corpus),
+        "open_ms": round(open_s * 1000, 1),
+        "voice": chosen[1] if chosen else None,
+        "synthesize": _summary(synth),
+        "synthesize_supported": bool(synth),
+        "audio_seconds": round(audio_total, 2),
+        "rtf_mean": round(statistics.mean(rtf), 3) if rtf else None,
+        "speak": _summary(spoken),
+    }
+
+
+def bench_pipeline(name, tts_cfg, replies, lookahead, play_audio, speed=1.0):
+    """Whole-reply rendering vs. the sentence pipeline, on the app's own pipeline code."""
+    butlerbox.TTS_BACKENDS[name].prepare()
+    butlerbox.tts_pool = butlerbox._BackendPool(name, tts_cfg, 2)
+    butlerbox.tts_rate = tts_cfg.get("rate")
+    butlerbox._tts_pipeline.update(max_sentence_chars=int((tts_cfg.get("pipeline") or {}).get("max_sentence_chars", 300)))
+    threading.Thread(target=butlerbox._tts_synth_worker, name="tts-synth", daemon=True).start()
+
+    def play(text, data):
+        if not data:
+            return
+        if play_audio and butlerbox._play_wav_bytes(data):
+            return
+        time.sleep(wav_seconds(data) / speed)
+
+    backend = butlerbox.tts_pool.acquire()
+    try:
+        chosen = butlerbox._match_voice(backend.list_voices(), tts_cfg.get("voice_name"), tts_cfg.get("voice_index"))
+        butlerbox.tts_voice_id = chosen[0] if chosen else None
+        backend.set_voice(butlerbox.tts_voice_id, butlerbox.tts_rate)
+        whole_first, piped_first, gaps, counts = [], [], [], []
+        for i, text in enumerate(replies, 1):
+            t0 = time.monotonic()
+            data = backend.synthesize(text)
+            if data is None:
+                raise RuntimeError("backend cannot synthesize to a buffer")
+            whole_first.append(time.monotonic() - t0)
+            play(text, data)
+
+            splitter = butlerbox._SentenceSplitter(butlerbox._tts_pipeline["max_sentence_chars"])
+            sentences = splitter.feed(text) + splitter.flush()
+            timings = butlerbox._speak_pipelined(sentences, butlerbox._pipeline_synthesize, play,
+                                                 lookahead=lookahead, run=butlerbox._tts_synth_jobs.put)
+            piped_first.append(timings["first_audio"])
+            gaps.extend(timings["gaps"])
+            counts.append(timings["sentences"])
+            print(f"   reply {i}/{len(replies)}: {len(text)} chars, {timings['sentences']} sentences,"
+                  f" first audio whole {whole_first[-1] * 1000:.0f}ms / pipelined {timings['first_audio'] * 1000:.0f}ms",
+                  flush=True)
+    finally:
+        butlerbox.tts_pool.release(backend)
+    return {
+        "backend": name,
+        "replies": len(replies),
+        "sentences": sum(counts),
+        "lookahead": lookahead,
+        "whole_first_audio": _summary(whole_first),
+        "pipelined_first_audio": _summary(piped_first),
+        "sentence_gap": _summary(gaps),
+    }
+
+
+def _print_pipeline(result):
+    print(f"== {result['backend']} pipeline ({result['replies']} replies, {result['sentences']} sentences,"
+          f" lookahead {result['lookahead']})")
+    for label, key in (("first audio, whole", "whole_first_audio"),
+                       ("first audio, pipelined", "pipelined_first_audio"),
+                       ("gap between sentences", "sentence_gap")):
+        s = result[key]
+        if s:
+            print(f"   {label}: mean {s['mean_ms']}ms p50 {s['p50_ms']}ms p95 {s['p95_ms']}ms max {s['max_ms']}ms")
+
+
+def _print(result):
+    print(f"== {result['backend']} ({result['utterances']} utterances, voice: {result['voice'] or 'default'})")
+    print(f"   open: {result['open_ms']}ms")
+    s = result["synthesize"]
+    if s:
+        print(f"   synthesize: mean {s['mean_ms']}ms p50 {s['p50_ms']}ms p95 {s['p95_ms']}ms max {s['max_ms']}ms"
+              f" | audio {result['audio_seconds']}s, RTF {result['rtf_mean']}")
+    else:
+        print("   synthesize: not supported")
+    if result["speak"]:
+        s = result["speak"]
+        print(f"   speak: mean {s['mean_ms']}ms p50 {s['p50_ms']}ms p95 {s['p95_ms']}ms max {s['max_ms']}ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backend", action="append", choices=sorted(butlerbox.TTS_BACKENDS),
+                        help="backend to benchmark (repeatable; default: null)")
+    parser.add_argument("--corpus", help="text file, one utterance (or reply, with --pipeline) per line")
+    parser.add_argument("--config", help="config.yaml to take tts.* options (voice, rate, backend options) from")
+    parser.add_argument("--speak", action="store_true", help="also time blocking speak() (plays audio)")
+    parser.add_argument("--pipeline", action="store_true", help="measure first audio / sentence gaps on long replies")
+    parser.add_argument("--lookahead", type=int, default=2, help="sentences rendered ahead of playback (--pipeline)")
+    parser.add_argument("--play", action="store_true", help="really play audio in --pipeline mode")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="simulated playback speed-up in --pipeline mode (default 1 = real time)")
+    parser.add_argument("--json", dest="json_path", help="write results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    tts_cfg = {}
+    if args.config:
+        with open(args.config, "r", encoding="utf-8") as f:
+            tts_cfg = (yaml.safe_load(f) or {}).get("tts") or {}
+    corpus = load_corpus(args.corpus or (DEFAULT_REPLIES if args.pipeline else DEFAULT_CORPUS))
+    results = []
+    for name in args.backend or ["null"]:
+        try:
+            if args.pipeline:
+                backend_cfg = tts_cfg
+                if name == "null" and not (tts_cfg.get("null") or {}).get("ms_per_char"):
+                    backend_cfg = {**tts_cfg, "null": {**(tts_cfg.get("null") or {}), "ms_per_char": 5}}
+                print(f"== {name} pipeline: {len(corpus)} replies ...", flush=True)
+                result = bench_pipeline(name, backend_cfg, corpus, args.lookahead, args.play, max(0.01, args.speed))
+            else:
+                result = bench_backend(name, tts_cfg, corpus, args.speak)
+        except Exception as e:
+            print(f"== {name}: unavailable ({e})")
+            continue
+        results.append(result)
+        (_print_pipeline if args.pipeline else _print)(result)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+    return 0 if results else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""Benchmark the ButlerBox console UI: full redraw every tick vs. render-on-change.
+
+Drives the app's own _TUIRenderer against an off-screen Rich console (same Live
+settings as ui_loop) for a fixed number of ticks per scenario and reports, per mode,
+frames actually drawn, wall time per tick and CPU time per tick, plus the CPU share
+that works out to at the UI tick rate.
+
+Scenarios:
+  idle     nothing changes between ticks
+  logs     one new log line per tick
+  typing   one keystroke per tick in the shell
+  busy     a log line and a status counter change every tick
+  marquee  idle, but the output device name is too wide and scrolls
+
+    python tools/bench_tui.py
+    python tools/bench_tui.py --ticks 400 --size 200x60 --scenario idle --scenario logs
+    python tools/bench_tui.py --json bench_tui.json
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import time
+
+from rich.console import Console
+from rich.live import Live
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import main as butlerbox  # noqa: E402
+
+SCENARIOS = ("idle", "logs", "typing", "busy", "marquee")
+MODES = ("full", "incremental")
+
+
+def _reset_state(scenario):
+    butlerbox.log_buffer.clear()
+    for i in range(butlerbox.LOG_LIMIT):
+        butlerbox.log(f"warm-up line {i} " + "x" * (i % 60))
+    with butlerbox.command_lock:
+        butlerbox.command_mode = None
+        butlerbox.command_buffer = []
+    with butlerbox.status_lock:
+        butlerbox.status['input_device'] = "USB Microphone"
+        if scenario == "marquee":
+            butlerbox.status['output_device'] = "Speakers (High Definition Audio Device With A Long Name) [WASAPI]"
+        else:
+            butlerbox.status['output_device'] = "Speakers"
+
+
+def _step(scenario, i):
+    if scenario in ("logs", "busy"):
+        butlerbox.log(f"🔔 event {i}")
+    if scenario == "busy":
+        with butlerbox.status_lock:
+            butlerbox.status['msgs_received'] += 1
+    if scenario == "typing":
+        with butlerbox.command_lock:
+            butlerbox.command_mode = 'send_text'
+            butlerbox.command_buffer.append("abcdefghij"[i % 10])
+            butlerbox.command_version += 1
+
+
+def run(scenario, mode, ticks, width, height, interval, cfg):
+    out = io.StringIO()
+    butlerbox.console = Console(file=out, width=width, height=height, force_terminal=True,
+                                color_system="truecolor", legacy_windows=False)
+    _reset_state(scenario)
+    renderer = butlerbox._TUIRenderer(cfg)
+    force = mode == "full"
+    drawn = 0
+    with Live(renderer.layout, console=butlerbox.console, auto_refresh=False, screen=True,
+              redirect_stdout=False, redirect_stderr=False) as live:
+        draw = lambda layout: live.update(layout, refresh=True)
+        renderer.tick(draw, force)  # first frame is always drawn; not measured
+        wall0, cpu0 = time.perf_counter(), time.process_time()
+        for i in range(ticks):
+            _step(scenario, i)
+            drawn += renderer.tick(draw, force)
+        wall, cpu = time.perf_counter() - wall0, time.process_time() - cpu0
+    return {
+        "scenario": scenario,
+        "mode": mode,
+        "ticks": ticks,
+        "frames_drawn": drawn,
+        "wall_ms_per_tick": round(wall * 1000 / ticks, 3),
+        "cpu_ms_per_tick": round(cpu * 1000 / ticks, 3),
+        "cpu_pct_at_tick_rate": round(cpu * 100 / (ticks * interval), 2),
+        "output_bytes": len(out.getvalue()),
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--ticks", type=int, default=200)
+    ap.add_argument("--size", default="160x48", help="terminal WIDTHxHEIGHT (default 160x48)")
+    ap.add_argument("--interval", type=float, default=0.15, help="UI tick interval used for the CPU %% column")
+    ap.add_argument("--scenario", action="append", choices=SCENARIOS, help="repeatable; default all")
+    ap.add_argument("--json", help="also write results to this file")
+    args = ap.parse_args()
+    width, height = (int(v) for v in args.size.lower().split("x"))
+    butlerbox.ui_started = True  # keep log() from echoing to stdout
+    cfg = butlerbox.RuntimeConfig.from_dict(
+        {"shortcuts": {"start_recording": "ctrl+s", "abort_recording": "ctrl+a", "finalize_recording": "ctrl+f"}})
+    results = []
+    print(f"{'scenario':<9} {'mode':<12} {'drawn':>7} {'wall ms/tick':>13} {'cpu ms/tick':>12} {'cpu %':>7}")
+    for scenario in args.scenario or SCENARIOS:
+        for mode in MODES:
+            r = run(scenario, mode, args.ticks, width, height, args.interval, cfg)
+            results.append(r)
+            print(f"{scenario:<9} {mode:<12} {r['frames_drawn']:>4}/{args.ticks:<3}"
+                  f"{r['wall_ms_per_tick']:>13.3f} {r['cpu_ms_per_tick']:>12.3f} {r['cpu_pct_at_tick_rate']:>7.2f}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""Benchmark ButlerBox webhook delivery (retry + failover) against the local stub server.
+
+Drives the app's own send_to_any_webhook (audio: multipart WAV upload through
+send_to_webhook_with_retry) and send_text_to_webhooks (text JSON) against
+tools/webhook_stub.py scenarios, N deliveries at a given concurrency, and reports
+per scenario and kind:
+
+  deliveries/s    completed deliveries per second of wall time
+  ok %            deliveries that some webhook accepted
+  p50 / p99 ms    delivery latency (first attempt to final answer, retries included)
+  att/ok          webhook requests the stub saw per successful delivery
+  threads         peak thread count in the process during the run
+
+Retry delays are shortened (--base-delay, --max-delay) so runs stay quick; compare
+runs with the same settings.
+
+    python tools/bench_webhooks.py
+    python tools/bench_webhooks.py --scenario flaky --scenario failover --deliveries 400 --concurrency 16
+    python tools/bench_webhooks.py --kind audio --json bench_webhooks.json
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import main as butlerbox  # noqa: E402
+from webhook_stub import SCENARIOS, StubServer  # noqa: E402
+
+KINDS = ("audio", "text")
+
+
+def _percentile(ordered, q):
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))] if ordered else None
+
+
+def _wav(seconds):
+    fd, path = tempfile.mkstemp(suffix=".wav", prefix="butlerbox_bench_")
+    os.close(fd)
+    butlerbox.write_wave(path, 16000, b"\x00\x00" * int(16000 * seconds))
+    return path
+
+
+class _ThreadPeak:
+    def __init__(self, interval=0.01):
+        self.peak = threading.active_count()
+        self._stop = threading.Event()
+        self._interval = interval
+
+    def __enter__(self):
+        threading.Thread(target=self._run, daemon=True).start()
+        return self
+
+    def _run(self):
+        while not self._stop.wait(self._interval):
+            self.peak = max(self.peak, threading.active_count())
+
+    def __exit__(self, *exc):
+        self._stop.set()
+
+
+def run(scenario, kind, deliveries, concurrency, retry, wav_path, seed):
+    spec = SCENARIOS[scenario]
+    stub = StubServer(spec["rules"], seed=seed).start()
+    targets = [{"url": stub.base_url + t, "timeout_seconds": 5} for t in spec["targets"]]
+    cfg = butlerbox.RuntimeConfig.from_dict({
+        "audio_webhooks": targets, "text_webhooks": targets, "webhook_retry": retry,
+    })
+
+    def _deliver(i):
+        t0 = time.perf_counter()
+        if kind == "audio":
+            ok = butlerbox.send_to_any_webhook(wav_path, cfg)
+        else:
+            ok = butlerbox.send_text_to_webhooks(f"benchmark message {i}", cfg)
+        return ok, time.perf_counter() - t0
+
+    with _ThreadPeak() as threads, ThreadPoolExecutor(max_workers=concurrency) as pool:
+        started = time.perf_counter()
+        results = list(pool.map(_deliver, range(deliveries)))
+        wall = time.perf_counter() - started
+    stub.stop()
+    ok_count = sum(1 for ok, _ in results if ok)
+    latencies = sorted(s for _, s in results)
+    requests_seen = sum(v for k, v in stub.counts.items() if isinstance(k, str))
+    return {
+        "scenario": scenario,
+        "kind": kind,
+        "deliveries": deliveries,
+        "concurrency": concurrency,
+        "deliveries_per_second": round(deliveries / wall, 1),
+        "ok_pct": round(ok_count * 100 / deliveries, 1),
+        "p50_ms": round(_percentile(latencies, 0.50) * 1000, 1),
+        "p99_ms": round(_percentile(latencies, 0.99) * 1000, 1),
+        "attempts_per_success": round(requests_seen / ok_count, 2) if ok_count else None,
+        "peak_threads": threads.peak,
+        "stub_counts": {str(k): v for k, v in sorted(stub.counts.items(), key=str)},
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="repeatable; default all")
+    ap.add_argument("--kind", action="append", choices=KINDS, help="repeatable; default audio and text")
+    ap.add_argument("--deliveries", type=int, default=200)
+    ap.add_argument("--concurrency", type=int, default=8)
+    ap.add_argument("--attempts", type=int, default=3, help="webhook_retry.max_attempts")
+    ap.add_argument("--base-delay", type=float, default=0.05, help="webhook_retry.base_delay_seconds")
+    ap.add_argument("--max-delay", type=float, default=0.5, help="webhook_retry.max_delay_seconds")
+    ap.add_argument("--wav-seconds", type=float, default=5.0, help="size of the uploaded recording")
+    ap.add_argument("--seed", type=int, default=1, help="stub randomness (status, drops, latency)")
+    ap.add_argument("--json", help="also write results to this file")
+    args = ap.parse_args(argv)
+    butlerbox.ui_started = True  # keep log() from echoing to stdout
+    butlerbox.tracer.configure({"enabled": False})
+    retry = {"max_attempts": args.attempts, "base_delay_seconds": args.base_delay,
+             "max_delay_seconds": args.max_delay, "backoff_factor": 2.0, "jitter": True}
+    wav_path = _wav(args.wav_seconds)
+    results = []
+    print(f"{'scenario':<10} {'kind':<6} {'deliv/s':>8} {'ok %':>6} {'p50 ms':>8} {'p99 ms':>8} {'att/ok':>7} {'threads':>8}")
+    try:
+        for scenario in args.scenario or sorted(SCENARIOS):
+            for kind in args.kind or KINDS:
+                r = run(scenario, kind, args.deliveries, args.concurrency, retry, wav_path, args.seed)
+                results.append(r)
+                att = f"{r['attempts_per_success']:.2f}" if r["attempts_per_success"] is not None else "-"
+                print(f"{scenario:<10} {kind:<6} {r['deliveries_per_second']:>8.1f} {r['ok_pct']:>6.1f} "
+                      f"{r['p50_ms']:>8.1f} {r['p99_ms']:>8.1f} {att:>7} {r['peak_threads']:>8}")
+    finally:
+        os.remove(wav_path)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
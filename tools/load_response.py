@@ -0,0 +1,349 @@
+"""Load-test the ButlerBox inbound /response listener.
+
+Each serving mode runs the app's own start_webhook_listener in a child process with the
+silent ``null`` TTS backend as a timing sink (it "speaks" at --ms-per-char and logs each
+call), so the inbound queue fills and drains the way it does on a real box. The load
+generator posts a text mix at each target rate (open loop: requests are scheduled on a
+fixed clock, so a slow server shows up as latency instead of a lower send rate) and
+samples the child's /health queue depth, thread count and RSS while it runs.
+
+Per mode and rate it reports sent and accepted per second, accept latency p50/p95/p99
+(scheduled send -> HTTP answer), response codes, peak queue depth, peak threads, peak RSS
+and how much was spoken. --json writes those plus the samples over time and run metadata,
+for tracking across releases.
+
+Modes: ``flask`` (dev server, threaded), ``waitress`` and ``waitress:N`` (N WSGI threads).
+Mix classes: short, medium, long, blank (answers 204) and alert (priority alert).
+
+    python tools/load_response.py
+    python tools/load_response.py --mode flask --mode waitress:8 --rate 20 --rate 100 --duration 10
+    python tools/load_response.py --mix short=8,long=2 --config config.yaml --json load.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+try:
+    import psutil  # type: ignore
+except ImportError:
+    psutil = None
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.join(TOOLS_DIR, "..")
+sys.path.insert(0, REPO_DIR)
+
+MIX_TEXT = {
+    "short": ["Done.", "Okay, the lights are off.", "Timer set for ten minutes."],
+    "medium": ["Your next meeting is at three with the design team, and the room is already booked.",
+               "I added milk, eggs and coffee to the shopping list; the list now has nine items."],
+    "blank": ["   "],
+    "alert": ["Warning: the front door has been open for five minutes."],
+}
+DEFAULT_MIX = "short=6,medium=3,long=1"
+
+
+def _long_texts():
+    path = os.path.join(TOOLS_DIR, "samples", "tts_long_replies.txt")
+    with open(path, "r", encoding="utf-8") as f:
+        texts = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    return texts or MIX_TEXT["medium"]
+
+
+def parse_mix(spec):
+    """``short=6,long=1`` -> [(class, weight)]."""
+    mix = []
+    for part in spec.split(","):
+        name, _, weight = part.strip().partition("=")
+        if name not in MIX_TEXT and name != "long":
+            raise SystemExit(f"unknown mix class '{name}' (short, medium, long, blank, alert)")
+        mix.append((name, float(weight or 1)))
+    return mix
+
+
+def _free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _percentile(ordered, q):
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))] if ordered else None
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 1) if seconds is not None else None
+
+
+# ---------------- Child: the listener under test ---------------- #
+
+def serve(child_cfg):
+    """Run in the child process: start TTS (null backend) and the listener, print the port
+    once it accepts connections, then serve until stdin closes."""
+    import main as butlerbox
+    ready_out, sys.stdout = sys.stdout, sys.stderr  # stdout is for the ready line only (Flask prints a banner)
+    butlerbox.ui_started = True  # keep log() from echoing
+    butlerbox.tracer.configure(child_cfg.get("tracing", {"enabled": False}))
+    butlerbox.init_tts(child_cfg)
+    butlerbox.start_tts_worker(child_cfg)
+    butlerbox.start_webhook_listener(child_cfg)
+    port = child_cfg["webhook_listener"]["port"]
+    if not butlerbox._wait_for_port(port, 10.0):
+        print("failed", file=ready_out, flush=True)
+        return 1
+    print(f"ready {os.getpid()}", file=ready_out, flush=True)
+    sys.stdin.read()
+    return 0
+
+
+def _child_config(base_cfg, mode, port, sink_path, ms_per_char):
+    server, _, threads = mode.partition(":")
+    listener = dict(base_cfg.get("webhook_listener") or {})
+    listener.update({"host": "127.0.0.1", "port": port, "server": server,
+                     "self_test": False, "waitress_fallback": False})
+    if threads:
+        listener["threads"] = int(threads)
+    tts = dict(base_cfg.get("tts") or {})
+    tts.update({"enabled": True, "backend": "null", "output": "engine", "pipeline": {"enabled": False},
+                "null": {"ms_per_char": ms_per_char, "realtime": True, "sink_path": sink_path}})
+    return {**base_cfg, "webhook_listener": listener, "tts": tts,
+            "tracing": base_cfg.get("tracing", {"enabled": False})}
+
+
+class _Child:
+    """One listener process on a free port, with its own TTS sink file."""
+
+    def __init__(self, base_cfg, mode, ms_per_char):
+        self.mode = mode
+        self._dir = tempfile.mkdtemp(prefix="butlerbox_load_")
+        self.sink_path = os.path.join(self._dir, "tts_sink.jsonl")
+        port = _free_port()
+        child_cfg = _child_config(base_cfg, mode, port, self.sink_path, ms_per_char)
+        listener = child_cfg["webhook_listener"]
+        self.url = f"http://127.0.0.1:{port}{listener.get('endpoint', '/response')}"
+        self.health_url = f"http://127.0.0.1:{port}{listener.get('health_endpoint', '/health')}"
+        self.proc = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), "--serve", json.dumps(child_cfg)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, cwd=REPO_DIR)
+        line = self.proc.stdout.readline().split()
+        if not line or line[0] != "ready":
+            self.stop()
+            raise SystemExit(f"listener ({mode}) did not start")
+        self.pid = int(line[1])
+
+    def resources(self):
+        """(threads, rss MB) of the child, or (None, None) where neither psutil nor /proc exists."""
+        if psutil is not None:
+            try:
+                p = psutil.Process(self.pid)
+                return p.num_threads(), round(p.memory_info().rss / 1048576, 1)
+            except Exception:
+                return None, None
+        threads = rss = None
+        try:
+            with open(f"/proc/{self.pid}/status", "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith("Threads:"):
+                        threads = int(line.split()[1])
+                    elif line.startswith("VmRSS:"):
+                        rss = round(int(line.split()[1]) / 1024, 1)
+        except OSError:
+            pass
+        return threads, rss
+
+    def stop(self):
+        try:
+            self.proc.stdin.close()
+            self.proc.wait(timeout=5)
+        except Exception:
+            self.proc.kill()
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+
+# ---------------- Parent: load generator ---------------- #
+
+class _Sampler:
+    """Polls /health and the child's threads/RSS every ``interval`` seconds."""
+
+    def __init__(self, child, interval, started):
+        self.child = child
+        self.interval = interval
+        self.started = started
+        self.samples = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        session = requests.Session()
+        while not self._stop.wait(self.interval):
+            depth = None
+            try:
+                depth = session.get(self.child.health_url, timeout=1).json().get("inbound_queue_depth")
+            except Exception:
+                pass
+            threads, rss = self.child.resources()
+            self.samples.append({"t": round(time.perf_counter() - self.started, 2),
+                                 "queue_depth": depth, "threads": threads, "rss_mb": rss})
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def peak(self, key):
+        values = [s[key] for s in self.samples if s[key] is not None]
+        return max(values) if values else None
+
+
+def _sink_totals(path):
+    count, seconds = 0, 0.0
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                rec = json.loads(line)
+                if rec.get("op") == "speak":
+                    count += 1
+                    seconds += rec.get("seconds", 0)
+    return count, seconds
+
+
+def run_rate(child, rate, duration, texts, clients, timeout, sample_interval, rng):
+    local = threading.local()
+    results = []  # (code, seconds from scheduled send to answer)
+    results_lock = threading.Lock()
+
+    def _post(scheduled, payload):
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+        try:
+            code = session.post(child.url, json=payload, timeout=timeout).status_code
+        except requests.Timeout:
+            code = "timeout"
+        except requests.RequestException:
+            code = "conn_error"
+        elapsed = time.perf_counter() - scheduled
+        with results_lock:
+            results.append((code, elapsed))
+
+    total = int(rate * duration)
+    started = time.perf_counter()
+    with _Sampler(child, sample_interval, started) as sampler, \
+            ThreadPoolExecutor(max_workers=clients) as pool:
+        for i in range(total):
+            scheduled = started + i / rate
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            cls, text = texts(rng)
+            payload = {"text": text}
+            if cls == "alert":
+                payload["priority"] = "alert"
+            pool.submit(_post, scheduled, payload)
+    wall = time.perf_counter() - started
+    spoken, speak_s = _sink_totals(child.sink_path)
+    codes = Counter(str(c) for c, _ in results)
+    accepted = sorted(s for c, s in results if c in (200, 204))
+    latencies = sorted(s for _, s in results)
+    return {
+        "rate": rate,
+        "sent": total,
+        "wall_seconds": round(wall, 2),
+        "sent_per_second": round(total / wall, 1),
+        "accepted_per_second": round(len(accepted) / wall, 1),
+        "codes": dict(sorted(codes.items())),
+        "latency_ms": {"p50": _ms(_percentile(latencies, 0.50)), "p95": _ms(_percentile(latencies, 0.95)),
+                       "p99": _ms(_percentile(latencies, 0.99)), "max": _ms(latencies[-1] if latencies else None)},
+        "peak_queue_depth": sampler.peak("queue_depth"),
+        "peak_threads": sampler.peak("threads"),
+        "peak_rss_mb": sampler.peak("rss_mb"),
+        "spoken": spoken,
+        "speak_seconds": round(speak_s, 2),
+        "samples": sampler.samples,
+    }
+
+
+def _meta(args):
+    try:
+        commit = subprocess.run(["git", "describe", "--always", "--dirty"], cwd=REPO_DIR,
+                                capture_output=True, text=True, timeout=5).stdout.strip() or None
+    except Exception:
+        commit = None
+    return {"tool": "load_response", "schema": 1, "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "commit": commit, "python": platform.python_version(), "platform": platform.platform(),
+            "duration_seconds": args.duration, "clients": args.clients, "mix": args.mix,
+            "ms_per_char": args.ms_per_char}
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--mode", action="append", help="flask, waitress or waitress:N (repeatable; default flask and waitress)")
+    ap.add_argument("--rate", action="append", type=float, help="requests/s (repeatable; default 10, 50, 200)")
+    ap.add_argument("--duration", type=float, default=5.0, help="seconds per rate")
+    ap.add_argument("--mix", default=DEFAULT_MIX, help=f"weighted text classes (default {DEFAULT_MIX})")
+    ap.add_argument("--clients", type=int, default=64, help="concurrent client connections")
+    ap.add_argument("--timeout", type=float, default=10.0, help="per-request timeout")
+    ap.add_argument("--ms-per-char", type=float, default=60.0, help="simulated speech speed of the null backend")
+    ap.add_argument("--config", help="config.yaml whose webhook_listener (queue size, workers, dedup, rate "
+                                     "limit) and tts sections are used; host, port, server and backend are overridden")
+    ap.add_argument("--sample-interval", type=float, default=0.25)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--json", help="also write results to this file")
+    ap.add_argument("--serve", help=argparse.SUPPRESS)  # child mode: JSON config
+    args = ap.parse_args(argv)
+    if args.serve:
+        return serve(json.loads(args.serve))
+
+    base_cfg = {}
+    if args.config:
+        import yaml
+        with open(args.config, "r", encoding="utf-8") as f:
+            base_cfg = yaml.safe_load(f) or {}
+    mix = parse_mix(args.mix)
+    long_texts = _long_texts()
+
+    def texts(rng):
+        cls = rng.choices([c for c, _ in mix], [w for _, w in mix])[0]
+        return cls, rng.choice(long_texts if cls == "long" else MIX_TEXT[cls])
+
+    results = []
+    print(f"{'mode':<11} {'rate':>6} {'sent/s':>7} {'ok/s':>7} {'p50 ms':>8} {'p99 ms':>8} "
+          f"{'queue':>6} {'threads':>8} {'rss MB':>7}  codes")
+    for mode in args.mode or ["flask", "waitress"]:
+        for rate in args.rate or [10.0, 50.0, 200.0]:
+            child = _Child(base_cfg, mode, args.ms_per_char)  # fresh per rate: no backlog carried over
+            try:
+                r = run_rate(child, rate, args.duration, texts, args.clients, args.timeout,
+                             args.sample_interval, random.Random(args.seed))
+            finally:
+                child.stop()
+            r["mode"] = mode
+            results.append(r)
+            lat = r["latency_ms"]
+            print(f"{mode:<11} {rate:>6g} {r['sent_per_second']:>7.1f} {r['accepted_per_second']:>7.1f} "
+                  f"{lat['p50'] or 0:>8.1f} {lat['p99'] or 0:>8.1f} {r['peak_queue_depth'] or 0:>6} "
+                  f"{r['peak_threads'] or '-':>8} {r['peak_rss_mb'] or '-':>7}  "
+                  + " ".join(f"{c}:{n}" for c, n in r["codes"].items()))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"meta": _meta(args), "results": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,267 @@
+"""Replay WAV files through ButlerBox's real wake loop and recorder, offline.
+
+listen_loop and record_audio_after_wake run unchanged on an injected mic: WavStream
+serves the file through PyAudio's ``read()`` interface (faster than real time unless
+--realtime) and ScriptedWake stands in for Porcupine, firing at labelled offsets.
+No microphone, Picovoice key, sound device or Windows console is needed, so it runs
+on headless Linux in CI.
+
+Files must be 16-bit PCM at 16 kHz (Porcupine's rate); stereo is mixed down.
+Labels are JSON, by default next to the WAV as <name>.labels.json:
+
+    {"wakes": [1.0, 14.2], "speech_end": [6.8, 19.5]}
+
+``wakes`` are the seconds where each wake word ends; ``speech_end`` (optional) is where
+the utterance after each wake ends and scores endpointing: the recorder should stop
+``silence_duration_seconds`` after it, so the error is (stop - silence) - speech_end.
+
+Per file it reports audio seconds, speed (x real time), frames read per second,
+recordings, bytes written, CPU ms per audio second and the endpoint errors.
+
+    python tools/replay_audio.py --synth            # generated sample, no fixtures needed
+    python tools/replay_audio.py take1.wav take2.wav --config config.yaml
+    python tools/replay_audio.py take1.wav --labels take1.json --json replay.json
+"""
+import argparse
+import array
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import wave
+
+import yaml
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import main as butlerbox  # noqa: E402
+
+FRAME_LENGTH = 512
+SAMPLE_RATE = 16000
+
+
+class WavStream:
+    """PyAudio input stream stand-in over a WAV file. Past the end it serves silence
+    (so a recording in progress can still end on silence) and stops listen_loop."""
+
+    def __init__(self, path, realtime=False):
+        with wave.open(path, "rb") as wf:
+            if wf.getsampwidth() != 2:
+                raise SystemExit(f"{path}: expected 16-bit PCM, got {wf.getsampwidth() * 8}-bit")
+            if wf.getframerate() != SAMPLE_RATE:
+                raise SystemExit(f"{path}: expected {SAMPLE_RATE} Hz, got {wf.getframerate()} Hz")
+            channels = wf.getnchannels()
+            raw = wf.readframes(wf.getnframes())
+        samples = array.array("h", raw)
+        if channels > 1:
+            samples = array.array("h", (sum(samples[i:i + channels]) // channels
+                                        for i in range(0, len(samples), channels)))
+        self._pcm = samples.tobytes()
+        self.total_samples = len(samples)
+        self.position = 0  # samples served so far
+        self.frames_read = 0
+        self.realtime = realtime
+        self._started = None
+
+    @property
+    def seconds(self):
+        return self.position / SAMPLE_RATE
+
+    def read(self, num_frames, exception_on_overflow=True):
+        if self._started is None:
+            self._started = time.monotonic()
+        start = self.position * 2
+        chunk = self._pcm[start:start + num_frames * 2]
+        if len(chunk) < num_frames * 2:
+            chunk += b"\x00" * (num_frames * 2 - len(chunk))
+            butlerbox.listen_stop_event.set()
+        self.position += num_frames
+        self.frames_read += 1
+        if self.realtime:
+            ahead = self.seconds - (time.monotonic() - self._started)
+            if ahead > 0:
+                time.sleep(ahead)
+        return chunk
+
+    def close(self):
+        pass
+
+
+class ScriptedWake:
+    """Porcupine stand-in: detects the wake word when the stream passes each scripted
+    offset. Offsets that go by while a recording is running are counted as missed."""
+    frame_length = FRAME_LENGTH
+    sample_rate = SAMPLE_RATE
+
+    def __init__(self, stream, offsets):
+        self.stream = stream
+        self.pending = sorted(offsets)
+        self.fired = []   # (labelled offset, stream seconds at detection)
+        self.missed = []
+
+    def process(self, pcm):
+        pos = self.stream.seconds
+        late = 2 * FRAME_LENGTH / SAMPLE_RATE
+        while self.pending and pos - self.pending[0] > late:
+            self.missed.append(self.pending.pop(0))
+        if self.pending and pos >= self.pending[0]:
+            self.fired.append((self.pending.pop(0), pos))
+            return 0
+        return -1
+
+    def delete(self):
+        pass
+
+
+class _NullPyAudio:
+    def terminate(self):
+        pass
+
+
+def synth_sample(path):
+    """Write a labelled 16 s test take: a noise floor under the silence threshold and
+    two louder 'utterances' (the second with a short pause inside). Returns the labels."""
+    rng = random.Random(7)
+    bursts = [(1.2, 4.0), (8.2, 9.0), (9.4, 10.5)]
+    samples = array.array("h")
+    for i in range(16 * SAMPLE_RATE):
+        t = i / SAMPLE_RATE
+        loud = any(a <= t < b for a, b in bursts)
+        samples.append(rng.randint(-3000, 3000) if loud else rng.randint(-120, 120))
+    with wave.open(path, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(SAMPLE_RATE)
+        wf.writeframes(samples.tobytes())
+    return {"wakes": [1.0, 8.0], "speech_end": [4.0, 10.5]}
+
+
+def replay(path, labels, base_cfg, realtime=False):
+    out_dir = tempfile.mkdtemp(prefix="butlerbox_replay_")
+    cfg_dict = dict(base_cfg)
+    cfg_dict["recording"] = {**(cfg_dict.get("recording") or {}), "output_dir": out_dir}
+    cfg_dict["audio_feedback"] = {"enabled": False}
+    cfg = butlerbox.RuntimeConfig.from_dict(cfg_dict)
+    silence = cfg.recording.silence_duration
+
+    uploads = []
+    butlerbox._start_upload = lambda audio_file, *args, **kwargs: uploads.append(audio_file)
+    butlerbox.listen_stop_event.clear()
+    butlerbox.event_bus.configure(256, 4)
+    sub = butlerbox.event_bus.subscribe()
+
+    stream = WavStream(path, realtime)
+    wake = ScriptedWake(stream, labels.get("wakes", []))
+    mic = {"porcupine": wake, "pa": _NullPyAudio(), "stream": stream,
+           "open_input": lambda idx: stream, "keyword_name": "replay"}
+    wall0, cpu0 = time.perf_counter(), time.process_time()
+    try:
+        butlerbox.listen_loop(cfg, mic)
+    finally:
+        wall, cpu = time.perf_counter() - wall0, time.process_time() - cpu0
+        butlerbox.event_bus.unsubscribe(sub)
+    stops = []
+    while not sub.queue.empty():
+        ev = sub.queue.get_nowait()
+        if ev["type"] == "recording_stopped":
+            stops.append(ev)
+
+    recordings = []
+    speech_end = labels.get("speech_end") or []
+    for i, ((label, detected), stop) in enumerate(zip(wake.fired, stops)):
+        stop_at = detected + stop["seconds"]
+        rec = {"wake_label": label, "wake_at": round(detected, 3), "stop_at": round(stop_at, 3),
+               "reason": stop["reason"], "aborted": stop["aborted"]}
+        if i < len(speech_end):
+            rec["endpoint_error_ms"] = round((stop_at - silence - speech_end[i]) * 1000, 1)
+        recordings.append(rec)
+    written = sum(os.path.getsize(p) for p in uploads if os.path.exists(p))
+    shutil.rmtree(out_dir, ignore_errors=True)
+
+    audio_s = stream.seconds
+    errors = [abs(r["endpoint_error_ms"]) for r in recordings if "endpoint_error_ms" in r]
+    return {
+        "file": path,
+        "audio_seconds": round(audio_s, 3),
+        "wall_seconds": round(wall, 3),
+        "speed_x_realtime": round(audio_s / wall, 1) if wall > 0 else None,
+        "frames_per_second": round(stream.frames_read / wall, 1) if wall > 0 else None,
+        "recordings": recordings,
+        "wakes_missed": wake.missed,
+        "bytes_written": written,
+        "cpu_ms_per_audio_second": round(cpu * 1000 / audio_s, 3) if audio_s else None,
+        "max_abs_endpoint_error_ms": max(errors) if errors else None,
+    }
+
+
+def _load_labels(wav_path, labels_path):
+    path = labels_path or os.path.splitext(wav_path)[0] + ".labels.json"
+    if not os.path.exists(path):
+        raise SystemExit(f"{wav_path}: no labels (expected {path}, or pass --labels)")
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("wavs", nargs="*", help="16-bit 16 kHz WAV files")
+    ap.add_argument("--labels", help="labels JSON (single WAV only); default <wav>.labels.json")
+    ap.add_argument("--synth", action="store_true", help="replay a generated, labelled sample")
+    ap.add_argument("--config", help="config.yaml for recording.* settings (default: built-in defaults)")
+    ap.add_argument("--silence", type=float, help="override recording.silence_duration_seconds")
+    ap.add_argument("--realtime", action="store_true", help="pace reads at the audio rate like a real mic")
+    ap.add_argument("--verbose", action="store_true", help="show ButlerBox's log lines")
+    ap.add_argument("--json", help="also write results to this file")
+    args = ap.parse_args(argv)
+    if not args.wavs and not args.synth:
+        ap.error("give WAV files or --synth")
+    if args.labels and len(args.wavs) > 1:
+        ap.error("--labels only works with a single WAV")
+
+    base_cfg = {}
+    if args.config:
+        with open(args.config, "r", encoding="utf-8") as f:
+            base_cfg = yaml.safe_load(f) or {}
+    if args.silence is not None or (args.synth and not args.config):
+        base_cfg["recording"] = {**(base_cfg.get("recording") or {}),
+                                 "silence_duration_seconds": args.silence if args.silence is not None else 1.5}
+    base_cfg["tracing"] = {"enabled": False}
+    butlerbox.tracer.configure(base_cfg["tracing"])
+    butlerbox.ui_started = not args.verbose  # keep log() from echoing to stdout
+
+    runs = [(wav, _load_labels(wav, args.labels)) for wav in args.wavs]
+    tmp = None
+    if args.synth:
+        tmp = tempfile.mkdtemp(prefix="butlerbox_synth_")
+        wav = os.path.join(tmp, "synth.wav")
+        runs.append((wav, synth_sample(wav)))
+
+    results = []
+    try:
+        for wav, labels in runs:
+            r = replay(wav, labels, base_cfg, args.realtime)
+            results.append(r)
+            print(f"{os.path.basename(wav)}: {r['audio_seconds']:.1f}s audio in {r['wall_seconds']:.2f}s "
+                  f"({r['speed_x_realtime']}x real time, {r['frames_per_second']:.0f} frames/s), "
+                  f"{len(r['recordings'])} recording(s), {r['bytes_written']} bytes written, "
+                  f"CPU {r['cpu_ms_per_audio_second']:.2f} ms per audio second")
+            for rec in r["recordings"]:
+                err = rec.get("endpoint_error_ms")
+                print(f"  wake {rec['wake_label']:.2f}s -> stop {rec['stop_at']:.2f}s ({rec['reason']})"
+                      + (f", endpoint error {err:+.0f} ms" if err is not None else ""))
+            if r["wakes_missed"]:
+                print(f"  missed wakes (during a recording): {r['wakes_missed']}")
+    finally:
+        if tmp:
+            shutil.rmtree(tmp, ignore_errors=True)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
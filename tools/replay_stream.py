@@ -0,0 +1,68 @@
+"""Replay a recorded LLM reply stream against the ButlerBox streaming endpoint.
+
+The recording is NDJSON, one delta per line: {"delay_ms": 40, "text": " next words"}.
+Each delta is sent after its delay on a single chunked POST, the same way an
+upstream agent forwards tokens as they are generated.
+
+    python tools/replay_stream.py tools/samples/llm_reply.ndjson
+    python tools/replay_stream.py reply.ndjson --url http://box:5000/response/stream --speed 2
+    python tools/replay_stream.py reply.ndjson --raw   # send plain text deltas instead of NDJSON
+"""
+import argparse
+import json
+import sys
+import time
+
+import requests
+
+
+def load_recording(path):
+    events = []
+    with open(path, "r", encoding="utf-8") as f:
+        for lineno, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                obj = json.loads(line)
+            except ValueError as e:
+                raise SystemExit(f"{path}:{lineno}: invalid JSON ({e})")
+            events.append((float(obj.get("delay_ms", 0)) / 1000.0, str(obj.get("text", ""))))
+    return events
+
+
+def _body(events, speed, raw):
+    for delay, text in events:
+        if delay > 0 and speed > 0:
+            time.sleep(delay / speed)
+        if raw:
+            yield text.encode("utf-8")
+        else:
+            yield (json.dumps({"text": text}, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("recording", help="NDJSON file with delay_ms/text deltas")
+    parser.add_argument("--url", default="http://127.0.0.1:5000/response/stream")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed factor (0 = no delays)")
+    parser.add_argument("--raw", action="store_true", help="send text/plain deltas instead of NDJSON")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args(argv)
+
+    events = load_recording(args.recording)
+    ctype = "text/plain; charset=utf-8" if args.raw else "application/x-ndjson"
+    started = time.monotonic()
+    r = requests.post(args.url, data=_body(events, args.speed, args.raw),
+                      headers={"Content-Type": ctype}, timeout=args.timeout)
+    elapsed = time.monotonic() - started
+    print(f"{len(events)} deltas replayed in {elapsed:.2f}s -> HTTP {r.status_code}")
+    try:
+        print(json.dumps(r.json(), indent=2))
+    except ValueError:
+        print(r.text[:400])
+    return 0 if r.status_code == 200 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+"""Scriptable webhook stub server for exercising ButlerBox's delivery paths offline.
+
+Each path has a rule (JSON); unknown paths answer 200 immediately:
+
+    {
+      "latency_ms": {"dist": "lognormal", "median": 80, "sigma": 0.6},   # or fixed / uniform
+      "status": [[200, 0.8], [503, 0.2]],   # weighted choice per request
+      "retry_after": 1,                     # Retry-After header on 429/503 answers
+      "drop": 0.05,                         # share of requests whose connection is closed unanswered
+      "fail_first": 2,                      # the first N requests on this path answer 500
+      "slow_body_ms": 300                   # trickle the response body over this long
+    }
+
+latency_ms is one of {"dist": "fixed", "ms": 50}, {"dist": "uniform", "min": 10, "max": 90}
+or {"dist": "lognormal", "median": 80, "sigma": 0.6}.
+
+Built-in scenarios (see SCENARIOS) list the webhook paths to use in order, so the same
+names drive tools/bench_webhooks.py. Standalone:
+
+    python tools/webhook_stub.py --scenario flaky --port 8099
+    python tools/webhook_stub.py --rules my_rules.json --port 8099
+"""
+import argparse
+import json
+import random
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SCENARIOS = {
+    "ok": {
+        "targets": ["/primary"],
+        "rules": {"/primary": {"latency_ms": {"dist": "fixed", "ms": 20}}},
+    },
+    "slow": {
+        "targets": ["/primary"],
+        "rules": {"/primary": {"latency_ms": {"dist": "lognormal", "median": 150, "sigma": 0.6}}},
+    },
+    "flaky": {
+        "targets": ["/primary"],
+        "rules": {"/primary": {"latency_ms": {"dist": "uniform", "min": 10, "max": 60},
+                               "status": [[200, 0.65], [503, 0.3], [429, 0.05]],
+                               "retry_after": 1, "drop": 0.05}},
+    },
+    "failover": {
+        "targets": ["/primary", "/secondary"],
+        "rules": {"/primary": {"latency_ms": {"dist": "fixed", "ms": 30}, "status": [[500, 1.0]]},
+                  "/secondary": {"latency_ms": {"dist": "fixed", "ms": 20}}},
+    },
+    "slow_body": {
+        "targets": ["/primary"],
+        "rules": {"/primary": {"latency_ms": {"dist": "fixed", "ms": 10}, "slow_body_ms": 300}},
+    },
+}
+
+
+def _latency(spec, rng):
+    if not spec:
+        return 0.0
+    dist = spec.get("dist", "fixed")
+    if dist == "uniform":
+        ms = rng.uniform(float(spec.get("min", 0)), float(spec.get("max", 0)))
+    elif dist == "lognormal":
+        ms = rng.lognormvariate(0.0, float(spec.get("sigma", 0.5))) * float(spec.get("median", 50))
+    else:
+        ms = float(spec.get("ms", 0))
+    return max(0.0, ms) / 1000.0
+
+
+def _status(spec, rng):
+    if not spec:
+        return 200
+    codes = [int(c) for c, _w in spec]
+    weights = [float(w) for _c, w in spec]
+    return rng.choices(codes, weights)[0]
+
+
+class StubServer:
+    """The stub on 127.0.0.1:<port> (0 = any free port), served from a background thread.
+    ``counts`` holds requests per path and per (path, outcome)."""
+
+    def __init__(self, rules, port=0, seed=None):
+        self.rules = rules
+        self.counts = {}
+        self._lock = threading.Lock()
+        self._rng = random.Random(seed)
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self._httpd.daemon_threads = True
+        self.port = self._httpd.server_address[1]
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.port}"
+
+    def _count(self, *keys):
+        with self._lock:
+            for key in keys:
+                self.counts[key] = self.counts.get(key, 0) + 1
+
+    def _decide(self, path):
+        rule = self.rules.get(path, {})
+        with self._lock:
+            seen = self.counts.get(path, 0)
+            self.counts[path] = seen + 1
+            latency = _latency(rule.get("latency_ms"), self._rng)
+            drop = self._rng.random() < float(rule.get("drop", 0))
+            code = 500 if seen < int(rule.get("fail_first", 0)) else _status(rule.get("status"), self._rng)
+        return rule, latency, drop, code
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                path = self.path.split("?", 1)[0]
+                rule, latency, drop, code = stub._decide(path)
+                if latency:
+                    time.sleep(latency)
+                if drop:
+                    stub._count((path, "dropped"))
+                    self.close_connection = True
+                    try:
+                        self.connection.shutdown(socket.SHUT_RDWR)
+                    except OSError:
+                        pass
+                    return
+                stub._count((path, code))
+                body = json.dumps({"status": code}).encode()
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                if code in (429, 503) and rule.get("retry_after") is not None:
+                    self.send_header("Retry-After", str(rule["retry_after"]))
+                self.end_headers()
+                slow = float(rule.get("slow_body_ms", 0)) / 1000.0
+                if slow > 0:
+                    for i in range(len(body)):
+                        self.wfile.write(body[i:i + 1])
+                        self.wfile.flush()
+                        time.sleep(slow / len(body))
+                else:
+                    self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        threading.Thread(target=self._httpd.serve_forever, name="webhook-stub", daemon=True).start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--scenario", choices=sorted(SCENARIOS), default="ok")
+    ap.add_argument("--rules", help="JSON file mapping path -> rule (overrides --scenario)")
+    ap.add_argument("--port", type=int, default=8099)
+    ap.add_argument("--seed", type=int)
+    args = ap.parse_args(argv)
+    if args.rules:
+        with open(args.rules, "r", encoding="utf-8") as f:
+            rules = json.load(f)
+        targets = sorted(rules)
+    else:
+        rules, targets = SCENARIOS[args.scenario]["rules"], SCENARIOS[args.scenario]["targets"]
+    stub = StubServer(rules, args.port, args.seed).start()
+    print(f"Webhook stub on {stub.base_url} ({args.rules or args.scenario}); targets: "
+          + ", ".join(stub.base_url + t for t in targets))
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        stub.stop()
+        print(json.dumps({str(k): v for k, v in stub.counts.items()}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())